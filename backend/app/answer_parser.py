@@ -0,0 +1,147 @@
+"""
+SmarTest — parser comun pentru răspunsurile cu variante (strategii Problem 1, optimizări CSP)
+Pentru fiecare set de opțiuni se construiește o singură dată un trie de alias-uri pe cuvinte
+(nume complete, abrevieri, variante fără diacritice); răspunsul este parcurs o singură dată.
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Sequence
+from functools import lru_cache
+import re
+
+# ---------- normalizare ----------
+
+_DIACRITICS = str.maketrans({
+    'ă': 'a', 'â': 'a', 'î': 'i', 'ș': 's', 'ş': 's', 'ț': 't', 'ţ': 't',
+    'Ă': 'a', 'Â': 'a', 'Î': 'i', 'Ș': 's', 'Ş': 's', 'Ț': 't', 'Ţ': 't',
+})
+
+_TOKEN = re.compile(r"[a-z0-9]+|[*&]")
+
+# cuvinte ignorate la potrivirea parțială pe cuvinte
+_COMMON_WORDS = {'the', 'and', 'or', 'of', 'for', 'with', 'algorithm', 'method', 'search'}
+
+# abrevieri și variante; un grup se aplică opțiunilor al căror nume normalizat conține cheia
+KEYWORDS = {
+    "backtracking": ["backtracking", "backtrack", "bt", "backtracking de baza"],
+    "genetic": ["genetic", "genetic algorithm", "ga", "genetic algo"],
+    "simulated": ["simulated annealing", "simulated", "annealing", "sa", "simulated anneal"],
+    "greedy": ["greedy", "greedy coloring", "greedy col"],
+    "welsh": ["welsh-powell", "welsh", "powell", "welsh powell", "wp"],
+    "warnsdorff": ["warnsdorff", "warnsdorff's", "warnsdorffs", "warnsdorff heuristic"],
+    "recursive": ["recursive", "recursive backtracking", "recursive bt", "rec bt"],
+    "iterative": ["iterative deepening", "iterative", "iterative deep", "id", "ids"],
+    "a*": ["a*", "a star", "astar", "a-star", "a star search"],
+    "dynamic": ["dynamic programming", "dp", "dynamic prog", "memoization"],
+    "constraint": ["constraint satisfaction", "csp", "constraint", "constraint sat"],
+    "divide": ["divide and conquer", "divide", "divide conquer", "d&c", "d and c"],
+    "neural": ["neural network", "neural", "nn", "neural net", "deep learning"],
+    "forward": ["forward checking", "forward", "fc", "forward check", "verificare inainte"],
+    "mrv": ["mrv", "minimum remaining values", "minimum remaining", "min remaining",
+            "minimum remaining value", "valori minime ramase"],
+    "ac-3": ["ac-3", "ac3", "arc consistency", "arc consistency 3", "ac 3",
+             "arc consist", "consistenta arcului", "consistență arc"],
+}
+
+
+def normalize(text: str) -> str:
+    """Litere mici, fără diacritice"""
+    return text.lower().translate(_DIACRITICS)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(normalize(text))
+
+# ---------- tabel compilat ----------
+
+_NAME, _KEYWORD = 1, 2  # prioritatea potrivirilor: nume complet înaintea abrevierilor
+
+
+class CompiledOptions:
+    """Trie de alias-uri pentru un set de opțiuni; terminalele rețin (prioritate, indexul opțiunii)"""
+    def __init__(self, options: Tuple[str, ...]):
+        self.options = options
+        self.names = [normalize(opt) for opt in options]
+        self.trie: Dict[str, dict] = {}
+        for idx, opt in enumerate(options):
+            self._add(tokenize(opt), _NAME, idx)
+            for key, aliases in KEYWORDS.items():
+                if key in self.names[idx]:
+                    for alias in aliases:
+                        self._add(tokenize(alias), _KEYWORD, idx)
+        self.words = [
+            [w for w in re.findall(r'\b\w+\b', name) if w not in _COMMON_WORDS and len(w) >= 3]
+            for name in self.names
+        ]
+
+    def _add(self, tokens: List[str], priority: int, idx: int) -> None:
+        if not tokens:
+            return
+        node = self.trie
+        for tok in tokens:
+            node = node.setdefault(tok, {})
+        node.setdefault(None, set()).add((priority, idx))
+
+    def parse(self, answer: str) -> Optional[str]:
+        """
+        Ordinea deciziilor: numărul opțiunii (1..n) care nu face parte dintr-un alias (ex. "AC-3"),
+        apoi numele complet (sau răspunsul ca fragment de nume), apoi abrevierile, apoi
+        majoritatea cuvintelor importante. La egalitate câștigă prima opțiune din listă.
+        """
+        if not answer or not answer.strip():
+            return None
+        text = normalize(answer.strip())
+        tokens = _TOKEN.findall(text)
+
+        number = None
+        best: Optional[Tuple[int, int]] = None
+        i, n = 0, len(tokens)
+        while i < n:
+            # cea mai lungă potrivire din trie care începe la poziția i
+            node, j, end, found = self.trie, i, -1, None
+            while j < n and tokens[j] in node:
+                node = node[tokens[j]]
+                j += 1
+                if None in node:
+                    end, found = j, node[None]
+            if found is not None:
+                candidate = min(found)
+                if best is None or candidate < best:
+                    best = candidate
+                i = end
+                continue
+            if number is None and tokens[i].isdigit() and 1 <= int(tokens[i]) <= len(self.options):
+                number = int(tokens[i]) - 1
+            i += 1
+
+        if number is not None:
+            return self.options[number]
+
+        # răspuns parțial: fragment (>= 3 caractere) dintr-un nume de opțiune
+        if len(text) >= 3:
+            for idx, name in enumerate(self.names):
+                if text in name and (best is None or (_NAME, idx) < best):
+                    best = (_NAME, idx)
+                    break
+        if best is not None:
+            return self.options[best[1]]
+
+        best_match, best_score = None, 0.0
+        for idx, words in enumerate(self.words):
+            if not words:
+                continue
+            score = sum(1 for w in words if w in text) / len(words)
+            if score > best_score and score >= 0.5:
+                best_match, best_score = self.options[idx], score
+        return best_match
+
+
+@lru_cache(maxsize=1024)
+def compile_options(options: Tuple[str, ...]) -> CompiledOptions:
+    """Tabelul compilat, memoizat pe tuplul de opțiuni (aceeași întrebare notată repetat nu recompilează)"""
+    return CompiledOptions(options)
+
+
+def parse_choice(answer: str, options: Sequence[str]) -> Optional[str]:
+    """Returnează opțiunea aleasă în răspuns sau None"""
+    return compile_options(tuple(options)).parse(answer)
@@ -1,15 +1,20 @@
 """
 Simple AI-like chatbot for answering student questions based on theory JSON.
-Uses semantic similarity (if available) to retrieve relevant chunks.
+Retrieves relevant chunks with a BM25 index (app.lexical_index), re-ranked by semantic
+similarity when an embedding model is available.
 """
 
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import re
 
+import app.lexical_index as lexical_index
+import app.metrics as metrics
+import app.nlp_utils as nlp_utils
 import app.smartest_nash as nash
 import app.smartest_minmax as minmax
 from app.nlp_utils import semantic_similarity, SEMANTIC_SIMILARITY_AVAILABLE, NLP_AVAILABLE
@@ -19,6 +24,12 @@ THEORY_DATA_PATH = Path(__file__).parent.parent / "data" / "theory"
 _CACHED_DATA: Dict[str, Any] | None = None
 _CACHED_FILE: str | None = None
 _CACHED_CHUNKS: List[Dict[str, Any]] | None = None
+_CACHED_INDEX: Tuple[List[Dict[str, Any]], lexical_index.BM25Index] | None = None
+
+# "bm25": the BM25 index picks the candidates (re-ranked by embeddings when a model is loaded);
+# "scan": semantic_similarity against every chunk (previous behaviour)
+RETRIEVAL = os.environ.get("SMARTEST_CHAT_RETRIEVAL", "bm25").strip().lower()
+RERANK_CANDIDATES = 20
 _LAST_PROBLEM: Dict[str, Any] | None = None
 
 
@@ -138,6 +149,47 @@ def _get_chunks(theory_file: str) -> List[Dict[str, Any]]:
     return _CACHED_CHUNKS
 
 
+def _get_index(theory_file: str) -> lexical_index.BM25Index:
+    """BM25 index over the chunks of theory_file, rebuilt only when the chunk list changes"""
+    global _CACHED_INDEX
+    chunks = _get_chunks(theory_file)
+    if _CACHED_INDEX is None or _CACHED_INDEX[0] is not chunks:
+        _CACHED_INDEX = (chunks, lexical_index.BM25Index(chunk["text"] for chunk in chunks))
+    return _CACHED_INDEX[1]
+
+
+def _retrieve(question: str, theory_file: str, topic_id: Optional[str], max_sources: int) -> Tuple[List[Dict[str, Any]], str]:
+    """Scored chunks (best first) and the method label"""
+    chunks = _get_chunks(theory_file)
+    fallback_method = "NLP Semantic Similarity" if SEMANTIC_SIMILARITY_AVAILABLE else ("Fuzzy Matching" if NLP_AVAILABLE else "Fallback")
+    if RETRIEVAL == "scan":
+        candidates = [c for c in chunks if c.get("topic_id") == topic_id] if topic_id else chunks
+        method = fallback_method
+    else:
+        allowed = {i for i, c in enumerate(chunks) if c.get("topic_id") == topic_id} if topic_id else None
+        if nlp_utils.get_semantic_model() is None:
+            # lexical only: BM25 scores are the final scores
+            hits = _get_index(theory_file).search(question, max_sources, allowed)
+            return [{**chunks[doc], "score": float(score)} for doc, score in hits], "BM25 Lexical Retrieval"
+        # BM25 narrows the candidates, embeddings re-rank them; without any lexical overlap
+        # (a paraphrase) every chunk is re-ranked as before
+        hits = _get_index(theory_file).search(question, RERANK_CANDIDATES, allowed)
+        if hits:
+            candidates = [chunks[doc] for doc, _ in hits]
+        else:
+            candidates = [chunks[i] for i in sorted(allowed)] if allowed is not None else chunks
+        method = "NLP Semantic Similarity"
+
+    scored: List[Dict[str, Any]] = []
+    metrics.observe("smartest_chatbot_chunks_scored", len(candidates), metrics.SIZE_BUCKETS)
+    with metrics.span("chunk_scoring"):
+        for chunk in candidates:
+            score = semantic_similarity(question, chunk["text"])
+            scored.append({**chunk, "score": float(score)})
+    scored.sort(key=lambda c: c["score"], reverse=True)
+    return scored, method
+
+
 def _parse_nash_matrix(text: str) -> Optional[Dict[str, Any]]:
     pairs = re.findall(r"\(\s*([-+]?\d+)\s*,\s*([-+]?\d+)\s*\)", text)
     if not pairs:
@@ -512,21 +564,10 @@ def answer_question(question: str, topic_id: Optional[str] = None, theory_file:
                     "method": "Rule-based"
                 }
 
-    chunks = _get_chunks(theory_file)
-    if topic_id:
-        chunks = [c for c in chunks if c.get("topic_id") == topic_id]
-
-    scored: List[Dict[str, Any]] = []
-    for chunk in chunks:
-        score = semantic_similarity(question, chunk["text"])
-        scored.append({**chunk, "score": float(score)})
-
-    scored.sort(key=lambda c: c["score"], reverse=True)
+    scored, method = _retrieve(question, theory_file, topic_id, max_sources)
     top = scored[:max_sources]
     best_score = top[0]["score"] if top else 0.0
 
-    method = "NLP Semantic Similarity" if SEMANTIC_SIMILARITY_AVAILABLE else ("Fuzzy Matching" if NLP_AVAILABLE else "Fallback")
-
     if best_score < 0.35:
         suggestions = []
         for item in top:
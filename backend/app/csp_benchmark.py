@@ -0,0 +1,270 @@
+"""
+SmarTest — benchmark pentru optimizările CSP
+Generează familii de instanțe (simple, graph_coloring, sudoku) pe mai multe dimensiuni și densități,
+rulează fiecare tehnică din csp_solver și măsoară noduri, verificări, memorie de vârf și timp.
+Verifică și recomandarea generatorului (smartest_csp.measure_search_effort, cu bugetul lui mai mic)
+față de tehnica cea mai bună măsurată aici; --check eșuează dacă acordul scade sub prag.
+
+Rulare (din backend/):
+    python -m app.csp_benchmark --out benchmark_results
+    python -m app.csp_benchmark --write-thresholds data/benchmarks/csp_thresholds.json
+    python -m app.csp_benchmark --check data/benchmarks/csp_thresholds.json
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any, Iterator
+from pathlib import Path
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+import app.csp_solver as solver
+import app.graph_coloring as graph_coloring
+import app.sudoku as sudoku
+from app.smartest_csp import CSP_PROBLEMS, SIMPLE_OPERATORS, measure_search_effort
+
+DEFAULT_THRESHOLDS = Path(__file__).parent.parent / "data" / "benchmarks" / "csp_thresholds.json"
+
+BENCH_MAX_NODES = 50_000
+
+# toleranțe pentru regresii: noduri/verificări sunt deterministe, timpul depinde de mașină
+COUNT_TOLERANCE = 1.10
+TIME_TOLERANCE = 3.0
+TIME_FLOOR_MS = 5.0
+# acordul recomandării cu măsurătoarea poate scădea cu cel mult atât (fracție din instanțe) față de prag
+AGREEMENT_SLACK = 0.1
+
+FAMILIES = {
+    "simple": [
+        {"variables": v, "domain_size": 4, "ratio": r}
+        for v in (6, 10, 20, 40) for r in (1.0, 2.0, 3.0)
+    ],
+    "graph_coloring": [
+        {"vertices": n, "colors": 4, "p": p}
+        for n in (10, 30, 60, 120) for p in (0.05, 0.15, 0.3)
+    ],
+    "sudoku": [
+        {"size": s, "clue_ratio": c}
+        for s in (4, 9) for c in (0.6, 0.4)
+    ],
+}
+
+# ---------- familii de instanțe ----------
+
+def build_simple(variables: int, domain_size: int, ratio: float, rng: random.Random) -> Dict[str, Any]:
+    """CSP simplu: constrângeri binare aleatoare cu operatorii generatorului, ratio = constrângeri / variabile"""
+    var_names = [f"X{i+1}" for i in range(variables)]
+    domains = {v: list(range(1, domain_size + 1)) for v in var_names}
+    constraints = [(*rng.sample(var_names, 2), rng.choice(SIMPLE_OPERATORS))
+                   for _ in range(int(round(variables * ratio)))]
+    return {"variables": var_names, "domains": domains, "constraints": constraints}
+
+
+def build_graph_coloring(vertices: int, colors: int, p: float, rng: random.Random) -> Dict[str, Any]:
+    """Graph coloring pe un graf G(n, p)"""
+    var_names = [f"V{i+1}" for i in range(vertices)]
+    domains = {v: list(range(1, colors + 1)) for v in var_names}
+    edges = [(var_names[i], var_names[j]) for i, j in graph_coloring.gnp_graph(vertices, p, rng).edges()]
+    return {"variables": var_names, "domains": domains, "constraints": [(a, b, "!=") for a, b in edges]}
+
+
+def build_sudoku(size: int, clue_ratio: float, rng: random.Random) -> Dict[str, Any]:
+    """Sudoku size x size cu soluție unică; generarea se oprește la clue_ratio din celule (sau la minim)"""
+    puzzle = sudoku.generate_puzzle(size=size, target_clues=int(round(size * size * clue_ratio)), rng=rng)
+    return sudoku.to_csp(puzzle["puzzle"])
+
+
+_BUILDERS = {
+    "simple": build_simple,
+    "graph_coloring": build_graph_coloring,
+    "sudoku": build_sudoku,
+}
+
+
+def _config_label(params: Dict[str, Any]) -> str:
+    return ",".join(f"{k}={v}" for k, v in params.items())
+
+# ---------- rulare ----------
+
+def _measure(csp: solver.CompiledCSP, technique: str, max_nodes: int, memory: bool) -> Dict[str, Any]:
+    result = solver.solve(csp, technique, max_nodes=max_nodes)
+    peak_kb = None
+    if memory:
+        # a doua rulare sub tracemalloc, ca timpul din prima să nu fie afectat
+        tracemalloc.start()
+        solver.solve(csp, technique, max_nodes=max_nodes)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kb = round(peak / 1024, 1)
+    return {
+        "complete": result["complete"],
+        "satisfiable": result["satisfiable"],
+        "nodes": result["nodes"],
+        "checks": result["checks"],
+        "time_ms": result["time_ms"],
+        "peak_kb": peak_kb,
+    }
+
+
+def iter_benchmark(families: Optional[List[str]] = None, repeats: int = 3, seed: int = 0,
+                   max_nodes: int = BENCH_MAX_NODES, memory: bool = True) -> Iterator[Dict[str, Any]]:
+    """Generează câte un rând de rezultat pentru fiecare (familie, configurație, instanță, tehnică)"""
+    for family in families or list(FAMILIES):
+        techniques = CSP_PROBLEMS[family]["optimizations"]
+        for params in FAMILIES[family]:
+            label = _config_label(params)
+            for rep in range(repeats):
+                rng = random.Random(f"{seed}:{family}:{label}:{rep}")
+                inst = _BUILDERS[family](**params, rng=rng)
+                csp = solver.compile_csp(inst["variables"], inst["domains"], inst["constraints"])
+                report = {t: _measure(csp, t, max_nodes, memory) for t in techniques}
+                best = solver.recommend_technique(report)
+                # ce ar pune generatorul în correct_optimization pentru aceeași instanță
+                recommended, _ = measure_search_effort(inst["variables"], inst["domains"], inst["constraints"])
+                for t, r in report.items():
+                    yield {
+                        "family": family,
+                        "config": label,
+                        "instance": rep,
+                        "variables": len(inst["variables"]),
+                        "constraints": len(inst["constraints"]),
+                        "technique": t,
+                        **r,
+                        "best": best,
+                        "recommended": recommended,
+                    }
+
+
+def summarize(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Agregă rezultatele: medii per (familie, configurație, tehnică) și acordul recomandării cu măsurătorile"""
+    groups: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault((row["family"], row["config"], row["technique"]), []).append(row)
+
+    per_config = []
+    for (family, config, technique), items in groups.items():
+        n = len(items)
+        per_config.append({
+            "family": family,
+            "config": config,
+            "technique": technique,
+            "instances": n,
+            "completed": sum(1 for r in items if r["complete"]),
+            "nodes": round(sum(r["nodes"] for r in items) / n, 1),
+            "checks": round(sum(r["checks"] for r in items) / n, 1),
+            "time_ms": round(sum(r["time_ms"] for r in items) / n, 3),
+            "peak_kb": max((r["peak_kb"] or 0) for r in items),
+            "wins": sum(1 for r in items if r["best"] == technique),
+        })
+
+    agreement: Dict[str, Dict[str, int]] = {}
+    seen = set()
+    for row in rows:
+        key = (row["family"], row["config"], row["instance"])
+        if key in seen:
+            continue
+        seen.add(key)
+        stats = agreement.setdefault(row["family"], {"instances": 0, "matches": 0})
+        stats["instances"] += 1
+        stats["matches"] += int(row["recommended"] == row["best"])
+    return {"per_config": per_config, "recommendation_agreement": agreement}
+
+# ---------- rapoarte și praguri ----------
+
+def write_reports(rows: List[Dict[str, Any]], summary: Dict[str, Any], out_dir: Path) -> None:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with open(out_dir / "csp_benchmark.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(out_dir / "csp_benchmark.json", "w", encoding="utf-8") as f:
+        json.dump({"rows": rows, "summary": summary}, f, indent=2, ensure_ascii=False)
+
+
+def build_thresholds(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Praguri de regresie din rezultatele curente (noduri/verificări exacte + toleranță, timp generos)
+    și acordul minim al recomandării generatorului, per familie
+    """
+    thresholds = {}
+    for item in summary["per_config"]:
+        key = f"{item['family']}|{item['config']}|{item['technique']}"
+        thresholds[key] = {
+            "max_nodes": round(item["nodes"] * COUNT_TOLERANCE, 1),
+            "max_checks": round(item["checks"] * COUNT_TOLERANCE, 1),
+            "max_time_ms": round(max(item["time_ms"], TIME_FLOOR_MS) * TIME_TOLERANCE, 3),
+        }
+    min_agreement = {
+        family: round(max(stats["matches"] / stats["instances"] - AGREEMENT_SLACK, 0.0), 3)
+        for family, stats in summary["recommendation_agreement"].items()
+    }
+    return {"max_nodes_budget": BENCH_MAX_NODES, "thresholds": thresholds, "min_agreement": min_agreement}
+
+
+def check_thresholds(summary: Dict[str, Any], thresholds: Dict[str, Any]) -> List[str]:
+    """Returnează lista de regresii față de fișierul de praguri"""
+    failures = []
+    limits = thresholds["thresholds"]
+    for item in summary["per_config"]:
+        key = f"{item['family']}|{item['config']}|{item['technique']}"
+        limit = limits.get(key)
+        if limit is None:
+            continue
+        for metric, bound in (("nodes", "max_nodes"), ("checks", "max_checks"), ("time_ms", "max_time_ms")):
+            if item[metric] > limit[bound]:
+                failures.append(f"{key}: {metric}={item[metric]} > {limit[bound]}")
+    for family, minimum in thresholds.get("min_agreement", {}).items():
+        stats = summary["recommendation_agreement"].get(family)
+        if stats and stats["matches"] / stats["instances"] < minimum:
+            failures.append(f"{family}: recomandarea corespunde pe {stats['matches']}/{stats['instances']} "
+                            f"instanțe < {minimum:.0%}")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pentru optimizările CSP")
+    parser.add_argument("--families", nargs="*", choices=list(FAMILIES), default=None)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-nodes", type=int, default=BENCH_MAX_NODES)
+    parser.add_argument("--no-memory", action="store_true", help="nu măsura memoria de vârf (mai rapid)")
+    parser.add_argument("--out", type=Path, default=None, help="director pentru csp_benchmark.csv/.json")
+    parser.add_argument("--write-thresholds", type=Path, default=None)
+    parser.add_argument("--check", type=Path, default=None, help="fișier de praguri pentru detectarea regresiilor")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows = list(iter_benchmark(args.families, args.repeats, args.seed, args.max_nodes, not args.no_memory))
+    summary = summarize(rows)
+    print(f"{len(rows)} rulări în {time.perf_counter() - start:.1f}s")
+
+    for family, stats in summary["recommendation_agreement"].items():
+        print(f"Recomandarea generatorului pentru {family}: {stats['matches']}/{stats['instances']} "
+              f"instanțe corespund măsurătorii")
+
+    if args.out:
+        write_reports(rows, summary, args.out)
+        print(f"Rapoarte scrise în {args.out}")
+    if args.write_thresholds:
+        args.write_thresholds.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.write_thresholds, "w", encoding="utf-8") as f:
+            json.dump(build_thresholds(summary), f, indent=2)
+        print(f"Praguri scrise în {args.write_thresholds}")
+    if args.check:
+        with open(args.check, "r", encoding="utf-8") as f:
+            failures = check_thresholds(summary, json.load(f))
+        if failures:
+            print("Regresii detectate:")
+            for line in failures:
+                print(f"  - {line}")
+            return 1
+        print("Fără regresii față de praguri.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
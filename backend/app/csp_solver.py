@@ -0,0 +1,368 @@
+"""
+SmarTest — motor CSP: Backtracking, Forward Checking, MRV și AC-3
+Domeniile sunt bitset-uri (int), vecinii și tabelele de suport sunt precalculate
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any, Sequence
+from collections import deque
+import time
+
+TECHNIQUES = ["Backtracking", "Forward Checking", "MRV", "AC-3"]
+
+DEFAULT_MAX_NODES = 200_000
+# verificările de constrângeri nu sunt limitate de noduri: un nod poate costa O(n·d) verificări (MAC și mai mult)
+DEFAULT_MAX_CHECKS = 5_000_000
+
+_OPERATORS = {
+    "!=": lambda a, b: a != b,
+    "==": lambda a, b: a == b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+# ---------- compilare instanță ----------
+
+class CompiledCSP:
+    """
+    Instanță CSP binară compilată pentru căutare rapidă.
+    support[i][j][a] = bitmask-ul valorilor lui j compatibile cu valoarea a (index) a lui i.
+    conflicts[i][j] = cel mai mare număr de valori ale lui j incompatibile cu o valoare a lui i
+    (1 pentru '!='): cât timp domeniul lui j e mai mare, revizuirea arcului (i, j) nu poate elimina nimic.
+    Tabelele depind doar de domenii și operator, deci se construiesc o dată per combinație
+    (la graph coloring toate muchiile împart același tabel).
+    """
+    def __init__(self, variables: Sequence[str], domains: Dict[str, Sequence[Any]],
+                 constraints: Sequence[Sequence[Any]]):
+        self.variables = list(variables)
+        self.index = {v: i for i, v in enumerate(self.variables)}
+        self.values = [list(domains[v]) for v in self.variables]
+        self.initial = [(1 << len(vals)) - 1 for vals in self.values]
+        n = len(self.variables)
+        self.support: List[Dict[int, List[int]]] = [dict() for _ in range(n)]
+        keys = [tuple(vals) for vals in self.values]
+        tables: Dict[Tuple[Any, ...], Tuple[List[int], List[int]]] = {}
+
+        for c in constraints:
+            v1, v2 = c[0], c[1]
+            op = c[2] if len(c) > 2 else "!="
+            if op not in _OPERATORS:
+                raise ValueError(f"Unsupported constraint operator: {op}")
+            rel = _OPERATORS[op]
+            i, j = self.index[v1], self.index[v2]
+            if i == j:
+                # constrângere unară: restrânge domeniul direct
+                mask = 0
+                for a, x in enumerate(self.values[i]):
+                    if rel(x, x):
+                        mask |= 1 << a
+                self.initial[i] &= mask
+                continue
+            key = (keys[i], keys[j], op)
+            if key not in tables:
+                tables[key] = ([self._mask(self.values[j], lambda y, x=x: rel(x, y)) for x in self.values[i]],
+                               [self._mask(self.values[i], lambda x, y=y: rel(x, y)) for y in self.values[j]])
+            fwd, bwd = tables[key]
+            self._add_support(i, j, fwd)
+            self._add_support(j, i, bwd)
+
+        self.neighbors: List[List[int]] = [sorted(self.support[i]) for i in range(n)]
+        counted: Dict[Tuple[int, int], int] = {}
+        self.conflicts: List[Dict[int, int]] = [dict() for _ in range(n)]
+        for i in range(n):
+            for j, table in self.support[i].items():
+                key = (id(table), self.initial[j])
+                if key not in counted:
+                    counted[key] = max(((self.initial[j] & ~mask).bit_count() for mask in table), default=0)
+                self.conflicts[i][j] = counted[key]
+        self.degree = [len(nb) for nb in self.neighbors]
+
+    @staticmethod
+    def _mask(values: List[Any], pred) -> int:
+        mask = 0
+        for b, y in enumerate(values):
+            if pred(y):
+                mask |= 1 << b
+        return mask
+
+    def _add_support(self, i: int, j: int, table: List[int]) -> None:
+        # tabelele pot fi partajate între perechi: nu se modifică pe loc
+        existing = self.support[i].get(j)
+        if existing is None:
+            self.support[i][j] = table
+        else:
+            # mai multe constrângeri pe aceeași pereche: intersecție
+            self.support[i][j] = [a & b for a, b in zip(existing, table)]
+
+
+def compile_csp(variables: Sequence[str], domains: Dict[str, Sequence[Any]],
+                constraints: Sequence[Sequence[Any]]) -> CompiledCSP:
+    """Compilează variabile/domenii/constrângeri într-o instanță cu bitset-uri"""
+    return CompiledCSP(variables, domains, constraints)
+
+# ---------- căutare ----------
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+class _Search:
+    """
+    O rulare de căutare pentru o tehnică dată; numără noduri și verificări.
+    Căutarea e iterativă (stivă explicită), deci adâncimea nu depinde de limita de recursivitate.
+    """
+    def __init__(self, csp: CompiledCSP, technique: str, max_nodes: int, max_checks: int = DEFAULT_MAX_CHECKS):
+        if technique not in TECHNIQUES:
+            raise ValueError(f"Unknown technique: {technique}")
+        self.csp = csp
+        self.technique = technique
+        self.max_nodes = max_nodes
+        self.max_checks = max_checks
+        self.nodes = 0
+        self.checks = 0
+        n = len(csp.variables)
+        self.assignment = [-1] * n
+        self.domains = list(csp.initial)
+        self.trail: List[Tuple[int, int]] = []
+        # ordine statică: grad descrescător (ordinea naturală la egalitate)
+        self.order = sorted(range(n), key=lambda i: -csp.degree[i])
+
+    # --- utilitare ---
+
+    def _expand(self) -> None:
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise _BudgetExceeded()
+
+    def _check_budget(self) -> None:
+        if self.checks > self.max_checks:
+            raise _BudgetExceeded()
+
+    def _set_domain(self, i: int, mask: int) -> None:
+        self.trail.append((i, self.domains[i]))
+        self.domains[i] = mask
+
+    def _undo(self, mark: int) -> None:
+        trail, domains = self.trail, self.domains
+        while len(trail) > mark:
+            i, old = trail.pop()
+            domains[i] = old
+
+    # --- Backtracking simplu ---
+
+    def _backtrack(self) -> bool:
+        order, n = self.order, len(self.order)
+        if n == 0:
+            return True
+        csp, assignment = self.csp, self.assignment
+        remaining = [csp.initial[order[0]]]  # valorile încă neîncercate, per nivel
+        while remaining:
+            self._check_budget()
+            k = len(remaining) - 1
+            x = order[k]
+            assignment[x] = -1
+            sup_x = csp.support[x]
+            dom = remaining[k]
+            a = -1
+            while dom:
+                low = dom & -dom
+                dom ^= low
+                a = low.bit_length() - 1
+                for y in csp.neighbors[x]:
+                    b = assignment[y]
+                    if b >= 0:
+                        self.checks += 1
+                        if not (sup_x[y][a] >> b) & 1:
+                            break
+                else:
+                    break
+                a = -1
+            remaining[k] = dom
+            if a < 0:
+                remaining.pop()
+                continue
+            self._expand()
+            assignment[x] = a
+            if k + 1 == n:
+                return True
+            remaining.append(csp.initial[order[k + 1]])
+        return False
+
+    # --- Forward Checking / MRV / MAC (AC-3) ---
+
+    def _select(self, k: int) -> int:
+        if self.technique != "MRV":
+            return self.order[k]
+        best, best_key = -1, None
+        assignment, domains, degree = self.assignment, self.domains, self.csp.degree
+        for i in self.order:
+            if assignment[i] < 0:
+                key = (domains[i].bit_count(), -degree[i])
+                if best_key is None or key < best_key:
+                    best, best_key = i, key
+                    if key[0] == 1:
+                        break
+        return best
+
+    def _forward(self, x: int, a: int) -> bool:
+        csp, assignment, domains = self.csp, self.assignment, self.domains
+        sup_x = csp.support[x]
+        for y in csp.neighbors[x]:
+            if assignment[y] < 0:
+                # o verificare per valoare testată din domeniul vecinului, ca la _revise și _backtrack
+                self.checks += domains[y].bit_count()
+                nd = domains[y] & sup_x[y][a]
+                if nd != domains[y]:
+                    self._set_domain(y, nd)
+                    if nd == 0:
+                        return False
+        return True
+
+    def _revise(self, xi: int, xj: int) -> bool:
+        dj = self.domains[xj]
+        if dj.bit_count() > self.csp.conflicts[xi][xj]:
+            # fiecare valoare a lui xi păstrează un suport în dj: o singură verificare, nu una per valoare
+            self.checks += 1
+            return False
+        sup = self.csp.support[xi][xj]
+        di = self.domains[xi]
+        d = di
+        while d:
+            low = d & -d
+            d ^= low
+            self.checks += 1
+            if not sup[low.bit_length() - 1] & dj:
+                di ^= low
+        if di != self.domains[xi]:
+            self._set_domain(xi, di)
+            return True
+        return False
+
+    def _ac3(self, queue: deque) -> bool:
+        csp, assignment = self.csp, self.assignment
+        queued = set(queue)
+        while queue:
+            arc = queue.popleft()
+            queued.discard(arc)
+            xi, xj = arc
+            changed = self._revise(xi, xj)
+            self._check_budget()
+            if changed:
+                size = self.domains[xi].bit_count()
+                if size == 0:
+                    return False
+                conflicts = csp.conflicts
+                for xk in csp.neighbors[xi]:
+                    if xk != xj and assignment[xk] < 0 and (xk, xi) not in queued:
+                        if size > conflicts[xk][xi]:
+                            self.checks += 1  # arcul n-ar elimina nimic (vezi _revise); dacă xi scade, revine în coadă
+                            continue
+                        queue.append((xk, xi))
+                        queued.add((xk, xi))
+        return True
+
+    def _assign(self, x: int, a: int) -> bool:
+        """Fixează x = a și propagă: FC/MRV revizuiesc vecinii lui x, AC-3 (MAC) pornește de la arcele spre x"""
+        self.assignment[x] = a
+        self._set_domain(x, 1 << a)
+        if self.technique != "AC-3":
+            return self._forward(x, a)
+        # doar arcele (y, x): restul cozii apare numai dacă domeniul lui y chiar se micșorează
+        return self._ac3(deque((y, x) for y in self.csp.neighbors[x] if self.assignment[y] < 0))
+
+    def _propagating(self) -> bool:
+        n = len(self.order)
+        if n == 0:
+            return True
+        assignment = self.assignment
+        x = self._select(0)
+        stack = [(x, self.domains[x], len(self.trail))]  # (variabilă, valori neîncercate, marcaj în trail)
+        while stack:
+            self._check_budget()
+            x, dom, mark = stack[-1]
+            if assignment[x] >= 0:
+                # revenire: anulăm valoarea încercată anterior și propagarea ei
+                self._undo(mark)
+                assignment[x] = -1
+            if not dom:
+                stack.pop()
+                continue
+            low = dom & -dom
+            stack[-1] = (x, dom ^ low, mark)
+            self._expand()
+            if self._assign(x, low.bit_length() - 1):
+                if len(stack) == n:
+                    return True
+                y = self._select(len(stack))
+                stack.append((y, self.domains[y], len(self.trail)))
+        return False
+
+    def run(self) -> Tuple[Optional[bool], Optional[List[int]]]:
+        """Returnează (satisfiabil, atribuire) sau (None, None) dacă bugetul a fost depășit"""
+        if any(d == 0 for d in self.domains):
+            return False, None
+        try:
+            if self.technique == "Backtracking":
+                found = self._backtrack()
+            else:
+                if self.technique == "AC-3":
+                    n = len(self.domains)
+                    queue = deque((i, j) for i in range(n) for j in self.csp.neighbors[i])
+                    if not self._ac3(queue):
+                        return False, None
+                found = self._propagating()
+        except _BudgetExceeded:
+            return None, None
+        return found, (list(self.assignment) if found else None)
+
+
+def solve(csp: CompiledCSP, technique: str = "Backtracking",
+          max_nodes: int = DEFAULT_MAX_NODES, max_checks: int = DEFAULT_MAX_CHECKS) -> Dict[str, Any]:
+    """
+    Rezolvă instanța cu tehnica dată.
+    MRV folosește și Forward Checking (fără propagare domeniile nu se micșorează);
+    AC-3 rulează AC-3 la început și menține consistența arcelor după fiecare atribuire (MAC).
+    Căutarea se oprește (complete=False) după max_nodes noduri sau max_checks verificări.
+    """
+    search = _Search(csp, technique, max_nodes, max_checks)
+    start = time.perf_counter()
+    satisfiable, assignment = search.run()
+    elapsed = time.perf_counter() - start
+
+    solution = None
+    if assignment is not None:
+        solution = {csp.variables[i]: csp.values[i][a] for i, a in enumerate(assignment)}
+    return {
+        "technique": technique,
+        "complete": satisfiable is not None,
+        "satisfiable": satisfiable,
+        "solution": solution,
+        "nodes": min(search.nodes, max_nodes),
+        "checks": search.checks,
+        "time_ms": round(elapsed * 1000, 3),
+    }
+
+
+def compare_techniques(variables: Sequence[str], domains: Dict[str, Sequence[Any]],
+                       constraints: Sequence[Sequence[Any]],
+                       techniques: Sequence[str] = TECHNIQUES,
+                       max_nodes: int = DEFAULT_MAX_NODES,
+                       max_checks: int = DEFAULT_MAX_CHECKS) -> Dict[str, Dict[str, Any]]:
+    """Rulează fiecare tehnică pe aceeași instanță și returnează raportul per tehnică"""
+    csp = compile_csp(variables, domains, constraints)
+    return {t: solve(csp, t, max_nodes=max_nodes, max_checks=max_checks) for t in techniques}
+
+
+def recommend_technique(report: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Alege tehnica cu cel mai mic efort măsurat: întâi căutările terminate, apoi efortul total
+    (noduri expandate + verificări de constrângeri), apoi mai puține noduri.
+    Doar după noduri, propagarea câștigă mereu (o plătește în verificări); doar după verificări,
+    backtracking-ul simplu câștigă mereu pe instanțele ușoare.
+    Timpul nu intră în decizie, ca recomandarea să fie reproductibilă.
+    """
+    order = {t: k for k, t in enumerate(TECHNIQUES)}
+    return min(report, key=lambda t: (not report[t]["complete"], report[t]["nodes"] + report[t]["checks"],
+                                      report[t]["nodes"], order.get(t, len(order))))
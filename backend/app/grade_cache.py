@@ -0,0 +1,145 @@
+"""
+SmarTest — cache pentru rezultatele evaluării (rutele /*/grade)
+Cheia: (tipul întrebării, hash stabil al payload-ului, răspunsul normalizat). LRU mărginit, cu TTL opțional.
+Evaluarea este deterministă pentru aceeași pereche (întrebare, răspuns), deci rezultatul poate fi refolosit
+(re-evaluările din revizuirea quiz-ului, retrimiterea aceluiași răspuns).
+
+Configurare prin variabile de mediu:
+    GRADE_CACHE_SIZE  numărul maxim de intrări (implicit 4096; 0 dezactivează cache-ul)
+    GRADE_CACHE_TTL   durata de viață în secunde (implicit 3600; 0 = fără expirare)
+"""
+
+from __future__ import annotations
+from typing import Tuple, Optional, Dict, Any, Callable
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import marshal
+import os
+import re
+import threading
+import time
+import unicodedata
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_TTL_SECONDS = 3600.0
+
+_SPACES = re.compile(r"[ \t]+")
+
+# ---------- chei ----------
+
+def normalize_answer(answer: str) -> str:
+    """Forma canonică a răspunsului: NFC, fără spații la capete, spațiile orizontale comprimate.
+    Nu schimbă literele mari/mici (unele întrebări de teorie sunt case-sensitive)."""
+    return _SPACES.sub(" ", unicodedata.normalize("NFC", answer or "").strip())
+
+
+def payload_key(payload: Dict[str, Any]) -> bytes:
+    """
+    Hash al întregului payload (id-ul singur nu e unic: e un număr aleator de 6 cifre).
+    marshal e de ~5x mai rapid decât json.dumps; octeți egali implică payload-uri egale, iar o ordine
+    diferită a cheilor dă doar un miss. Tipurile ne-serializabile cu marshal trec prin json.
+    """
+    try:
+        blob = marshal.dumps(payload)
+    except ValueError:
+        blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.blake2b(blob, digest_size=16).digest()
+
+# ---------- cache ----------
+
+class GradeCache:
+    """LRU thread-safe cu expirare; valorile sunt copiate la citire, apelantul le poate modifica"""
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl if ttl else None
+        self._clock = clock
+        self._data: "OrderedDict[Tuple[str, bytes, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key: Tuple[str, bytes, str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, result = entry
+            if self.ttl is not None and self._clock() - stored_at > self.ttl:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(result)
+
+    def put(self, key: Tuple[str, bytes, str], result: Dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = (self._clock(), copy.deepcopy(result))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+_CACHE = GradeCache(max_entries=int(_env_number("GRADE_CACHE_SIZE", DEFAULT_MAX_ENTRIES)),
+                    ttl=_env_number("GRADE_CACHE_TTL", DEFAULT_TTL_SECONDS))
+
+# ---------- API ----------
+
+def cached_grade(kind: str, payload: Dict[str, Any], answer: str,
+                 grade: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+                 question_key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Evaluează prin cache: grade(answer, payload) rulează doar la prima apariție a perechii.
+    question_key: identificator deja unic al întrebării (ex. token semnat), evită hash-ul payload-ului.
+    Excepțiile nu sunt memorate.
+    """
+    if _CACHE.max_entries <= 0:
+        return grade(answer, payload)
+    key = (kind, question_key.encode("utf-8") if question_key is not None else payload_key(payload),
+           normalize_answer(answer))
+    result = _CACHE.get(key)
+    if result is None:
+        result = grade(answer, payload)
+        _CACHE.put(key, result)
+    return result
+
+
+def stats() -> Dict[str, Any]:
+    return _CACHE.stats()
+
+
+def clear() -> None:
+    _CACHE.clear()
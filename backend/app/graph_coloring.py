@@ -0,0 +1,349 @@
+"""
+SmarTest — instanțe de graph coloring: modele de grafuri + numărul cromatic
+Grafurile sunt reprezentate prin bitset-uri de adiacență (int per nod).
+Numărul cromatic este calculat cu DSATUR (margine superioară), o clică greedy (margine inferioară)
+și branch-and-bound DSATUR exact, cu buget de noduri pentru grafurile mari.
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any, Iterable, Sequence
+import math
+import random
+import sys
+
+GRAPH_MODELS = ["gnp", "planar", "planted"]
+
+# bugetul implicit al branch-and-bound scade cu n (costul unui nod e O(n)), ca să rămână interactiv
+SEARCH_WORK_BUDGET = 1_000_000
+MIN_MAX_NODES = 2_000
+
+# grafuri regenerate pentru o instanță imposibilă: un graf fără muchii se colorează cu o culoare
+INFEASIBLE_ATTEMPTS = 20
+
+
+def default_max_nodes(n: int) -> int:
+    return max(MIN_MAX_NODES, SEARCH_WORK_BUDGET // max(n, 1))
+
+# ---------- reprezentare ----------
+
+class Graph:
+    """Graf neorientat cu n noduri (0..n-1); adj[i] este bitset-ul vecinilor lui i"""
+    def __init__(self, n: int):
+        self.n = n
+        self.adj: List[int] = [0] * n
+
+    @classmethod
+    def from_edges(cls, n: int, edges: Iterable[Tuple[int, int]]) -> "Graph":
+        g = cls(n)
+        for i, j in edges:
+            g.add_edge(i, j)
+        return g
+
+    def add_edge(self, i: int, j: int) -> None:
+        if i == j:
+            return
+        self.adj[i] |= 1 << j
+        self.adj[j] |= 1 << i
+
+    def degree(self, i: int) -> int:
+        return self.adj[i].bit_count()
+
+    def edges(self) -> List[Tuple[int, int]]:
+        out = []
+        for i in range(self.n):
+            m = self.adj[i] >> (i + 1)
+            j = i + 1
+            while m:
+                if m & 1:
+                    out.append((i, j))
+                m >>= 1
+                j += 1
+        return out
+
+    def edge_count(self) -> int:
+        return sum(a.bit_count() for a in self.adj) // 2
+
+# ---------- modele de grafuri ----------
+
+def gnp_graph(n: int, p: float, rng: random.Random) -> Graph:
+    """Graf aleator Erdős–Rényi G(n, p)"""
+    g = Graph(n)
+    for i in range(n):
+        for j in range(i + 1, n):
+            if rng.random() < p:
+                g.add_edge(i, j)
+    return g
+
+
+def planar_graph(n: int, rng: random.Random, keep: float = 0.75) -> Graph:
+    """
+    Graf planar: subgraf aleator al unei grile triunghiulate (muchii dreapta, jos, diagonală),
+    cu etichetele nodurilor permutate. Numărul cromatic este cel mult 3.
+    """
+    width = max(1, math.ceil(math.sqrt(n)))
+    labels = list(range(n))
+    rng.shuffle(labels)
+    g = Graph(n)
+    for k in range(n):
+        r, c = divmod(k, width)
+        for dr, dc in ((0, 1), (1, 0), (1, 1)):
+            rr, cc = r + dr, c + dc
+            other = rr * width + cc
+            if cc < width and other < n and rng.random() < keep:
+                g.add_edge(labels[k], labels[other])
+    return g
+
+
+def planted_graph(n: int, k: int, p: float, rng: random.Random) -> Tuple[Graph, List[int]]:
+    """
+    Graf k-partit cu partiție plantată: muchii doar între grupuri diferite, cu probabilitate p.
+    Returnează graful și partiția (o colorare validă cu k culori).
+    """
+    groups = [i % k for i in range(n)]
+    rng.shuffle(groups)
+    g = Graph(n)
+    for i in range(n):
+        for j in range(i + 1, n):
+            if groups[i] != groups[j] and rng.random() < p:
+                g.add_edge(i, j)
+    return g, groups
+
+# ---------- margini și număr cromatic ----------
+
+def greedy_coloring(g: Graph, order: Optional[Sequence[int]] = None) -> List[int]:
+    """Colorare greedy (first-fit) în ordinea dată (implicit 0..n-1)"""
+    colors = [-1] * g.n
+    used = [0] * g.n  # bitmask culori vecine deja colorate
+    for v in (range(g.n) if order is None else order):
+        c = (~used[v] & (used[v] + 1)).bit_length() - 1
+        colors[v] = c
+        m = g.adj[v]
+        while m:
+            low = m & -m
+            m ^= low
+            used[low.bit_length() - 1] |= 1 << c
+    return colors
+
+
+def welsh_powell_order(g: Graph) -> List[int]:
+    """Ordinea Welsh-Powell: noduri după grad descrescător (stabil la egalitate)"""
+    return sorted(range(g.n), key=lambda v: -g.degree(v))
+
+
+def dsatur_coloring(g: Graph) -> List[int]:
+    """Colorare DSATUR: nodul cu saturația maximă (apoi gradul maxim) primește cea mai mică culoare liberă"""
+    n = g.n
+    colors = [-1] * n
+    sat = [0] * n  # bitmask culori vecine
+    degree = [g.degree(i) for i in range(n)]
+    for _ in range(n):
+        best, best_key = -1, None
+        for v in range(n):
+            if colors[v] < 0:
+                key = (sat[v].bit_count(), degree[v])
+                if best_key is None or key > best_key:
+                    best, best_key = v, key
+        free = ~sat[best] & (sat[best] + 1)
+        c = free.bit_length() - 1
+        colors[best] = c
+        m = g.adj[best]
+        while m:
+            low = m & -m
+            m ^= low
+            sat[low.bit_length() - 1] |= 1 << c
+    return colors
+
+
+def greedy_clique(g: Graph, starts: int = 16) -> List[int]:
+    """Clică găsită greedy din nodurile de grad maxim; dimensiunea ei e o margine inferioară pentru χ"""
+    order = sorted(range(g.n), key=lambda v: -g.degree(v))
+    best: List[int] = []
+    for v in order[:starts]:
+        clique = [v]
+        cand = g.adj[v]
+        while cand:
+            u_best, u_deg = -1, -1
+            m = cand
+            while m:
+                low = m & -m
+                m ^= low
+                u = low.bit_length() - 1
+                d = (g.adj[u] & cand).bit_count()
+                if d > u_deg:
+                    u_best, u_deg = u, d
+            clique.append(u_best)
+            cand &= g.adj[u_best]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+class _ExactColoring:
+    """Branch-and-bound DSATUR: încearcă să găsească o colorare cu mai puține culori decât cea curentă"""
+    def __init__(self, g: Graph, upper: List[int], lower: int, max_nodes: int):
+        self.g = g
+        self.best = list(upper)
+        self.best_k = max(upper) + 1 if upper else 0
+        self.lower = lower
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.colors = [-1] * g.n
+        self.sat_count = [[0] * (g.n + 1) for _ in range(g.n)]  # câți vecini au culoarea c
+        self.sat = [0] * g.n
+        self.degree = [g.degree(i) for i in range(g.n)]
+
+    def _assign(self, v: int, c: int) -> None:
+        self.colors[v] = c
+        m = self.g.adj[v]
+        while m:
+            low = m & -m
+            m ^= low
+            u = low.bit_length() - 1
+            self.sat_count[u][c] += 1
+            self.sat[u] |= 1 << c
+
+    def _unassign(self, v: int, c: int) -> None:
+        self.colors[v] = -1
+        m = self.g.adj[v]
+        while m:
+            low = m & -m
+            m ^= low
+            u = low.bit_length() - 1
+            self.sat_count[u][c] -= 1
+            if not self.sat_count[u][c]:
+                self.sat[u] &= ~(1 << c)
+
+    def _search(self, colored: int, used: int) -> bool:
+        if colored == self.g.n:
+            self.best = list(self.colors)
+            self.best_k = used
+            return used <= self.lower
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise _BudgetExceeded()
+        best, best_key = -1, None
+        for v in range(self.g.n):
+            if self.colors[v] < 0:
+                key = (self.sat[v].bit_count(), self.degree[v])
+                if best_key is None or key > best_key:
+                    best, best_key = v, key
+        for c in range(used + 1):
+            if c >= self.best_k - 1:
+                # o culoare nouă nu mai poate îmbunătăți colorarea curentă (best_k scade pe parcurs)
+                break
+            if self.sat[best] >> c & 1:
+                continue
+            self._assign(best, c)
+            done = self._search(colored + 1, max(used, c + 1))
+            self._unassign(best, c)
+            if done:
+                return True
+        return False
+
+    def run(self) -> bool:
+        """Returnează True dacă optimalitatea a fost demonstrată în buget"""
+        if self.best_k <= self.lower:
+            return True
+        needed = 2 * self.g.n + 200
+        if sys.getrecursionlimit() < needed:
+            sys.setrecursionlimit(needed)
+        try:
+            self._search(0, 0)
+        except _BudgetExceeded:
+            return self.best_k <= self.lower
+        return True
+
+
+def chromatic_number(g: Graph, max_nodes: Optional[int] = None,
+                     known_coloring: Optional[List[int]] = None) -> Dict[str, Any]:
+    """
+    Calculează sau mărginește numărul cromatic.
+    known_coloring: o colorare validă cunoscută (ex. partiția plantată), folosită dacă e mai bună decât DSATUR.
+    Returnează {"chromatic": χ sau None dacă nu s-a demonstrat, "lower", "upper", "exact",
+    "coloring": colorare cu `upper` culori, "clique": clica folosită ca margine inferioară, "nodes"}.
+    """
+    if g.n == 0:
+        return {"chromatic": 0, "lower": 0, "upper": 0, "exact": True, "coloring": [], "clique": [], "nodes": 0}
+    if max_nodes is None:
+        max_nodes = default_max_nodes(g.n)
+    clique = greedy_clique(g)
+    lower = len(clique)
+    upper = dsatur_coloring(g)
+    if known_coloring is not None and max(known_coloring) < max(upper):
+        upper = list(known_coloring)
+    exact = _ExactColoring(g, upper, lower, max_nodes)
+    proven = exact.run()
+    upper = exact.best_k
+    if proven:
+        lower = upper
+    return {
+        "chromatic": upper if proven else None,
+        "lower": lower,
+        "upper": upper,
+        "exact": proven,
+        "coloring": exact.best,
+        "clique": clique,
+        "nodes": exact.nodes,
+    }
+
+# ---------- instanțe ----------
+
+def build_graph(vertices: int, model: str, rng: random.Random, p: Optional[float] = None,
+                k: int = 3) -> Tuple[Graph, Optional[List[int]]]:
+    """
+    Construiește un graf după model: gnp (p implicit 0.5), planar (p = fracția de muchii păstrate),
+    planted (k grupuri). Returnează graful și colorarea plantată (doar pentru planted).
+    """
+    if model == "gnp":
+        return gnp_graph(vertices, 0.5 if p is None else p, rng), None
+    if model == "planar":
+        return planar_graph(vertices, rng, keep=0.75 if p is None else p), None
+    if model == "planted":
+        return planted_graph(vertices, k, 0.6 if p is None else p, rng)
+    raise ValueError(f"Unknown graph model: {model}")
+
+
+def colorability(chi: Dict[str, Any], colors: int) -> Optional[bool]:
+    """True/False dacă se poate decide din margini, None dacă colors e între margini nedemonstrate"""
+    if colors >= chi["upper"]:
+        return True
+    if colors < chi["lower"]:
+        return False
+    return None
+
+
+def generate_instance(vertices: int, model: str = "gnp", p: Optional[float] = None, k: int = 3,
+                      colors: Optional[int] = None, feasible: bool = True, slack: int = 0,
+                      seed: Optional[int] = None, rng: Optional[random.Random] = None,
+                      max_nodes: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Generează un graf după model și alege numărul de culori pe baza numărului cromatic
+    (dacă `colors` nu este dat explicit):
+    feasible=True  -> colors = upper + slack (există mereu o colorare, inclusă în rezultat)
+    feasible=False -> colors = lower - 1 (imposibil: graful conține o clică de dimensiune lower);
+                      grafurile fără muchii (lower = 1) sunt regenerate, ValueError dacă modelul nu dă altele
+    """
+    if rng is None:
+        rng = random.Random(seed)
+    for _ in range(INFEASIBLE_ATTEMPTS):
+        g, planted = build_graph(vertices, model, rng, p=p, k=k)
+        chi = chromatic_number(g, max_nodes=max_nodes, known_coloring=planted)
+        if feasible or colors is not None or chi["lower"] >= 2:
+            break
+    else:
+        raise ValueError(f"Cannot generate an infeasible instance: {model} graphs with {vertices} vertices "
+                         f"had no edges in {INFEASIBLE_ATTEMPTS} attempts")
+    if colors is None:
+        colors = max(1, chi["upper"] + slack) if feasible else max(1, chi["lower"] - 1)
+    return {
+        "graph": g,
+        "model": model,
+        "edges": g.edges(),
+        "colors": colors,
+        "colorable": colorability(chi, colors),
+        "chromatic": chi,
+    }
@@ -0,0 +1,113 @@
+"""
+SmarTest — Hanoi generalizat: numărul minim de mutări (Frame–Stewart) și generarea lazy a mutărilor
+Pentru 3 tije rezultatul este 2^n - 1; pentru 4 tije Frame–Stewart este demonstrat optim,
+pentru mai multe tije este cea mai bună valoare cunoscută (conjectura Frame–Stewart).
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Iterator, Iterable, Sequence
+import threading
+
+# ---------- tabel Frame–Stewart memoizat ----------
+
+# _TABLES[pegs] = [(mutări, split k) pentru 0, 1, 2, ... discuri], extins la cerere
+_TABLES: Dict[int, List[Tuple[int, int]]] = {}
+_LOCK = threading.Lock()
+
+
+def _extend(pegs: int, disks: int) -> List[Tuple[int, int]]:
+    """Extinde tabelul pentru `pegs` tije până la `disks` discuri (bottom-up, apelantul ține lock-ul)"""
+    table = _TABLES.setdefault(pegs, [(0, 0), (1, 0)])
+    if pegs > 3 and len(table) <= disks:
+        _extend(pegs - 1, disks)
+    smaller = _TABLES.get(pegs - 1)
+    while len(table) <= disks:
+        n = len(table)
+        if pegs == 3:
+            table.append((2 * table[n - 1][0] + 1, n - 1))
+            continue
+        # T(n, p) = min_k 2*T(k, p) + T(n-k, p-1)
+        best, best_k = None, 0
+        for k in range(1, n):
+            moves = 2 * table[k][0] + smaller[n - k][0]
+            if best is None or moves < best:
+                best, best_k = moves, k
+        table.append((best, best_k))
+    return table
+
+
+def frame_stewart(disks: int, pegs: int = 3) -> Tuple[int, int]:
+    """(numărul minim de mutări, split-ul optim k): k discuri mutate întâi pe o tijă intermediară"""
+    if pegs < 3:
+        raise ValueError("Generalised Hanoi needs at least 3 pegs")
+    if disks < 0:
+        raise ValueError("Number of disks must be non-negative")
+    table = _TABLES.get(pegs)
+    if table is None or len(table) <= disks:
+        with _LOCK:
+            table = _extend(pegs, disks)
+    return table[disks]
+
+
+def min_moves(disks: int, pegs: int = 3) -> int:
+    """Numărul minim de mutări pentru `disks` discuri pe `pegs` tije"""
+    return frame_stewart(disks, pegs)[0]
+
+# ---------- generarea mutărilor ----------
+
+def moves(disks: int, pegs: int = 3, source: int = 0, target: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """
+    Generează lazy mutările optime (de pe tija, pe tija), fără a construi lista completă.
+    Folosește o stivă explicită de subprobleme, deci memoria este O(discuri * tije) chiar și
+    pentru 20+ discuri (milioane de mutări).
+    """
+    if target is None:
+        target = pegs - 1
+    if not (0 <= source < pegs and 0 <= target < pegs) or source == target:
+        raise ValueError("Source and target must be different valid pegs")
+    frame_stewart(disks, pegs)  # completează tabelele o singură dată, înainte de generare
+    others = [p for p in range(pegs) if p not in (source, target)]
+    # element de stivă: (discuri, tije) cu tije = (sursă, intermediare..., destinație);
+    # discuri < 0 marchează o mutare directă a unui disc
+    stack: List[Tuple[int, Tuple[int, ...]]] = [(disks, (source, *others, target))]
+    while stack:
+        n, route = stack.pop()
+        if n < 0 or n == 1:
+            yield route[0], route[-1]
+            continue
+        if n == 0:
+            continue
+        src, dst, spare = route[0], route[-1], route[1:-1]
+        if len(route) == 3:
+            mid = spare[0]
+            stack.append((n - 1, (mid, src, dst)))
+            stack.append((-1, (src, dst)))
+            stack.append((n - 1, (src, dst, mid)))
+            continue
+        k = _TABLES[len(route)][n][1]
+        mid, rest = spare[0], spare[1:]
+        # ordinea inversă: stiva scoate întâi ultimul element adăugat
+        stack.append((k, (mid, src, *rest, dst)))
+        stack.append((n - k, (src, *rest, dst)))
+        stack.append((k, (src, *rest, dst, mid)))
+
+
+def verify(disks: int, pegs: int, sequence: Iterable[Tuple[int, int]], source: int = 0,
+           target: Optional[int] = None) -> bool:
+    """Simulează o secvență (posibil lazy) de mutări și verifică legalitatea și starea finală"""
+    if target is None:
+        target = pegs - 1
+    stacks: List[List[int]] = [[] for _ in range(pegs)]
+    stacks[source] = list(range(disks, 0, -1))
+    for a, b in sequence:
+        if not (0 <= a < pegs and 0 <= b < pegs) or not stacks[a]:
+            return False
+        if stacks[b] and stacks[b][-1] < stacks[a][-1]:
+            return False
+        stacks[b].append(stacks[a].pop())
+    return len(stacks[target]) == disks
+
+
+def format_moves(sequence: Sequence[Tuple[int, int]]) -> str:
+    """Formatează mutările ca 'A→D, A→B, ...' (tijele numerotate cu litere)"""
+    return ", ".join(f"{chr(65 + a)}→{chr(65 + b)}" for a, b in sequence)
@@ -0,0 +1,225 @@
+"""
+SmarTest — turul calului: tabele de mutări precalculate, Warnsdorff cu departajare și backtracking cu buget
+Pătratele sunt indexate r * size + c. Tabelele de mutări sunt vectori plați (CSR) per dimensiune:
+mutările pătratului sq sunt targets[offsets[sq]:offsets[sq + 1]].
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any
+from array import array
+from functools import lru_cache
+
+MAX_BOARD_SIZE = 50
+
+DEFAULT_MAX_NODES = 200_000
+
+# ordinea de bază a săriturilor; direcția unei mutări = indexul în această listă
+_JUMPS = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+
+TIE_BREAKS = ["first", "pohl", "squirrel"]
+
+# ---------- tabele de mutări ----------
+
+@lru_cache(maxsize=None)
+def move_table(size: int) -> Tuple[array, array, array]:
+    """(offsets, targets, directions) pentru o tablă size x size"""
+    if not 1 <= size <= MAX_BOARD_SIZE:
+        raise ValueError(f"Board size must be between 1 and {MAX_BOARD_SIZE}")
+    offsets, targets, directions = array("i", [0]), array("i"), array("b")
+    for sq in range(size * size):
+        r, c = divmod(sq, size)
+        for d, (dr, dc) in enumerate(_JUMPS):
+            rr, cc = r + dr, c + dc
+            if 0 <= rr < size and 0 <= cc < size:
+                targets.append(rr * size + cc)
+                directions.append(d)
+        offsets.append(len(targets))
+    return offsets, targets, directions
+
+
+class _Board:
+    """Starea unei căutări: pătrate vizitate și gradul liber (vecini nevizitați) al fiecărui pătrat"""
+    def __init__(self, size: int):
+        self.size = size
+        self.offsets, self.targets, self.directions = move_table(size)
+        self.visited = bytearray(size * size)
+        self.degree = [self.offsets[sq + 1] - self.offsets[sq] for sq in range(size * size)]
+
+    def neighbors(self, sq: int) -> array:
+        return self.targets[self.offsets[sq]:self.offsets[sq + 1]]
+
+    def visit(self, sq: int) -> None:
+        self.visited[sq] = 1
+        for t in self.neighbors(sq):
+            self.degree[t] -= 1
+
+    def leave(self, sq: int) -> None:
+        self.visited[sq] = 0
+        for t in self.neighbors(sq):
+            self.degree[t] += 1
+
+    def free_moves(self, sq: int) -> List[Tuple[int, int]]:
+        """(țintă, direcție) pentru mutările spre pătrate nevizitate"""
+        lo, hi = self.offsets[sq], self.offsets[sq + 1]
+        return [(self.targets[i], self.directions[i]) for i in range(lo, hi) if not self.visited[self.targets[i]]]
+
+    def lookahead(self, sq: int) -> int:
+        """Departajarea Pohl: suma gradelor libere ale vecinilor nevizitați"""
+        return sum(self.degree[t] for t in self.neighbors(sq) if not self.visited[t])
+
+
+def _result(found: bool, path: List[int], nodes: int, complete: bool, method: str) -> Dict[str, Any]:
+    return {"found": found, "path": path if found else None, "nodes": nodes, "complete": complete, "method": method}
+
+# ---------- Warnsdorff ----------
+
+def warnsdorff(size: int, start: int, tie_break: str = "pohl", rotation: int = 0,
+               closed: bool = False) -> Dict[str, Any]:
+    """
+    Warnsdorff: mereu spre pătratul cu cele mai puține continuări libere, fără revenire.
+    Departajare: "first" = ordinea săriturilor, "pohl" = suma gradelor vecinilor (Warnsdorff aplicat
+    un nivel mai jos), "squirrel" = ordine fixă a direcțiilor (rotită cu `rotation`), ca la Squirrel & Cull.
+    closed=True păstrează liber un vecin al pătratului de start până la ultima mutare.
+    """
+    if tie_break not in TIE_BREAKS:
+        raise ValueError(f"Unknown tie-break rule: {tie_break}")
+    board = _Board(size)
+    total = size * size
+    board.visit(start)
+    path = [start]
+    start_neighbors = set(board.neighbors(start))
+    while len(path) < total:
+        moves = board.free_moves(path[-1])
+        if closed and len(path) < total - 1:
+            safe = [m for m in moves if not (m[0] in start_neighbors and board.degree[start] == 1)]
+            moves = safe or moves
+        if not moves:
+            break
+        if tie_break == "pohl":
+            key = lambda m: (board.degree[m[0]], board.lookahead(m[0]))
+        elif tie_break == "squirrel":
+            key = lambda m: (board.degree[m[0]], (m[1] - rotation) % 8)
+        else:
+            key = lambda m: board.degree[m[0]]
+        nxt = min(moves, key=key)[0]
+        board.visit(nxt)
+        path.append(nxt)
+    found = len(path) == total and (not closed or path[-1] in start_neighbors)
+    return _result(found, path, len(path) - 1, True, f"warnsdorff-{tie_break}")
+
+# ---------- backtracking ----------
+
+def backtracking(size: int, start: int, closed: bool = False, ordered: bool = True,
+                 max_nodes: int = DEFAULT_MAX_NODES) -> Dict[str, Any]:
+    """
+    Backtracking iterativ (fără limită de recursivitate, tabla poate avea 2500 de pătrate).
+    ordered=True: candidații în ordinea Warnsdorff; ordered=False: ordinea fixă a săriturilor.
+    """
+    board = _Board(size)
+    total = size * size
+    board.visit(start)
+    path = [start]
+    start_neighbors = set(board.neighbors(start))
+    nodes = 0
+
+    def candidates(sq: int) -> List[int]:
+        moves = board.free_moves(sq)
+        if ordered:
+            moves.sort(key=lambda m: (board.degree[m[0]], m[1]))
+        # ultimul element e scos primul
+        return [t for t, _ in reversed(moves)]
+
+    stack = [candidates(start)]
+    while stack:
+        cands = stack[-1]
+        if not cands:
+            stack.pop()
+            if len(path) > 1:
+                board.leave(path.pop())
+            continue
+        nxt = cands.pop()
+        nodes += 1
+        if nodes > max_nodes:
+            return _result(False, path, max_nodes, False, "backtracking")
+        board.visit(nxt)
+        path.append(nxt)
+        if len(path) == total:
+            if not closed or nxt in start_neighbors:
+                return _result(True, path, nodes, True, "backtracking")
+            board.leave(path.pop())
+            continue
+        if closed and board.degree[start] == 0:
+            # nu se mai poate închide turul
+            board.leave(path.pop())
+            continue
+        stack.append(candidates(nxt))
+    return _result(False, path, nodes, True, "backtracking")
+
+# ---------- API ----------
+
+def tour_impossible(size: int, start: int, closed: bool = False) -> Optional[str]:
+    """Motivul pentru care un tur nu poate exista (argumente de paritate), sau None"""
+    if size == 1:
+        return "turul închis nu există pe o tablă 1x1" if closed else None
+    if size < 5:
+        return "nu există tur al calului pe table mai mici de 5x5"
+    if size % 2 and closed:
+        return "turul închis este imposibil pe o tablă cu număr impar de pătrate"
+    if size % 2 and sum(position(size, start)) % 2:
+        # calul alternează culorile, iar culoarea majoritară are un pătrat în plus
+        return "pe o tablă impară turul trebuie să pornească de pe culoarea majoritară"
+    return None
+
+
+def find_tour(size: int, start: int, closed: bool = False, max_nodes: int = DEFAULT_MAX_NODES) -> Dict[str, Any]:
+    """
+    Caută un tur: Warnsdorff cu departajare Pohl, apoi cu ordinile fixe de direcții rotite (Squirrel),
+    iar dacă toate eșuează, backtracking ordonat Warnsdorff cu bugetul rămas.
+    Un tur închis este un ciclu, deci poate fi căutat din orice pătrat și apoi rotit să înceapă din start.
+    nodes = totalul mutărilor încercate de toate încercările.
+    """
+    reason = tour_impossible(size, start, closed)
+    if reason is not None:
+        return {**_result(False, [], 0, True, "parity"), "reason": reason}
+    if size == 1:
+        return _result(True, [start], 0, True, "trivial")
+
+    attempts = [("pohl", 0)] + [("squirrel", r) for r in range(8)]
+    origins = [start] + ([sq for sq in range(size * size) if sq != start] if closed else [])
+    nodes = 0
+    for origin in origins:
+        for tie_break, rotation in attempts:
+            result = warnsdorff(size, origin, tie_break=tie_break, rotation=rotation, closed=closed)
+            nodes += result["nodes"]
+            if result["found"]:
+                path = result["path"]
+                if origin != start:
+                    k = path.index(start)
+                    path = path[k:] + path[:k]
+                return {**result, "path": path, "nodes": nodes}
+            if nodes >= max_nodes:
+                return _result(False, [], max_nodes, False, "warnsdorff")
+    result = backtracking(size, start, closed=closed, max_nodes=max(0, max_nodes - nodes))
+    return {**result, "nodes": nodes + result["nodes"]}
+
+
+def is_tour(size: int, path: List[int], closed: bool = False) -> bool:
+    """Verifică un tur: toate pătratele o singură dată, fiecare pas o săritură de cal"""
+    if len(path) != size * size or len(set(path)) != size * size:
+        return False
+    offsets, targets, _ = move_table(size)
+
+    def jump(a: int, b: int) -> bool:
+        return b in targets[offsets[a]:offsets[a + 1]]
+
+    if not all(jump(a, b) for a, b in zip(path, path[1:])):
+        return False
+    return not closed or jump(path[-1], path[0])
+
+
+def square(size: int, position: Tuple[int, int]) -> int:
+    return position[0] * size + position[1]
+
+
+def position(size: int, sq: int) -> Tuple[int, int]:
+    return divmod(sq, size)
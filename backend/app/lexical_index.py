@@ -0,0 +1,168 @@
+"""
+SmarTest — index invers BM25 pentru căutarea în fragmentele de teorie (chatbot)
+Indexul se construiește o singură dată per fișier de teorie: tokenizare cu eliminarea diacriticelor
+(română/engleză), cuvinte de legătură ignorate, termeni trunchiați la STEM_LENGTH caractere
+("echilibrul"/"echilibru", "strategii"/"strategy" -> același termen). Ponderile BM25 (IDF inclus) sunt
+precalculate pe fiecare intrare din listele de apariții, deci o interogare costă cât lungimea listelor
+termenilor ei, nu cât numărul de fragmente.
+
+Comparație cu scorarea tuturor fragmentelor prin semantic_similarity (fallback-ul fără model):
+    python -m app.lexical_index [--theory-file example_theory.json] [--iterations 200]
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any, Iterable, Collection
+from collections import Counter
+import argparse
+import heapq
+import math
+import re
+import sys
+import time
+import unicodedata
+
+K1 = 1.5
+B = 0.75
+STEM_LENGTH = 7
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+    a ai al ale am ar are as asa au ca cand care cat ce cel cea cei cele cu cum da dar de deci din dintre
+    dupa e ei el ea este eu fi fie iar il in intr intre la le li lor lui mai ma mi ne nici nu o or
+    pe pentru poate prin sa sau se si sunt te tu un una unei unui unor va vor
+    an and are as at be by can do does for from how i if in is it its of on or than that the this
+    to was what when where which who why will with explica explain spune
+""".split())
+
+# ---------- tokenizare ----------
+
+def fold(text: str) -> str:
+    """Litere mici, fără diacritice (ă->a, ș/ş->s, é->e ...)"""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> List[str]:
+    """Termenii indexați: cuvinte fără diacritice, fără cuvinte de legătură, trunchiate la STEM_LENGTH"""
+    return [word[:STEM_LENGTH] for word in _TOKEN.findall(fold(text)) if word not in STOPWORDS]
+
+# ---------- index ----------
+
+class BM25Index:
+    """
+    Index invers peste o listă de texte: termen -> [(document, pondere BM25)].
+    Ordinea rezultatelor e cea BM25; scorurile sunt scalate la 0-1 astfel încât primul rezultat are
+    scorul egal cu acoperirea interogării (fracțiunea din IDF-ul termenilor ei prezentă în document):
+    o întrebare despre ceva ce nu apare în teorie primește un scor mic chiar dacă un cuvânt se potrivește.
+    """
+    def __init__(self, texts: Iterable[str], k1: float = K1, b: float = B):
+        self.k1, self.b = k1, b
+        counts = [Counter(tokenize(text)) for text in texts]
+        self.size = len(counts)
+        lengths = [sum(c.values()) for c in counts]
+        avg_length = sum(lengths) / self.size if self.size else 0.0
+
+        frequencies: Dict[str, int] = Counter(term for c in counts for term in c)
+        self.idf = {term: math.log(1 + (self.size - df + 0.5) / (df + 0.5)) for term, df in frequencies.items()}
+        self.postings: Dict[str, List[Tuple[int, float]]] = {term: [] for term in frequencies}
+        for doc, (c, length) in enumerate(zip(counts, lengths)):
+            norm = k1 * (1 - b + b * length / avg_length) if avg_length else k1
+            for term, tf in c.items():
+                self.postings[term].append((doc, self.idf[term] * tf * (k1 + 1) / (tf + norm)))
+        # un termen absent din corpus contează, la acoperire, cât cel mai rar termen
+        self.unknown_idf = math.log(1 + (self.size + 0.5) / 0.5)
+
+    def search(self, query: str, top_k: Optional[int] = None,
+               allowed: Optional[Collection[int]] = None) -> List[Tuple[int, float]]:
+        """[(document, scor 0-1)] descrescător; doar documentele care conțin cel puțin un termen al interogării"""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        scores: Dict[int, float] = {}
+        matched: Dict[int, float] = {}
+        for term in terms:
+            idf = self.idf.get(term)
+            for doc, weight in self.postings.get(term, ()):
+                if allowed is None or doc in allowed:
+                    scores[doc] = scores.get(doc, 0.0) + weight
+                    matched[doc] = matched.get(doc, 0.0) + idf
+        if not scores:
+            return []
+        if top_k is None:
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        else:
+            ranked = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        best_doc, best = ranked[0]
+        coverage = matched[best_doc] / sum(self.idf.get(term, self.unknown_idf) for term in terms)
+        return [(doc, score / best * coverage) for doc, score in ranked]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "documents": self.size,
+            "terms": len(self.postings),
+            "postings": sum(len(p) for p in self.postings.values()),
+        }
+
+# ---------- benchmark ----------
+
+QUESTIONS = [
+    "ce este echilibrul nash?",
+    "cum functioneaza alpha beta pruning",
+    "explica forward checking",
+    "care este diferenta dintre minmax si expectimax",
+    "ce este o euristica admisibila?",
+    "cand folosesc MRV la CSP?",
+    "ce sunt strategiile mixte",
+    "care este capitala frantei",
+]
+
+
+def benchmark(theory_file: str = "example_theory.json", iterations: int = 200) -> Dict[str, Any]:
+    """Construirea indexului, µs per interogare (BM25 vs. semantic_similarity pe toate fragmentele), top-1"""
+    import app.chatbot as chatbot
+    from app.nlp_utils import semantic_similarity
+
+    chunks = chatbot._get_chunks(theory_file)
+    start = time.perf_counter()
+    index = BM25Index(chunk["text"] for chunk in chunks)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        index.search(QUESTIONS[i % len(QUESTIONS)], top_k=3)
+    bm25_us = (time.perf_counter() - start) / iterations * 1e6
+
+    rounds = max(1, iterations // 10)
+    start = time.perf_counter()
+    for i in range(rounds):
+        question = QUESTIONS[i % len(QUESTIONS)]
+        sorted((semantic_similarity(question, chunk["text"]) for chunk in chunks), reverse=True)[:3]
+    scan_us = (time.perf_counter() - start) / rounds * 1e6
+
+    top = {}
+    for question in QUESTIONS:
+        hits = index.search(question, top_k=1)
+        top[question] = (chunks[hits[0][0]]["title"], round(hits[0][1], 2)) if hits else None
+    return {"chunks": len(chunks), "build_ms": round(build_ms, 2), "bm25_us": round(bm25_us, 1),
+            "scan_us": round(scan_us, 1), "index": index.stats(), "top": top}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Index BM25 peste fragmentele de teorie ale chatbot-ului")
+    parser.add_argument("--theory-file", default="example_theory.json")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    r = benchmark(args.theory_file, args.iterations)
+    print(f"{r['chunks']} fragmente, {r['index']['terms']} termeni, {r['index']['postings']} apariții; "
+          f"construit în {r['build_ms']} ms")
+    print(f"BM25: {r['bm25_us']} µs/interogare; semantic_similarity pe toate fragmentele: {r['scan_us']} µs "
+          f"({r['scan_us'] / r['bm25_us']:.0f}x)")
+    for question, hit in r["top"].items():
+        print(f"  {question!r}: {hit[0] + f' ({hit[1]})' if hit else '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,363 @@
+"""
+SmarTest — test de încărcare: o clasă de studenți care rezolvă un test mixt
+Fiecare utilizator virtual rulează sesiuni: câte o întrebare din fiecare tip (nash, minmax, csp, problem1,
+theory, în ordine amestecată), un răspuns corect, parțial sau "nu știu" pentru fiecare și, din când în
+când, o întrebare pentru chatbot. La final: latența p50/p95/p99 pe rută, debitul și rata de erori.
+
+Rulare (din backend/):
+    python -m app.load_test --users 30 --sessions 5                        # aplicația în proces (ASGI)
+    python -m app.load_test --url http://127.0.0.1:8000 --users 60 --think 2 --ramp 30
+    python -m app.load_test --users 30 --json raport.json                  # pentru comparații între configurații
+
+--distinct-questions N modelează un test comun (seed-uri din 1..N, deci cache-uri calde);
+implicit fiecare student primește întrebări noi. --record scrie rezultatele în baza de date
+(results_store), ca la un test real; implicit evaluările nu se salvează. Backend-ul salvează doar
+cererile cu header-ul intern, deci --record trimite SMARTEST_INTERNAL_SECRET (sau --secret).
+
+Necesită httpx: pip install httpx
+"""
+
+from __future__ import annotations
+from typing import List, Optional, Dict, Any
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# header-ul cu care proxy-urile PHP se autentifică la backend (vezi main.INTERNAL_HEADER)
+INTERNAL_HEADER = "X-SmarTest-Internal"
+
+QUIZ_KINDS = ("nash", "minmax", "csp", "problem1", "theory")
+
+# ponderile categoriilor de răspuns dintr-o clasă tipică
+ANSWER_MIX = (("correct", 0.5), ("partial", 0.3), ("dont_know", 0.2))
+
+DONT_KNOW = ("nu știu", "nu stiu", "Nu știu, nu am apucat să învăț asta.")
+
+CHAT_QUESTIONS = (
+    "ce este echilibrul nash?",
+    "cum functioneaza alpha beta pruning",
+    "explica forward checking",
+    "care este diferenta dintre minmax si expectimax",
+    "ce este o euristica admisibila?",
+    "cand folosesc MRV la CSP?",
+)
+
+# ---------- întrebări și răspunsuri ----------
+
+def generate_params(kind: str, rng: random.Random) -> Dict[str, Any]:
+    """Parametrii cererii /{kind}/generate, variați ca în frontend"""
+    if kind == "nash":
+        size = rng.choice((2, 3, 3, 4))
+        return {"rows": size, "cols": size, "ensure": rng.choice(("any", "atleast_one", "unique"))}
+    if kind == "minmax":
+        return {"depth": rng.choice((2, 3, 3, 4)), "branching_factor": rng.choice((2, 2, 3))}
+    if kind == "csp":
+        return {"problem_type": rng.choice(("simple", "graph_coloring", "sudoku"))}
+    if kind == "problem1":
+        return {"problem_type": rng.choice(("n-queens", "hanoi", "graph_coloring", "knight_tour"))}
+    return {}
+
+
+def _other_option(options: List[Any], correct: Any) -> str:
+    wrong = [o for o in options if str(o) != str(correct)]
+    return str(wrong[0]) if wrong else str(correct)
+
+
+def answers_for(kind: str, question: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Corpusul de răspunsuri pentru o întrebare: corect, parțial (sau o variantă plauzibilă dar greșită,
+    pentru întrebările cu opțiuni) și "nu știu". Răspunsurile corecte sunt citite din soluția din payload.
+    """
+    answers = {"dont_know": DONT_KNOW[len(str(question.get("id", ""))) % len(DONT_KNOW)]}
+    if kind == "nash":
+        equilibria = question["solution"]["equilibria"]
+        answers["correct"] = "; ".join(f"{r} {c}" for r, c in equilibria) or "none"
+        if len(equilibria) > 1:
+            answers["partial"] = f"{equilibria[0][0]} {equilibria[0][1]}"
+        elif equilibria:
+            answers["partial"] = f"{equilibria[0][0]} {equilibria[0][1] % question['cols'] + 1}"
+        else:
+            answers["partial"] = "1 1"
+    elif kind == "minmax":
+        solution = question["solution"]
+        value, leaves = solution["root_value"], len(solution["visited_leaves"])
+        answers["correct"] = f"valoare={value}, frunze={leaves}"
+        answers["partial"] = f"{value} {leaves + 1}"
+    elif kind == "csp":
+        answers["correct"] = question["correct_optimization"]
+        answers["partial"] = _other_option(question["options"], question["correct_optimization"])
+    elif kind == "problem1":
+        if question.get("question_kind") == "min_moves":
+            answers["correct"] = str(question["correct_moves"])
+            answers["partial"] = str(question["correct_moves"] + 2)
+        else:
+            answers["correct"] = question["correct_strategy"]
+            answers["partial"] = _other_option(question["options"], question["correct_strategy"])
+    else:
+        theory_type = question.get("theory_type")
+        if theory_type == "fill_blank":
+            first = question["correct_answers"][0]  # un spațiu: variante; mai multe: câte o listă per variantă
+            if isinstance(first, list):
+                answers["correct"] = ", ".join(first)
+                answers["partial"] = first[0]
+            else:
+                answers["correct"] = first
+                answers["partial"] = " ".join(first.split()[:2])
+        elif theory_type == "multiple_choice":
+            # frontend-ul trimite numărul opțiunii (1-n)
+            index = question["correct_index"]
+            answers["correct"] = str(index + 1)
+            answers["partial"] = str((index + 1) % len(question["options"]) + 1)
+        elif theory_type == "true_false":
+            answers["correct"] = str(question["correct_answer"])
+            answers["partial"] = "True" if answers["correct"] == "False" else "False"
+        else:
+            words = str(question.get("correct_answer", "")).split()
+            answers["correct"] = " ".join(words)
+            answers["partial"] = " ".join(words[:max(3, len(words) // 3)])
+    return answers
+
+
+def pick_category(rng: random.Random) -> str:
+    x = rng.random()
+    for category, weight in ANSWER_MIX:
+        if x < weight:
+            return category
+        x -= weight
+    return ANSWER_MIX[-1][0]
+
+# ---------- măsurători ----------
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Percentila q (0-100) prin rangul cel mai apropiat; lista trebuie să fie sortată"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(q / 100 * len(sorted_values)) - 1)]
+
+
+class Recorder:
+    """Latențele și erorile pe rută ("GET /nash/generate"); o singură buclă asyncio, deci fără lock"""
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.reasons: Dict[str, int] = {}
+        self.sessions = 0
+        self.categories = {category: 0 for category, _ in ANSWER_MIX}
+
+    def record(self, route: str, elapsed: float, error: Optional[str] = None) -> None:
+        self.latencies.setdefault(route, []).append(elapsed)
+        if error is not None:
+            self.errors[route] = self.errors.get(route, 0) + 1
+            key = f"{route}: {error}"
+            self.reasons[key] = self.reasons.get(key, 0) + 1
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        routes = {}
+        for route in sorted(self.latencies):
+            samples = sorted(self.latencies[route])
+            errors = self.errors.get(route, 0)
+            routes[route] = {
+                "requests": len(samples),
+                "errors": errors,
+                "error_rate": round(errors / len(samples), 4),
+                "rps": round(len(samples) / elapsed, 2),
+                "p50_ms": round(percentile(samples, 50) * 1000, 2),
+                "p95_ms": round(percentile(samples, 95) * 1000, 2),
+                "p99_ms": round(percentile(samples, 99) * 1000, 2),
+                "max_ms": round(samples[-1] * 1000, 2),
+            }
+        requests = sum(r["requests"] for r in routes.values())
+        errors = sum(r["errors"] for r in routes.values())
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "sessions": self.sessions,
+            "sessions_per_s": round(self.sessions / elapsed, 2),
+            "requests": requests,
+            "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "throughput_rps": round(requests / elapsed, 2),
+            "answers": dict(self.categories),
+            "routes": routes,
+            "error_reasons": dict(sorted(self.reasons.items(), key=lambda kv: -kv[1])),
+        }
+
+# ---------- sesiuni ----------
+
+async def _request(client: "httpx.AsyncClient", recorder: Recorder, method: str, path: str,
+                   **kwargs: Any) -> Optional[Dict[str, Any]]:
+    route = f"{method} {path}"
+    start = time.perf_counter()
+    try:
+        response = await client.request(method, path, **kwargs)
+        body = response.json()
+    except (httpx.HTTPError, ValueError) as e:
+        recorder.record(route, time.perf_counter() - start, type(e).__name__)
+        return None
+    elapsed = time.perf_counter() - start
+    if response.status_code >= 400:
+        recorder.record(route, elapsed, f"HTTP {response.status_code}")
+        return None
+    recorder.record(route, elapsed)
+    return body
+
+
+async def run_session(client: "httpx.AsyncClient", recorder: Recorder, rng: random.Random,
+                      user_id: Optional[int] = None, think: float = 0.0, chat_rate: float = 0.5,
+                      distinct_questions: int = 0, compact: bool = False) -> None:
+    """Un test mixt: generate + grade pentru fiecare tip, cu întrebări la chatbot între ele"""
+    kinds = list(QUIZ_KINDS)
+    rng.shuffle(kinds)
+    for kind in kinds:
+        params = generate_params(kind, rng)
+        if distinct_questions:
+            params["seed"] = rng.randint(1, distinct_questions)
+        if compact:
+            params["compact"] = "true"
+        generated = await _request(client, recorder, "GET", f"/{kind}/generate", params=params)
+        await _think(rng, think)
+        if generated is not None:
+            question = generated["payload"] if kind == "theory" else generated
+            category = pick_category(rng)
+            recorder.categories[category] += 1
+            try:
+                answer = answers_for(kind, question)[category]
+            except (KeyError, IndexError, TypeError):
+                answer = DONT_KNOW[0]  # payload într-o formă neprevăzută: răspunsul tot se trimite
+            body: Dict[str, Any] = {"answer": answer}
+            if compact and "token" in generated:
+                body["token"] = generated["token"]
+            else:
+                body["payload"] = question
+            if user_id is not None:
+                body["user_id"] = user_id
+            await _request(client, recorder, "POST", f"/{kind}/grade", json=body)
+        if rng.random() < chat_rate:
+            await _request(client, recorder, "POST", "/chat/ask", json={"question": rng.choice(CHAT_QUESTIONS)})
+            await _think(rng, think)
+    recorder.sessions += 1
+
+
+async def _think(rng: random.Random, think: float) -> None:
+    """Timpul de gândire al studentului: exponențial, cu media `think` secunde"""
+    if think > 0:
+        await asyncio.sleep(rng.expovariate(1 / think))
+
+
+async def _user(client: "httpx.AsyncClient", recorder: Recorder, index: int, sessions: int, seed: int,
+                delay: float, record_base: Optional[int], **session_options: Any) -> None:
+    rng = random.Random(seed * 1_000_003 + index)
+    if delay:
+        await asyncio.sleep(delay)
+    user_id = record_base + index if record_base is not None else None
+    for _ in range(sessions):
+        await run_session(client, recorder, rng, user_id, **session_options)
+
+# ---------- API ----------
+
+async def run_load(users: int = 30, sessions: int = 3, url: Optional[str] = None, think: float = 0.0,
+                   ramp: float = 0.0, chat_rate: float = 0.5, distinct_questions: int = 0, compact: bool = False,
+                   record_base: Optional[int] = None, seed: int = 0, timeout: float = 60.0,
+                   secret: Optional[str] = None) -> Dict[str, Any]:
+    """
+    `users` studenți concurenți, fiecare cu `sessions` teste la rând. Fără url, aplicația rulează în
+    același proces (httpx.ASGITransport): fără rețea, dar cu aceeași buclă de evenimente și același
+    threadpool pentru rutele sincrone ca sub uvicorn cu un singur worker. Cu record_base, cererile
+    poartă secretul intern (implicit SMARTEST_INTERNAL_SECRET), ca cele trecute prin proxy-urile PHP.
+    """
+    if not HTTPX_AVAILABLE:
+        raise RuntimeError("The load test requires httpx (pip install httpx)")
+    headers = {}
+    if record_base is not None:
+        headers[INTERNAL_HEADER] = secret if secret is not None else os.environ.get("SMARTEST_INTERNAL_SECRET", "")
+    if url:
+        client = httpx.AsyncClient(base_url=url, timeout=timeout, headers=headers,
+                                   limits=httpx.Limits(max_connections=users, max_keepalive_connections=users))
+    else:
+        import app.main
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app.main.app), base_url="http://smartest",
+                                   timeout=timeout, headers=headers)
+    recorder = Recorder()
+    async with client:
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            _user(client, recorder, i, sessions, seed, ramp * i / users, record_base, think=think,
+                  chat_rate=chat_rate, distinct_questions=distinct_questions, compact=compact)
+            for i in range(users)
+        ))
+        elapsed = time.perf_counter() - start
+    report = recorder.report(elapsed)
+    report["config"] = {"users": users, "sessions": sessions, "target": url or "in-process", "think": think,
+                        "ramp": ramp, "chat_rate": chat_rate, "distinct_questions": distinct_questions,
+                        "compact": compact, "seed": seed}
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"{'rută':<24} {'cereri':>7} {'erori':>6} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+             f"{'p99 ms':>9} {'max ms':>9}"]
+    for route, r in report["routes"].items():
+        lines.append(f"{route:<24} {r['requests']:>7} {r['errors']:>6} {r['rps']:>8.1f} {r['p50_ms']:>9.1f} "
+                     f"{r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['max_ms']:>9.1f}")
+    lines.append("")
+    lines.append(f"{report['sessions']} sesiuni în {report['elapsed_s']}s ({report['sessions_per_s']} sesiuni/s), "
+                 f"{report['requests']} cereri, {report['throughput_rps']} cereri/s, "
+                 f"erori {report['errors']} ({report['error_rate']:.2%})")
+    lines.append("răspunsuri: " + ", ".join(f"{k}={v}" for k, v in report["answers"].items()))
+    for reason, count in list(report["error_reasons"].items())[:10]:
+        lines.append(f"  ! {reason} x{count}")
+    return "\n".join(lines)
+
+# ---------- CLI ----------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Test de încărcare: o clasă care rezolvă un test mixt")
+    parser.add_argument("--url", default=None, help="serverul țintă (implicit aplicația în proces)")
+    parser.add_argument("--users", type=int, default=30, help="studenți concurenți")
+    parser.add_argument("--sessions", type=int, default=3, help="teste per student")
+    parser.add_argument("--think", type=float, default=0.0, help="timpul mediu de gândire între cereri, secunde")
+    parser.add_argument("--ramp", type=float, default=0.0, help="studenții pornesc eșalonat pe atâtea secunde")
+    parser.add_argument("--chat-rate", type=float, default=0.5, help="probabilitatea unei întrebări la chatbot")
+    parser.add_argument("--distinct-questions", type=int, default=0,
+                        help="seed-uri din 1..N (test comun); 0 = întrebări noi pentru fiecare")
+    parser.add_argument("--compact", action="store_true", help="evaluare după token în locul payload-ului")
+    parser.add_argument("--record", type=int, default=None, metavar="USER_ID",
+                        help="salvează rezultatele, pentru user_id de la USER_ID în sus")
+    parser.add_argument("--secret", default=None,
+                        help="secretul intern pentru --record (implicit SMARTEST_INTERNAL_SECRET)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--log-level", default="WARNING", help="nivelul de log al aplicației în proces")
+    parser.add_argument("--json", default=None, help="scrie raportul complet în fișierul dat")
+    args = parser.parse_args(argv)
+
+    if not HTTPX_AVAILABLE:
+        print("httpx nu este instalat: pip install httpx", file=sys.stderr)
+        return 2
+    if args.url is None:
+        import app.log_config as log_config
+        import app.main  # noqa: F401  (configurează logging-ul la import)
+        log_config.configure(level=args.log_level)
+
+    report = asyncio.run(run_load(args.users, args.sessions, args.url, args.think, args.ramp, args.chat_rate,
+                                  args.distinct_questions, args.compact, args.record, args.seed, args.timeout,
+                                  args.secret))
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
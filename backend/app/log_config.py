@@ -0,0 +1,156 @@
+"""
+SmarTest — configurarea logging-ului backend-ului
+Un singur punct de configurare (apelat din main.py, nu la importul modulelor), linii structurate
+`cheie=valoare` sau JSON, evenimente de pe căile fierbinți (similaritate, comparații la evaluare)
+eșantionate la nivel DEBUG și o linie de sumar per cerere cu numărul de evenimente.
+
+Configurare prin variabile de mediu:
+    SMARTEST_LOG_LEVEL   nivelul (implicit INFO)
+    SMARTEST_LOG_FORMAT  "text" sau "json" (implicit text)
+    SMARTEST_LOG_SAMPLE  se scrie 1 din N evenimente fierbinți, per tip de eveniment (implicit 100; 1 = toate)
+
+Benchmark (evenimente scrise toate vs. eșantionate, pe bucla de similaritate a chatbot-ului):
+    python -m app.log_config
+"""
+
+from __future__ import annotations
+from typing import List, Optional, Dict, Any
+from contextvars import ContextVar
+import argparse
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+
+DEFAULT_SAMPLE_EVERY = 100
+
+# câmpurile standard ale LogRecord; restul (din extra=) sunt câmpuri structurate
+_RESERVED = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+# ---------- formatare ----------
+
+class StructuredFormatter(logging.Formatter):
+    """`ts level logger mesaj cheie=valoare ...` sau un obiect JSON per linie"""
+    def __init__(self, as_json: bool = False):
+        super().__init__()
+        self.as_json = as_json
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = {k: v for k, v in vars(record).items() if k not in _RESERVED}
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z"
+        message = record.getMessage()
+        if self.as_json:
+            entry = {"ts": timestamp, "level": record.levelname, "logger": record.name, "msg": message, **fields}
+            if record.exc_info:
+                entry["exc"] = self.formatException(record.exc_info)
+            return json.dumps(entry, ensure_ascii=False, default=str)
+        line = f"{timestamp} {record.levelname:<7} {record.name} {message}"
+        if fields:
+            line += " " + " ".join(f"{k}={_text_value(v)}" for k, v in fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+def _text_value(value: Any) -> str:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+    return str(value)
+
+# ---------- evenimente fierbinți ----------
+
+_counters: Dict[str, "itertools.count[int]"] = {}
+_sample_every = DEFAULT_SAMPLE_EVERY
+
+# evenimentele cererii curente, pentru linia de sumar (None în afara unei cereri HTTP)
+_REQUEST_EVENTS: ContextVar[Optional[Dict[str, int]]] = ContextVar("request_events", default=None)
+
+
+def hot_event(logger: logging.Logger, event: str, msg: str, *args: Any) -> None:
+    """
+    Eveniment de pe o cale fierbinte: numărat mereu (pentru sumarul cererii), scris la DEBUG
+    doar pentru 1 din SMARTEST_LOG_SAMPLE apariții. Formatarea mesajului e leneșă: argumentele
+    se formatează doar dacă linia chiar se scrie.
+    """
+    events = _REQUEST_EVENTS.get()
+    if events is not None:
+        events[event] = events.get(event, 0) + 1
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    counter = _counters.get(event)
+    if counter is None:
+        counter = _counters.setdefault(event, itertools.count())
+    n = next(counter)
+    if n % _sample_every == 0:
+        logger.debug(msg, *args, extra={"event": event, "sampled": f"1/{_sample_every}", "seen": n + 1})
+
+
+def start_request() -> Dict[str, int]:
+    events: Dict[str, int] = {}
+    _REQUEST_EVENTS.set(events)
+    return events
+
+# ---------- configurare ----------
+
+def configure(level: Optional[str] = None, fmt: Optional[str] = None, sample_every: Optional[int] = None,
+              stream: Any = None) -> None:
+    """Configurează logger-ul rădăcină (idempotent: înlocuiește handler-ul pus anterior de configure)"""
+    global _sample_every
+    level = (level or os.environ.get("SMARTEST_LOG_LEVEL") or "INFO").upper()
+    fmt = fmt or os.environ.get("SMARTEST_LOG_FORMAT") or "text"
+    if sample_every is None:
+        try:
+            sample_every = int(os.environ.get("SMARTEST_LOG_SAMPLE", DEFAULT_SAMPLE_EVERY))
+        except ValueError:
+            sample_every = DEFAULT_SAMPLE_EVERY
+    _sample_every = max(1, sample_every)
+
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if getattr(h, "_smartest", False)]:
+        root.removeHandler(handler)
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(StructuredFormatter(as_json=fmt == "json"))
+    handler._smartest = True  # type: ignore[attr-defined]
+    root.addHandler(handler)
+    root.setLevel(level)
+
+# ---------- benchmark ----------
+
+def benchmark(iterations: int = 300) -> Dict[str, float]:
+    """
+    Cereri de chatbot pe secundă (fiecare calculează similaritatea cu toate fragmentele de teorie):
+    toate evenimentele scrise (DEBUG, 1/1, ca vechiul log INFO per apel) vs. configurația implicită.
+    """
+    import app.chatbot as chatbot
+
+    questions = ["ce este echilibrul nash?", "cum functioneaza alpha beta pruning", "explica forward checking",
+                 "care este diferenta dintre minmax si expectimax"]
+    results = {}
+    retrieval, chatbot.RETRIEVAL = chatbot.RETRIEVAL, "scan"  # similaritatea pe toate fragmentele, nu doar BM25
+    with open(os.devnull, "w") as sink:
+        for name, level, sample in (("all_events", "DEBUG", 1), ("sampled_info", "INFO", None)):
+            configure(level=level, sample_every=sample, stream=sink)
+            start = time.perf_counter()
+            for i in range(iterations):
+                chatbot.answer_question(questions[i % len(questions)])
+            results[name] = round(iterations / (time.perf_counter() - start), 1)
+    chatbot.RETRIEVAL = retrieval
+    configure()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Costul logging-ului pe calea de evaluare")
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args(argv)
+    r = benchmark(args.iterations)
+    print(f"toate evenimentele (DEBUG): {r['all_events']} cereri/s")
+    print(f"implicit (INFO, eșantionat): {r['sampled_info']} cereri/s "
+          f"({r['sampled_info'] / r['all_events']:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,9 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
+import app.log_config as log_config
+log_config.configure()  # înaintea celorlalte module: și mesajele de la import sunt formatate
 import app.smartest_nash as sm
 import app.smartest_minmax as mm
 import app.smartest_problem1 as p1
@@ -8,21 +11,59 @@ import app.smartest_csp as csp
 import app.theory_questions as theory_q
 import app.theory_grading as theory_g
 import app.chatbot as chatbot
+import app.grade_cache as grade_cache
+import app.question_store as question_store
+import app.question_tokens as question_tokens
+import app.results_store as results_store
+import app.results_export as results_export
+import app.metrics as metrics
+import hmac
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(title="SmarTest API", version="0.1.0")
 
 # CORS (permite apeluri din browser de pe localhost / XAMPP)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost", "http://127.0.0.1", "*"],
+    allow_origins=["http://localhost", "http://127.0.0.1"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+
+@app.middleware("http")
+async def timing_middleware(request: Request, call_next):
+    """
+    Latența pe rută (șablonul rutei, nu calea: /stats/{user_id}) + header Server-Timing
+    + o linie de sumar per cerere (evenimentele fierbinți numărate, nu scrise individual)
+    """
+    spans = metrics.start_request()
+    events = log_config.start_request()
+    start = time.perf_counter()
+    response = await call_next(request)
+    elapsed = time.perf_counter() - start
+    route = request.scope.get("route")
+    metrics.observe("smartest_http_request_duration_seconds", elapsed, method=request.method,
+                    route=getattr(route, "path", "unmatched"), status=response.status_code)
+    response.headers["Server-Timing"] = metrics.server_timing(spans, elapsed)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s %s %d %.1fms", request.method, request.url.path, response.status_code, elapsed * 1000,
+                    extra={"route": getattr(route, "path", "unmatched"), "events": events or None,
+                           "spans": len(spans)})
+    return response
+
 class AnswerPayload(BaseModel):
-    payload: dict
+    payload: dict | None = None
+    token: str | None = None  # alternativă compactă la payload (vezi ?compact=true la /*/generate)
     answer: str
+    user_id: int | None = None  # dacă e setat (doar de la proxy-urile PHP), rezultatul se salvează în results
+    topic: str | None = None    # eticheta din istoric (implicit cea a rutei)
 
 
 class ChatPayload(BaseModel):
@@ -31,10 +72,138 @@ class ChatPayload(BaseModel):
     theory_file: str = "example_theory.json"
     max_sources: int = 3
 
+# etichetele folosite de frontend în istoricul rezultatelor
+RESULT_TOPICS = {
+    "nash": "Echilibru Nash",
+    "minmax": "MinMax",
+    "problem1": "Identificare Strategie",
+    "csp": "CSP",
+    "theory": "Teorie",
+}
+
+
+# secretul partajat cu proxy-urile PHP (SMARTEST_INTERNAL_SECRET); fără el nicio cerere nu e internă
+INTERNAL_HEADER = "X-SmarTest-Internal"
+
+
+def _is_internal(request: Request) -> bool:
+    """Cererea vine de la proxy-urile PHP (care au verificat sesiunea), nu direct din browser?"""
+    secret = os.environ.get("SMARTEST_INTERNAL_SECRET", "")
+    supplied = request.headers.get(INTERNAL_HEADER, "")
+    return bool(secret) and hmac.compare_digest(supplied.encode("utf-8"), secret.encode("utf-8"))
+
+
+# motivele pentru care un user_id a fost ignorat, deja semnalate în log (un avertisment per motiv)
+_UNRECORDED_WARNED: set = set()
+
+
+def _warn_unrecorded(request: Request) -> None:
+    """Rezultat cu user_id nesalvat: secretul lipsește din mediu sau header-ul nu se potrivește"""
+    if not os.environ.get("SMARTEST_INTERNAL_SECRET", ""):
+        reason = "SMARTEST_INTERNAL_SECRET is not set: graded results are not being saved"
+    elif INTERNAL_HEADER not in request.headers:
+        reason = f"request with user_id but without {INTERNAL_HEADER}: result not saved"
+    else:
+        reason = f"{INTERNAL_HEADER} does not match SMARTEST_INTERNAL_SECRET: result not saved"
+    if reason not in _UNRECORDED_WARNED:
+        _UNRECORDED_WARNED.add(reason)
+        logger.warning(reason)
+
+
+def _require_internal(request: Request) -> None:
+    if not _is_internal(request):
+        raise HTTPException(status_code=403, detail="Internal endpoint")
+
+
+def _grade(kind: str, ap: AnswerPayload, grade, request: Request):
+    """
+    Evaluează după token (întrebarea regenerată pe server) sau după payload-ul trimis de client.
+    Cu user_id, rezultatul e pus în coada de scriere (results_store); răspunsul nu așteaptă discul.
+    user_id / topic sunt luate în seamă doar de la proxy-urile PHP (_is_internal); altfel rezultatul nu se
+    salvează, iar răspunsul are recorded=False (și un avertisment în log, o dată per motiv).
+    """
+    timed_grade = metrics.timed(f"grade_{kind}")(grade)  # măsurat doar la miss în cache
+    if ap.token is not None:
+        try:
+            payload = question_tokens.resolve(ap.token, kind)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        result = grade_cache.cached_grade(kind, payload, ap.answer, timed_grade, question_key=ap.token)
+    elif ap.payload is not None:
+        payload = ap.payload
+        result = grade_cache.cached_grade(kind, payload, ap.answer, timed_grade)
+    else:
+        raise HTTPException(status_code=422, detail="Either payload or token is required")
+    if ap.user_id is None or "score" not in result:
+        return result
+    if not _is_internal(request):
+        _warn_unrecorded(request)
+        return dict(result, recorded=False)  # copie: rezultatul din cache rămâne neschimbat
+    results_store.record_result(ap.user_id, ap.topic or RESULT_TOPICS[kind], result["score"],
+                                result.get("feedback", ""), payload)
+    return dict(result, recorded=True)
+
+
+def _generate(kind: str, seed: int | None, params: dict, compact: bool = False) -> dict:
+    """
+    Generează prin registrul comun: cu seed, întrebarea e memoizată (question_store).
+    compact: se alege un seed dacă lipsește și se adaugă token-ul semnat.
+    """
+    if not compact:
+        return question_tokens.generate(kind, seed, params)
+    if seed is None:
+        seed = question_tokens.new_seed()
+    return dict(question_tokens.generate(kind, seed, params), token=question_tokens.issue(kind, seed, params))
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """Histogramele de latență și statisticile cache-urilor, în formatul text Prometheus"""
+    return PlainTextResponse(metrics.render({
+        "grade_cache": grade_cache.stats(),
+        "question_store": question_store.stats(),
+        "results_writer": results_store.stats(),
+    }), media_type="text/plain; version=0.0.4")
+
+@app.get("/metrics/grade-cache")
+def grade_cache_metrics():
+    """Statistici pentru cache-ul de evaluări (hit-uri, miss-uri, evacuări, expirări)"""
+    return grade_cache.stats()
+
+@app.get("/metrics/question-store")
+def question_store_metrics():
+    """Statistici pentru memoizarea întrebărilor generate cu seed"""
+    return question_store.stats()
+
+@app.get("/metrics/results-writer")
+def results_writer_metrics():
+    """Starea scriitorului de rezultate (în așteptare, scrise, loturi, erori)"""
+    return results_store.stats()
+
+@app.get("/stats/{user_id}")
+def user_stats(user_id: int, request: Request):
+    """Statisticile de profil (total, medii, ultimele scoruri, serii) din agregatele incrementale; doar pentru profile.php"""
+    _require_internal(request)
+    return results_store.user_stats(user_id)
+
+@app.get("/export/results")
+def export_results(request: Request, format: str = "ndjson", user_id: int | None = None, topic: str | None = None,
+                   date_from: str | None = None, date_to: str | None = None, payload: bool = False):
+    """
+    Istoricul de rezultate în flux (NDJSON, CSV sau Arrow IPC), filtrat după utilizator, capitol și dată.
+    Conține rezultatele tuturor utilizatorilor: doar cu secretul intern (SMARTEST_INTERNAL_SECRET).
+    """
+    _require_internal(request)
+    try:
+        chunks = results_export.export(format, user_id, topic, date_from, date_to, payload)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return StreamingResponse(chunks, media_type=results_export.FORMATS[format], headers={
+        "Content-Disposition": f'attachment; filename="{results_export.filename(format)}"'})
+
 @app.get("/nlp/status")
 def nlp_status():
     """Verifică statusul NLP"""
@@ -81,75 +250,79 @@ def nlp_status():
         }
 
 @app.get("/nash/generate")
-def generate(rows: int = 3, cols: int = 3, ensure: str = "atleast_one", seed: int | None = None):
+def generate(rows: int = 3, cols: int = 3, ensure: str = "atleast_one", seed: int | None = None,
+             compact: bool = False):
     """
     rows, cols: dimensiunea jocului
     ensure: "any" | "atleast_one" | "unique" | "none"
     seed: întrebări reproducibile
+    compact: adaugă "token" (semnat); la evaluare se poate trimite token-ul în locul payload-ului
     """
-    return sm.build_question_payload(rows=rows, cols=cols, ensure=ensure, seed=seed)
+    return _generate("nash", seed, {"rows": rows, "cols": cols, "ensure": ensure}, compact)
 
 @app.post("/nash/grade")
-def grade(ap: AnswerPayload):
+def grade(ap: AnswerPayload, request: Request):
     """
     Body: { "payload": <json intrebare>, "answer": "R2 C1" | "2 1" | "none" }
     """
-    return sm.grade_answer(ap.answer, ap.payload)
+    return _grade("nash", ap, sm.grade_answer, request)
 
 @app.get("/minmax/generate")
 def generate_minmax(depth: int = 3, branching_factor: int = 2, 
                    value_min: int = -10, value_max: int = 10, 
-                   seed: int | None = None):
+                   seed: int | None = None, compact: bool = False):
     """
     depth: adâncimea arborelui
     branching_factor: factorul de ramificare (numărul de copii per nod)
     value_min, value_max: intervalul valorilor pentru frunze
     seed: întrebări reproducibile
+    compact: adaugă "token" (semnat) pentru evaluare fără payload
     """
-    return mm.build_question_payload(
-        depth=depth,
-        branching_factor=branching_factor,
-        value_range=(value_min, value_max),
-        seed=seed
-    )
+    return _generate("minmax", seed, {"depth": depth, "branching_factor": branching_factor,
+                                      "value_min": value_min, "value_max": value_max}, compact)
 
 @app.post("/minmax/grade")
-def grade_minmax(ap: AnswerPayload):
+def grade_minmax(ap: AnswerPayload, request: Request):
     """
     Body: { "payload": <json intrebare>, "answer": "5 4" | "valoare=5, frunze=4" }
     """
-    return mm.grade_answer(ap.answer, ap.payload)
+    return _grade("minmax", ap, mm.grade_answer, request)
 
 @app.get("/problem1/generate")
-def generate_problem1(problem_type: str | None = None, seed: int | None = None):
+def generate_problem1(problem_type: str | None = None, seed: int | None = None, question_kind: str | None = None,
+                      compact: bool = False):
     """
     problem_type: "n-queens" | "hanoi" | "graph_coloring" | "knight_tour" | None (aleatoriu)
     seed: întrebări reproducibile
+    question_kind: "strategy" | "min_moves" (numărul minim de mutări, doar pentru hanoi) | None (= "strategy")
+    compact: adaugă "token" (semnat) pentru evaluare fără payload
     """
-    return p1.build_question_payload(problem_type=problem_type, seed=seed)
+    return _generate("problem1", seed, {"problem_type": problem_type, "question_kind": question_kind}, compact)
 
 @app.post("/problem1/grade")
-def grade_problem1(ap: AnswerPayload):
+def grade_problem1(ap: AnswerPayload, request: Request):
     """
     Body: { "payload": <json intrebare>, "answer": "Backtracking" | "1" }
     """
-    return p1.grade_answer(ap.answer, ap.payload)
+    return _grade("problem1", ap, p1.grade_answer, request)
 
 @app.get("/csp/generate")
-def generate_csp(problem_type: str = "simple", optimization: str = "FC", seed: int | None = None):
+def generate_csp(problem_type: str = "simple", optimization: str = "FC", seed: int | None = None,
+                 compact: bool = False):
     """
     problem_type: "simple" | "graph_coloring" | "sudoku"
     optimization: "FC" | "MRV" | "AC-3" (nu este folosit pentru generare, doar pentru referință)
     seed: întrebări reproducibile
+    compact: adaugă "token" (semnat) pentru evaluare fără payload
     """
-    return csp.build_question_payload(problem_type=problem_type, optimization=optimization, seed=seed)
+    return _generate("csp", seed, {"problem_type": problem_type, "optimization": optimization}, compact)
 
 @app.post("/csp/grade")
-def grade_csp(ap: AnswerPayload):
+def grade_csp(ap: AnswerPayload, request: Request):
     """
     Body: { "payload": <json intrebare>, "answer": "Forward Checking" | "1" }
     """
-    return csp.grade_answer(ap.answer, ap.payload)
+    return _grade("csp", ap, csp.grade_answer, request)
 
 @app.get("/theory/topics")
 def get_theory_topics(theory_file: str = "example_theory.json"):
@@ -166,7 +339,8 @@ def get_theory_topics(theory_file: str = "example_theory.json"):
 def generate_theory(topic_id: str | None = None, 
                    question_type: str | None = None,
                    theory_file: str = "example_theory.json",
-                   seed: int | None = None):
+                   seed: int | None = None,
+                   compact: bool = False):
     """
     Generează o întrebare bazată pe teoria din cursuri.
     
@@ -174,9 +348,11 @@ def generate_theory(topic_id: str | None = None,
     question_type: Tipul întrebării ("multiple_choice", "true_false", "fill_blank", "short_answer"). Dacă None, alege aleatoriu.
     theory_file: Numele fișierului cu teoria (default: "example_theory.json")
     seed: Seed pentru reproducibilitate
+    compact: adaugă "token" (semnat) pentru evaluare fără payload
     """
     try:
-        return theory_q.build_question_payload(topic_id, question_type, theory_file, seed)
+        return _generate("theory", seed, {"topic_id": topic_id, "question_type": question_type,
+                                          "theory_file": theory_file}, compact)
     except FileNotFoundError as e:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail=str(e))
@@ -188,12 +364,12 @@ def generate_theory(topic_id: str | None = None,
         raise HTTPException(status_code=500, detail=f"Error generating question: {str(e)}")
 
 @app.post("/theory/grade")
-def grade_theory(ap: AnswerPayload):
+def grade_theory(ap: AnswerPayload, request: Request):
     """
     Evaluează răspunsul la o întrebare de teorie.
     Body: { "payload": <json intrebare>, "answer": <raspuns utilizator> }
     """
-    return theory_g.grade_answer(ap.answer, ap.payload)
+    return _grade("theory", ap, theory_g.grade_answer, request)
 
 
 @app.post("/chat/ask")
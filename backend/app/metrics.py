@@ -0,0 +1,167 @@
+"""
+SmarTest — măsurători de timp pentru rute și secțiunile costisitoare din interiorul lor
+Histogramele sunt expuse în formatul text Prometheus (GET /metrics); secțiunile (span-urile)
+măsurate în timpul unei cereri apar și în header-ul Server-Timing al răspunsului.
+
+    with metrics.span("encode"):
+        ...
+
+    @metrics.timed("theory_multiple_choice")
+    def _grade_multiple_choice(...): ...
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import bisect
+import functools
+import math
+import threading
+import time
+
+# secunde; acoperă de la un lookup în cache până la încărcarea modelului NLP
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+SPAN_METRIC = "smartest_span_seconds"
+
+_HELP = {
+    "smartest_http_request_duration_seconds": "Latența cererilor HTTP, pe rută",
+    SPAN_METRIC: "Durata secțiunilor instrumentate (încărcare model, encode, evaluare, generare)",
+}
+
+# ---------- histograme ----------
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # ultimul = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Registry:
+    """Histograme indexate după (nume, etichete); un singur lock, observațiile sunt O(log bucket-uri)"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[Tuple[Tuple[str, str], ...], Histogram]] = {}
+        self._buckets: Dict[str, Tuple[float, ...]] = {}
+
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS, **labels: Any) -> None:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self._buckets.setdefault(name, buckets))
+            histogram.observe(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._buckets.clear()
+
+    def render(self) -> List[str]:
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._histograms):
+                lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (math.inf,), histogram.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == math.inf else f"{bound:g}"
+                        lines.append(f"{name}_bucket{_labels(key + (('le', le),))} {cumulative}")
+                    lines.append(f"{name}_sum{_labels(key)} {histogram.sum:.6f}")
+                    lines.append(f"{name}_count{_labels(key)} {histogram.count}")
+        return lines
+
+
+def _labels(pairs: Tuple[Tuple[str, str], ...]) -> str:
+    if not pairs:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+_REGISTRY = Registry()
+
+# span-urile cererii curente (None în afara unei cereri HTTP, ex. teste sau CLI)
+_REQUEST_SPANS: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("request_spans", default=None)
+
+# ---------- API ----------
+
+def observe(name: str, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS, **labels: Any) -> None:
+    _REGISTRY.observe(name, value, buckets, **labels)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Măsoară blocul: histograma smartest_span_seconds{span=name} + Server-Timing pentru cererea curentă"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _REGISTRY.observe(SPAN_METRIC, elapsed, span=name)
+        spans = _REQUEST_SPANS.get()
+        if spans is not None:
+            spans.append((name, elapsed))
+
+
+def timed(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator echivalent cu `with span(name)` în jurul întregii funcții"""
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_request() -> List[Tuple[str, float]]:
+    """Începe colectarea span-urilor pentru cererea curentă (apelat de middleware)"""
+    spans: List[Tuple[str, float]] = []
+    _REQUEST_SPANS.set(spans)
+    return spans
+
+
+def server_timing(spans: List[Tuple[str, float]], total: float) -> str:
+    """Header-ul Server-Timing: total + fiecare span, însumat pe nume (desc = numărul de apeluri)"""
+    merged: Dict[str, List[float]] = {}
+    for name, elapsed in spans:
+        entry = merged.setdefault(name, [0.0, 0])
+        entry[0] += elapsed
+        entry[1] += 1
+    parts = [f"total;dur={total * 1000:.2f}"]
+    for name, (elapsed, calls) in merged.items():
+        parts.append(f'{name};dur={elapsed * 1000:.2f}' + (f';desc="x{calls}"' if calls > 1 else ""))
+    return ", ".join(parts)
+
+
+def render(gauges: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+    """
+    Textul Prometheus: histogramele + valorile numerice din dicționarele de statistici primite
+    (ex. {"grade_cache": grade_cache.stats()} -> smartest_grade_cache_hits ...).
+    """
+    lines = _REGISTRY.render()
+    for prefix, values in (gauges or {}).items():
+        for key, value in values.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            name = f"smartest_{prefix}_{key}"
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def clear() -> None:
+    _REGISTRY.clear()
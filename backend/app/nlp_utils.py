@@ -1,26 +1,44 @@
 """
 Modul pentru procesare de limbaj natural (NLP) pentru evaluarea răspunsurilor.
 Folosește similaritate semantică pentru a înțelege răspunsurile naturale.
+
+Encoder-ul din spatele get_semantic_model() se alege prin variabile de mediu:
+    SMARTEST_ENCODER      "sentence-transformers" (implicit; modelul se descarcă la prima utilizare)
+                          sau "hashed" (vectori de n-grame hash-uite: local, determinist, fără rețea)
+    SMARTEST_ENCODER_DIM  dimensiunea vectorilor "hashed" (implicit 384, ca MiniLM)
 """
 
 import re
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Callable, Union
 import logging
+import os
+import zlib
+
+import app.log_config as log_config
+import app.metrics as metrics
 
-# Configurare logging
-logging.basicConfig(level=logging.INFO)
+# Handler-ele și nivelul se configurează o singură dată în main.py (app.log_config.configure)
 logger = logging.getLogger(__name__)
 
 # Flag pentru a verifica dacă bibliotecile NLP sunt disponibile
 NLP_AVAILABLE = False
 SEMANTIC_SIMILARITY_AVAILABLE = False
 
+DEFAULT_ENCODER = "sentence-transformers"
+ENCODER = (os.environ.get("SMARTEST_ENCODER") or DEFAULT_ENCODER).strip().lower()
+try:
+    ENCODER_DIM = int(os.environ.get("SMARTEST_ENCODER_DIM", 384))
+except ValueError:
+    ENCODER_DIM = 384
+
 try:
-    from sentence_transformers import SentenceTransformer
     import numpy as np
-    from sklearn.metrics.pairwise import cosine_similarity
+    if ENCODER == DEFAULT_ENCODER:
+        from sentence_transformers import SentenceTransformer
+        logger.info("Sentence Transformers loaded successfully")
+    else:
+        logger.info("Semantic encoder: %s", ENCODER)
     SEMANTIC_SIMILARITY_AVAILABLE = True
-    logger.info("Sentence Transformers loaded successfully")
 except ImportError:
     logger.warning("Sentence Transformers not available. Install with: pip install sentence-transformers scikit-learn")
     try:
@@ -35,10 +53,75 @@ except ImportError:
 # Modelul pentru similaritate semantică (se încarcă la prima utilizare)
 _semantic_model = None
 
+# ---------- encodere locale ----------
+
+class HashedNgramEncoder:
+    """
+    Encoder local cu interfața lui SentenceTransformer (encode, get_sentence_embedding_dimension).
+    Fiecare text devine suma cuvintelor și a n-gramelor lor de caractere (cuvinte bordate cu spații),
+    proiectate cu crc32 (cu semn) într-un vector de `dim` componente, normalizat L2.
+    Determinist între procese și mașini: nu folosește hash()-ul Python, care e randomizat.
+    """
+    def __init__(self, dim: int = 384, ngram_range: Tuple[int, int] = (3, 5)):
+        self.dim = max(8, dim)
+        self.ngram_range = ngram_range
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def _features(self, text: str) -> List[str]:
+        low, high = self.ngram_range
+        features = []
+        for word in re.findall(r"\w+", text.lower()):
+            features.append(word)
+            padded = f" {word} "
+            for n in range(low, high + 1):
+                features.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+        return features
+
+    def encode(self, sentences: Union[str, List[str]], batch_size: int = 32, show_progress_bar: bool = False,
+               convert_to_numpy: bool = True, **kwargs: Any):
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                h = zlib.crc32(feature.encode("utf-8"))
+                vectors[row, h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+            norm = np.linalg.norm(vectors[row])
+            if norm:
+                vectors[row] /= norm
+        return vectors[0] if single else vectors
+
+
+# nume -> fabrică; "sentence-transformers" e tratat separat în get_semantic_model
+ENCODERS: Dict[str, Callable[[], Any]] = {
+    "hashed": lambda: HashedNgramEncoder(ENCODER_DIM),
+}
+
+
+_unknown_encoder_reported = False
+
+
+def register_encoder(name: str, factory: Callable[[], Any]) -> None:
+    """Înregistrează un encoder (obiect cu .encode(texts) -> matrice), selectabil prin SMARTEST_ENCODER"""
+    ENCODERS[name.strip().lower()] = factory
+
 
 def get_semantic_model():
     """Încarcă modelul pentru similaritate semantică (lazy loading)"""
-    global _semantic_model
+    global _semantic_model, _unknown_encoder_reported
+    if _semantic_model is None and SEMANTIC_SIMILARITY_AVAILABLE and ENCODER != DEFAULT_ENCODER:
+        factory = ENCODERS.get(ENCODER)
+        if factory is None:
+            if not _unknown_encoder_reported:
+                logger.error("Unknown SMARTEST_ENCODER %r (known: %s), using fallback methods",
+                             ENCODER, ", ".join([DEFAULT_ENCODER, *ENCODERS]))
+                _unknown_encoder_reported = True
+            return None
+        with metrics.span("model_load"):
+            _semantic_model = factory()
+        return _semantic_model
     if _semantic_model is None and SEMANTIC_SIMILARITY_AVAILABLE:
         try:
             import ssl
@@ -76,7 +159,8 @@ def get_semantic_model():
             # dar modelul funcționează corect când este folosit (vezi "Batches: 100%" în log-uri)
             # Deci ignorăm eroarea de inițializare dacă apare, modelul va funcționa la utilizare
             try:
-                _semantic_model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
+                with metrics.span("model_load"):
+                    _semantic_model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
                 logger.info("Semantic model loaded: paraphrase-multilingual-MiniLM-L12-v2")
             except NotImplementedError as meta_error:
                 # Eroarea cu meta tensor apare la inițializare, dar modelul funcționează la utilizare
@@ -103,6 +187,18 @@ def get_semantic_model():
     return _semantic_model
 
 
+def _encode(model, texts: List[str]):
+    """model.encode măsurat: durata (span "encode") și dimensiunea lotului"""
+    metrics.observe("smartest_encode_batch_size", len(texts), metrics.SIZE_BUCKETS)
+    with metrics.span("encode"):
+        return model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+
+
+def _cosine(a, b) -> float:
+    norm = float(np.linalg.norm(a) * np.linalg.norm(b))
+    return float(np.dot(a, b)) / norm if norm else 0.0
+
+
 def semantic_similarity(text1: str, text2: str) -> float:
     """
     Calculează similaritatea semantică între două texte (0-1).
@@ -135,10 +231,10 @@ def semantic_similarity(text1: str, text2: str) -> float:
         try:
             # Încarcă modelul dacă nu este deja încărcat (lazy loading la utilizare efectivă)
             # Aceasta rezolvă problema cu meta tensor - modelul se încarcă corect când este folosit
-            logger.info(f"Using NLP model for semantic similarity: '{text1[:30]}...' vs '{text2[:30]}...'")
-            embeddings = model.encode([text1, text2], convert_to_numpy=True, show_progress_bar=False)
-            similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
-            logger.info(f"NLP semantic similarity result: {similarity:.3f}")
+            embeddings = _encode(model, [text1, text2])
+            similarity = _cosine(embeddings[0], embeddings[1])
+            log_config.hot_event(logger, "similarity", "method=model score=%.3f a=%r b=%r",
+                                 similarity, text1[:30], text2[:30])
             return float(similarity)
         except Exception as e:
             logger.warning(f"Error computing semantic similarity: {e}")
@@ -148,8 +244,8 @@ def semantic_similarity(text1: str, text2: str) -> float:
             try:
                 model = get_semantic_model()
                 if model:
-                    embeddings = model.encode([text1, text2], convert_to_numpy=True, show_progress_bar=False)
-                    similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
+                    embeddings = _encode(model, [text1, text2])
+                    similarity = _cosine(embeddings[0], embeddings[1])
                     return float(similarity)
             except:
                 pass
@@ -163,12 +259,15 @@ def semantic_similarity(text1: str, text2: str) -> float:
             token_sort_ratio = fuzz.token_sort_ratio(text1, text2) / 100.0
             # Media ponderată
             similarity = (ratio * 0.3 + partial_ratio * 0.4 + token_sort_ratio * 0.3)
+            log_config.hot_event(logger, "similarity", "method=fuzzy score=%.3f", similarity)
             return similarity
         except Exception as e:
             logger.warning(f"Error in fuzzy matching: {e}")
     
     # Fallback final - Levenshtein simplu
-    return _simple_similarity(text1, text2)
+    similarity = _simple_similarity(text1, text2)
+    log_config.hot_event(logger, "similarity", "method=simple score=%.3f", similarity)
+    return similarity
 
 
 def _simple_similarity(text1: str, text2: str) -> float:
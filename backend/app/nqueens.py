@@ -0,0 +1,137 @@
+"""
+SmarTest — numărarea exactă a soluțiilor n-queens pe bitboard-uri
+Simetria prin oglindire înjumătățește căutarea; subarborii (primele două rânduri) pot fi
+împărțiți pe procese cu ProcessPoolExecutor. Pentru n <= 15 răspunsul vine din tabel.
+
+Benchmark (din backend/):
+    python -m app.nqueens --max-n 12 --workers 4
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import argparse
+import sys
+import time
+
+# numărul de soluții (OEIS A000170) pentru dimensiunile uzuale, răspuns instant
+KNOWN_COUNTS = {
+    1: 1, 2: 0, 3: 0, 4: 2, 5: 10, 6: 4, 7: 40, 8: 92, 9: 352, 10: 724,
+    11: 2680, 12: 14200, 13: 73712, 14: 365596, 15: 2279184,
+}
+
+# sub acest n, pornirea proceselor costă mai mult decât căutarea
+PARALLEL_MIN_N = 11
+
+# ---------- căutare pe bitboard ----------
+
+def _count_from(full: int, cols: int, d1: int, d2: int) -> int:
+    """Numără completările: cols/d1/d2 = coloanele și diagonalele atacate pe rândul curent"""
+    if cols == full:
+        return 1
+    total = 0
+    free = full & ~(cols | d1 | d2)
+    while free:
+        bit = free & -free
+        free ^= bit
+        total += _count_from(full, cols | bit, ((d1 | bit) << 1) & full, (d2 | bit) >> 1)
+    return total
+
+
+def _count_task(task: Tuple[int, int, int]) -> int:
+    """Un subarbore: regina de pe rândul 0 în coloana c0, cea de pe rândul 1 în c1"""
+    n, c0, c1 = task
+    full = (1 << n) - 1
+    b0, b1 = 1 << c0, 1 << c1
+    cols = b0 | b1
+    d1 = ((((b0 << 1) & full) | b1) << 1) & full
+    d2 = ((b0 >> 1) | b1) >> 1
+    return _count_from(full, cols, d1, d2)
+
+
+def split_tasks(n: int) -> List[Tuple[Tuple[int, int, int], int]]:
+    """
+    Subarborii de căutat cu ponderea lor, după simetria prin oglindire:
+    pe rândul 0 doar jumătatea stângă (pondere 2); pentru n impar, coloana din mijloc
+    cu regina de pe rândul 1 în jumătatea stângă (tot pondere 2).
+    """
+    half = n // 2
+    tasks = []
+    for c0 in range(half):
+        for c1 in range(n):
+            if abs(c1 - c0) > 1:
+                tasks.append(((n, c0, c1), 2))
+    if n % 2:
+        for c1 in range(half - 1):
+            tasks.append(((n, half, c1), 2))
+    return tasks
+
+
+def count_solutions(n: int, workers: Optional[int] = None, use_table: bool = True) -> int:
+    """
+    Numărul exact de soluții pentru n regine.
+    workers: numărul de procese (None/1 = secvențial; folosit doar de la PARALLEL_MIN_N în sus).
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    if use_table and n in KNOWN_COUNTS:
+        return KNOWN_COUNTS[n]
+    if n < 4:
+        return 1 if n == 1 else 0
+    if workers and workers > 1 and n >= PARALLEL_MIN_N:
+        return _count_parallel(n, workers)
+    return _count_cached(n)
+
+
+@lru_cache(maxsize=None)
+def _count_cached(n: int) -> int:
+    return sum(weight * _count_task(task) for task, weight in split_tasks(n))
+
+
+def _count_parallel(n: int, workers: int) -> int:
+    tasks = split_tasks(n)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        counts = pool.map(_count_task, [task for task, _ in tasks], chunksize=max(1, len(tasks) // (4 * workers)))
+        return sum(weight * count for (_, weight), count in zip(tasks, counts))
+
+# ---------- benchmark ----------
+
+def benchmark(min_n: int = 4, max_n: int = 12, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Măsoară căutarea completă (fără tabel) pentru fiecare n: soluții și soluții/secundă"""
+    rows = []
+    for n in range(min_n, max_n + 1):
+        _count_cached.cache_clear()
+        start = time.perf_counter()
+        count = count_solutions(n, workers=workers, use_table=False)
+        elapsed = time.perf_counter() - start
+        expected = KNOWN_COUNTS.get(n)
+        rows.append({
+            "n": n,
+            "solutions": count,
+            "seconds": round(elapsed, 4),
+            "solutions_per_second": round(count / elapsed, 1) if elapsed > 0 else None,
+            "matches_table": None if expected is None else count == expected,
+        })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pentru numărarea soluțiilor n-queens")
+    parser.add_argument("--min-n", type=int, default=4)
+    parser.add_argument("--max-n", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=None, help="procese pentru n >= %d" % PARALLEL_MIN_N)
+    args = parser.parse_args(argv)
+
+    ok = True
+    print(f"{'n':>3} {'soluții':>10} {'secunde':>9} {'soluții/s':>12}")
+    for row in benchmark(args.min_n, args.max_n, args.workers):
+        print(f"{row['n']:>3} {row['solutions']:>10} {row['seconds']:>9} {row['solutions_per_second'] or '-':>12}")
+        if row["matches_table"] is False:
+            print(f"    diferă de tabel: așteptat {KNOWN_COUNTS[row['n']]}")
+            ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
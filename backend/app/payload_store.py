@@ -0,0 +1,207 @@
+"""
+SmarTest — stocare comprimată și deduplicată a payload-urilor (results.payload, quizzes.payload)
+Tabela questions este adresată după conținut: hash = SHA-256 al JSON-ului canonic, data = JSON-ul
+comprimat zlib. Aceeași întrebare rezolvată de toată clasa se stochează o singură dată; rândurile din
+results/quizzes păstrează doar payload_hash. Formatul zlib este cel citit de gzuncompress() din PHP.
+
+Raport de dimensiune pe date sintetice:
+    python -m app.payload_store [--results 100000] [--questions 2000]
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any
+from collections import OrderedDict
+import argparse
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import zlib
+
+COMPRESSION_LEVEL = 6  # nivelul implicit din PHP gzcompress()
+
+QUESTIONS_DDL = """CREATE TABLE IF NOT EXISTS questions (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    raw_size INTEGER NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+)"""
+
+# ---------- codare ----------
+
+def canonical_json(payload: Any) -> str:
+    """Forma canonică: chei sortate, fără spații, UTF-8 nescăpat (aceeași întrebare -> același hash)"""
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except ValueError:
+            return payload  # text care nu e JSON: se stochează așa cum e
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compress(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def inflate(data: bytes) -> str:
+    return zlib.decompress(data).decode("utf-8")
+
+# ---------- scriere ----------
+
+class BlobWriter:
+    """
+    Inserează blob-uri în questions; ține minte hash-urile deja scrise (LRU mărginit), astfel încât
+    o întrebare văzută recent nu mai este comprimată din nou.
+    """
+    def __init__(self, max_known: int = 8192):
+        self.max_known = max_known
+        self._known: "OrderedDict[str, None]" = OrderedDict()
+        self.stored = self.deduplicated = 0
+
+    def store(self, conn: sqlite3.Connection, payload: Any) -> Optional[str]:
+        """Hash-ul payload-ului (None pentru payload lipsă); apelantul deține tranzacția"""
+        if payload is None:
+            return None
+        text = canonical_json(payload)
+        key = content_hash(text)
+        if key in self._known:
+            self._known.move_to_end(key)
+            self.deduplicated += 1
+            return key
+        cursor = conn.execute("INSERT OR IGNORE INTO questions (hash, data, raw_size) VALUES (?, ?, ?)",
+                              (key, compress(text), len(text.encode("utf-8"))))
+        if cursor.rowcount:
+            self.stored += 1
+        else:
+            self.deduplicated += 1
+        self._known[key] = None
+        while len(self._known) > self.max_known:
+            self._known.popitem(last=False)
+        return key
+
+    def forget(self) -> None:
+        """După un ROLLBACK hash-urile din lotul anulat nu mai există în tabel"""
+        self._known.clear()
+
+# ---------- citire ----------
+
+def load(conn: sqlite3.Connection, payload: Optional[str], payload_hash: Optional[str]) -> Any:
+    """Payload-ul unui rând din results/quizzes: din blob dacă are hash, altfel din coloana inline"""
+    if payload_hash:
+        row = conn.execute("SELECT data FROM questions WHERE hash = ?", (payload_hash,)).fetchone()
+        if row is not None:
+            payload = inflate(row[0])
+    if not payload:
+        return None
+    try:
+        return json.loads(payload)
+    except ValueError:
+        return None
+
+
+def migrate(conn: sqlite3.Connection, table: str, batch_size: int = 1000) -> Tuple[int, int]:
+    """
+    Mută payload-urile inline din `table` (results sau quizzes) în questions, pe loturi de câte o tranzacție.
+    Returnează (rânduri migrate, blob-uri noi). Spațiul se recuperează abia după VACUUM.
+    """
+    if table not in ("results", "quizzes"):
+        raise ValueError(f"Unknown table: {table}")
+    # quizzes.payload e NOT NULL în schema frontend-ului: acolo coloana inline devine ''
+    empty = "''" if table == "quizzes" else "NULL"
+    writer = BlobWriter()
+    migrated = 0
+    while True:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                f"SELECT id, payload FROM {table} WHERE payload_hash IS NULL AND payload IS NOT NULL "
+                f"AND payload != '' LIMIT ?", (batch_size,)
+            ).fetchall()
+            updates = [(writer.store(conn, payload), row_id) for row_id, payload in rows]
+            conn.executemany(f"UPDATE {table} SET payload = {empty}, payload_hash = ? WHERE id = ?", updates)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        migrated += len(rows)
+        if len(rows) < batch_size:
+            return migrated, writer.stored
+
+# ---------- raport pe date sintetice ----------
+
+def _synthetic_question(rnd: random.Random, qid: int) -> Dict[str, Any]:
+    """Aproximează un payload MinMax: text, arbore ASCII, valori și explicație"""
+    leaves = [rnd.randint(-20, 20) for _ in range(8)]
+    tree = "\n".join("    " * depth + f"{'MAX' if depth % 2 == 0 else 'MIN'} nod_{depth}_{i}"
+                     for depth in range(4) for i in range(2 ** depth))
+    return {
+        "id": qid,
+        "type": "minmax",
+        "question_text": "Pentru arborele de mai jos, care este valoarea rădăcinii și câte frunze "
+                         "sunt vizitate folosind MinMax cu optimizarea Alpha-Beta?",
+        "tree_ascii": tree,
+        "leaves": leaves,
+        "root_value": max(leaves[:4]) if rnd.random() < 0.5 else min(leaves[4:]),
+        "explanation": " ".join(f"La nodul {i} comparăm alpha={rnd.randint(-20, 20)} cu beta={rnd.randint(-20, 20)}."
+                                for i in range(12)),
+    }
+
+
+def _database_size(path: str) -> int:
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p))
+
+
+def report(results: int = 100_000, questions: int = 2000, seed: int = 0) -> Dict[str, Any]:
+    """Dimensiunea bazei cu payload inline vs. după migrare + VACUUM, pe același set sintetic"""
+    rnd = random.Random(seed)
+    pool = [json.dumps(_synthetic_question(rnd, i), ensure_ascii=False) for i in range(questions)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.db")
+        conn = sqlite3.connect(path, isolation_level=None)
+        conn.execute("CREATE TABLE results (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL, "
+                     "topic TEXT NOT NULL, score INTEGER NOT NULL, feedback TEXT, payload TEXT, payload_hash TEXT, "
+                     "created_at DATETIME DEFAULT CURRENT_TIMESTAMP)")
+        conn.execute(QUESTIONS_DDL)
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO results (user_id, topic, score, feedback, payload) VALUES (?, 'MinMax', ?, 'Corect.', ?)",
+            ((rnd.randint(1, 500), rnd.choice((0, 50, 100)), rnd.choice(pool)) for _ in range(results)),
+        )
+        conn.execute("COMMIT")
+        conn.execute("VACUUM")
+        before = _database_size(path)
+
+        start = time.perf_counter()
+        migrated, blobs = migrate(conn, "results")
+        elapsed = time.perf_counter() - start
+        conn.execute("VACUUM")
+        after = _database_size(path)
+        conn.close()
+    return {"results": migrated, "questions": blobs, "bytes_before": before, "bytes_after": after,
+            "reduction": round(1 - after / before, 4), "migrate_seconds": round(elapsed, 2)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Raport de dimensiune pentru stocarea comprimată a payload-urilor")
+    parser.add_argument("--results", type=int, default=100_000)
+    parser.add_argument("--questions", type=int, default=2000, help="întrebări distincte în setul sintetic")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    r = report(args.results, args.questions, args.seed)
+    print(f"{r['results']} rezultate, {r['questions']} întrebări distincte")
+    print(f"inline: {r['bytes_before'] / 1e6:.1f} MB -> comprimat+deduplicat: {r['bytes_after'] / 1e6:.1f} MB "
+          f"({r['reduction']:.1%} mai puțin), migrare în {r['migrate_seconds']}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,490 @@
+"""
+SmarTest — solvere pentru problemele din smartest_problem1
+Fiecare strategie din PROBLEMS are (unde are sens) un solver real care raportează noduri și timp;
+strategia recomandată este cea cu efortul măsurat minim pe instanța generată.
+Rapoartele care depind doar de parametrii instanței (n-queens, Hanoi, turul calului) sunt memorate:
+spațiul acestor parametri e mic, iar solverele cu buget depășit costă zeci de milisecunde per rulare.
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any, Callable, Iterator, Sequence
+from collections import Counter
+from functools import lru_cache, wraps
+import copy
+import heapq
+import math
+import random
+import time
+
+import app.graph_coloring as graph_coloring
+import app.hanoi as hanoi
+import app.knight_tour as knight_tour
+
+# buget comun de noduri (plasări, mutări, stări expandate, pași de căutare locală, evaluări)
+SOLVER_MAX_NODES = 20_000
+
+# rapoarte memorate per funcție de rezolvare (instanțe distincte)
+REPORT_CACHE_SIZE = 512
+
+# după o rezolvare cu N noduri, celelalte solvere primesc cel mult RELATIVE_BUDGET * N noduri
+RELATIVE_BUDGET = 10
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+class _Counter:
+    """Contor de noduri cu buget"""
+    def __init__(self, max_nodes: int):
+        self.max_nodes = max_nodes
+        self.nodes = 0
+
+    def tick(self, k: int = 1) -> None:
+        self.nodes += k
+        if self.nodes > self.max_nodes:
+            raise _BudgetExceeded()
+
+
+def _run(solver: Callable[[_Counter], Dict[str, Any]], max_nodes: int) -> Dict[str, Any]:
+    """Rulează un solver, măsoară timpul și transformă depășirea bugetului în solved=False"""
+    counter = _Counter(max_nodes)
+    start = time.perf_counter()
+    try:
+        result = solver(counter)
+        complete = True
+    except _BudgetExceeded:
+        result = {"solved": False}
+        complete = False
+    elapsed = time.perf_counter() - start
+    return {
+        "measured": True,
+        "complete": complete,
+        **result,
+        "nodes": min(counter.nodes, max_nodes),
+        "time_ms": round(elapsed * 1000, 3),
+    }
+
+
+def _not_measured() -> Dict[str, Any]:
+    return {"measured": False}
+
+
+def _run_bounded(solvers: Dict[str, Callable[[_Counter], Dict[str, Any]]], max_nodes: int,
+                 run_order: Sequence[str] = ()) -> Dict[str, Dict[str, Any]]:
+    """
+    Rulează solverele (întâi cele din run_order, cele ieftine) cu un buget care scade: după prima rezolvare
+    (optimă, unde contează) cu N noduri, următoarele se opresc la RELATIVE_BUDGET * N noduri. Un solver oprit
+    nu putea fi recomandat oricum (recommend_strategy vrea mai puține noduri), dar fără limită costa până la
+    sute de milisecunde (IDDFS pe Hanoi, algoritmul genetic pe 8 regine). Raportul păstrează ordinea din solvers.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    budget = max_nodes
+    for name in [*run_order, *(s for s in solvers if s not in run_order)]:
+        result = results[name] = _run(solvers[name], budget)
+        if result["solved"] and result.get("optimal", True):
+            budget = min(budget, max(1, RELATIVE_BUDGET * result["nodes"]))
+    return {name: results[name] for name in solvers}
+
+
+def _memoized(solve: Callable[..., Dict[str, Dict[str, Any]]]) -> Callable[..., Dict[str, Dict[str, Any]]]:
+    """
+    Memorează raportul per parametri (solverele sunt deterministe: rng-urile derivă din instanță);
+    fiecare apel primește o copie, deci apelantul poate modifica raportul. time_ms e cel din prima rulare.
+    """
+    cached = lru_cache(maxsize=REPORT_CACHE_SIZE)(solve)
+
+    @wraps(solve)
+    def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Dict[str, Any]]:
+        return copy.deepcopy(cached(*args, **kwargs))
+
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+# ---------- n-queens ----------
+
+def _queens_backtracking(n: int, counter: _Counter) -> Dict[str, Any]:
+    """Backtracking rând cu rând pe bitmask-uri (coloane, diagonale)"""
+    full = (1 << n) - 1
+    cols = [0] * n
+
+    def place(row: int, used: int, d1: int, d2: int) -> bool:
+        if row == n:
+            return True
+        free = full & ~(used | d1 | d2)
+        while free:
+            bit = free & -free
+            free ^= bit
+            counter.tick()
+            cols[row] = bit.bit_length() - 1
+            if place(row + 1, used | bit, ((d1 | bit) << 1) & full, (d2 | bit) >> 1):
+                return True
+        return False
+
+    solved = place(0, 0, 0, 0)
+    return {"solved": solved, "solution": cols if solved else None}
+
+
+def _queens_csp(n: int, counter: _Counter) -> Dict[str, Any]:
+    """CSP: un rând = o variabilă, domeniu = bitmask de coloane, forward checking + MRV"""
+    full = (1 << n) - 1
+    cols = [-1] * n
+
+    def place(domains: List[int], left: int) -> bool:
+        if not left:
+            return True
+        row = min((r for r in range(n) if cols[r] < 0), key=lambda r: domains[r].bit_count())
+        free = domains[row]
+        while free:
+            bit = free & -free
+            free ^= bit
+            counter.tick()
+            c = bit.bit_length() - 1
+            cols[row] = c
+            child = list(domains)
+            ok = True
+            for r in range(n):
+                if cols[r] < 0:
+                    d = row - r if row > r else r - row
+                    mask = bit | ((bit << d) & full) | (bit >> d)
+                    child[r] &= ~mask
+                    if not child[r]:
+                        ok = False
+                        break
+            if ok and place(child, left - 1):
+                return True
+            cols[row] = -1
+        return False
+
+    solved = place([full] * n, n)
+    return {"solved": solved, "solution": cols if solved else None}
+
+
+def _diagonal_conflicts(cols: List[int]) -> int:
+    """Perechi de regine pe aceeași coloană sau diagonală (câte o regină pe rând)"""
+    total = 0
+    for counts in (Counter(cols), Counter(r + c for r, c in enumerate(cols)),
+                   Counter(r - c for r, c in enumerate(cols))):
+        total += sum(k * (k - 1) // 2 for k in counts.values())
+    return total
+
+
+def _queens_annealing(n: int, counter: _Counter, rng: random.Random) -> Dict[str, Any]:
+    """
+    Simulated Annealing cu vecinătate de tip min-conflicts: se mută o regină aflată în conflict;
+    mutările mai proaste sunt acceptate cu probabilitatea exp(-Δ/T).
+    """
+    cols = [rng.randrange(n) for _ in range(n)]
+    cost = _diagonal_conflicts(cols)
+    temperature = 2.0
+    while cost:
+        counter.tick()
+        conflicted = [r for r in range(n)
+                      if any(cols[o] == cols[r] or abs(cols[o] - cols[r]) == abs(o - r)
+                             for o in range(n) if o != r)]
+        row = rng.choice(conflicted)
+        old = cols[row]
+        cols[row] = rng.randrange(n)
+        new_cost = _diagonal_conflicts(cols)
+        delta = new_cost - cost
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            cost = new_cost
+        else:
+            cols[row] = old
+        temperature = max(0.05, temperature * 0.995)
+    return {"solved": True, "solution": cols}
+
+
+def _queens_genetic(n: int, counter: _Counter, rng: random.Random,
+                    population_size: int = 24, mutation_rate: float = 0.3) -> Dict[str, Any]:
+    """Algoritm genetic pe permutări: selecție turneu, order crossover, mutație prin interschimbare"""
+    def evaluate(ind: List[int]) -> int:
+        counter.tick()
+        return _diagonal_conflicts(ind)
+
+    def order_crossover(a: List[int], b: List[int]) -> List[int]:
+        i, j = sorted(rng.sample(range(n), 2))
+        middle = a[i:j]
+        rest = [g for g in b if g not in middle]
+        return rest[:i] + middle + rest[i:]
+
+    population = []
+    for _ in range(population_size):
+        ind = list(range(n))
+        rng.shuffle(ind)
+        population.append((evaluate(ind), ind))
+    while True:
+        best = min(population)
+        if best[0] == 0:
+            return {"solved": True, "solution": best[1]}
+        children = [best]
+        while len(children) < population_size:
+            a = min(rng.sample(population, 3))[1]
+            b = min(rng.sample(population, 3))[1]
+            child = order_crossover(a, b) if n > 2 else list(a)
+            if rng.random() < mutation_rate:
+                i, j = rng.sample(range(n), 2) if n > 1 else (0, 0)
+                child[i], child[j] = child[j], child[i]
+            children.append((evaluate(child), child))
+        population = children
+
+
+@_memoized
+def solve_n_queens(n: int, max_nodes: int = SOLVER_MAX_NODES) -> Dict[str, Dict[str, Any]]:
+    # rng derivat din instanță, ca raportul să fie reproductibil
+    return _run_bounded({
+        "Backtracking": lambda c: _queens_backtracking(n, c),
+        "Genetic Algorithm": lambda c: _queens_genetic(n, c, random.Random(f"ga:{n}")),
+        "Simulated Annealing": lambda c: _queens_annealing(n, c, random.Random(f"sa:{n}")),
+        "Constraint Satisfaction": lambda c: _queens_csp(n, c),
+    }, max_nodes, run_order=("Backtracking", "Constraint Satisfaction"))
+
+# ---------- Hanoi generalizat ----------
+
+def _hanoi_recursive(disks: int, pegs: int, counter: _Counter) -> List[Tuple[int, int]]:
+    """Recursia clasică: folosește doar tijele 0, 1 și ultima (optimă doar pentru 3 tije)"""
+    moves: List[Tuple[int, int]] = []
+
+    def rec(n: int, src: int, dst: int, aux: int) -> None:
+        if n == 0:
+            return
+        rec(n - 1, src, aux, dst)
+        counter.tick()
+        moves.append((src, dst))
+        rec(n - 1, aux, dst, src)
+
+    rec(disks, 0, pegs - 1, 1)
+    return moves
+
+
+def _hanoi_successors(state: Tuple[int, ...], pegs: int) -> Iterator[Tuple[Tuple[int, ...], Tuple[int, int]]]:
+    """state[d] = tija discului d (0 = cel mai mic); generează (stare nouă, mutare)"""
+    tops: Dict[int, int] = {}
+    for d, p in enumerate(state):
+        tops.setdefault(p, d)
+    for a, d in tops.items():
+        for b in range(pegs):
+            if b != a and (b not in tops or tops[b] > d):
+                yield state[:d] + (b,) + state[d + 1:], (a, b)
+
+
+def _hanoi_iddfs(disks: int, pegs: int, counter: _Counter) -> List[Tuple[int, int]]:
+    """Iterative Deepening DFS în spațiul stărilor (fără stări repetate pe drumul curent)"""
+    start, goal = (0,) * disks, (pegs - 1,) * disks
+    path: List[Tuple[int, int]] = []
+    on_path = {start}
+
+    def dfs(state: Tuple[int, ...], limit: int) -> bool:
+        if state == goal:
+            return True
+        if limit == 0:
+            return False
+        counter.tick()
+        for nxt, move in _hanoi_successors(state, pegs):
+            if nxt in on_path:
+                continue
+            on_path.add(nxt)
+            path.append(move)
+            if dfs(nxt, limit - 1):
+                return True
+            path.pop()
+            on_path.discard(nxt)
+        return False
+
+    limit = 0
+    while not dfs(start, limit):
+        limit += 1
+    return path
+
+
+def _hanoi_astar(disks: int, pegs: int, counter: _Counter) -> List[Tuple[int, int]]:
+    """A* cu euristica admisibilă: numărul de discuri care nu sunt pe tija țintă"""
+    start, goal = (0,) * disks, (pegs - 1,) * disks
+
+    def h(state: Tuple[int, ...]) -> int:
+        return sum(1 for p in state if p != pegs - 1)
+
+    frontier = [(h(start), 0, 0, start)]
+    parent: Dict[Tuple[int, ...], Optional[Tuple[Tuple[int, ...], Tuple[int, int]]]] = {start: None}
+    cost = {start: 0}
+    tie = 0
+    while frontier:
+        _, g, _, state = heapq.heappop(frontier)
+        if state == goal:
+            moves = []
+            while parent[state] is not None:
+                state, move = parent[state]
+                moves.append(move)
+            return moves[::-1]
+        if g > cost[state]:
+            continue
+        counter.tick()
+        for nxt, move in _hanoi_successors(state, pegs):
+            if nxt not in cost or g + 1 < cost[nxt]:
+                cost[nxt] = g + 1
+                parent[nxt] = (state, move)
+                tie += 1
+                heapq.heappush(frontier, (g + 1 + h(nxt), g + 1, tie, nxt))
+    return []
+
+
+@_memoized
+def solve_hanoi(disks: int, pegs: int = 3, max_nodes: int = SOLVER_MAX_NODES) -> Dict[str, Dict[str, Any]]:
+    optimal = hanoi.min_moves(disks, pegs)
+
+    def wrap(build: Callable[[_Counter], List[Tuple[int, int]]]) -> Callable[[_Counter], Dict[str, Any]]:
+        def solver(counter: _Counter) -> Dict[str, Any]:
+            moves = build(counter)
+            solved = hanoi.verify(disks, pegs, moves)
+            return {"solved": solved, "moves": len(moves), "optimal": solved and len(moves) == optimal}
+        return solver
+
+    def dynamic(counter: _Counter) -> List[Tuple[int, int]]:
+        # efortul DP: un nod per celulă (discuri, 3 tije) și per split încercat la > 3 tije,
+        # apoi un nod per mutare generată
+        counter.tick(disks + 1)
+        for p in range(4, pegs + 1):
+            counter.tick(sum(max(1, d - 1) for d in range(disks + 1)))
+        sequence = []
+        for move in hanoi.moves(disks, pegs):
+            counter.tick()
+            sequence.append(move)
+        return sequence
+
+    return _run_bounded({
+        "Recursive Backtracking": wrap(lambda c: _hanoi_recursive(disks, pegs, c)),
+        "Iterative Deepening": wrap(lambda c: _hanoi_iddfs(disks, pegs, c)),
+        "A* Search": wrap(lambda c: _hanoi_astar(disks, pegs, c)),
+        "Dynamic Programming": wrap(dynamic),
+    }, max_nodes, run_order=("Recursive Backtracking", "Dynamic Programming", "A* Search"))
+
+# ---------- graph coloring ----------
+
+def _coloring_result(coloring: List[int], colors: int) -> Dict[str, Any]:
+    used = max(coloring) + 1 if coloring else 0
+    return {"solved": used <= colors, "colors_used": used}
+
+
+def _coloring_backtracking(g: graph_coloring.Graph, colors: int, counter: _Counter,
+                           dynamic_order: bool) -> Dict[str, Any]:
+    """
+    Backtracking pentru k-colorare (un nod = o culoare încercată). dynamic_order=False: ordinea naturală;
+    dynamic_order=True: ordinea DSATUR (saturație maximă, apoi grad) = CSP cu MRV + euristica gradului.
+    """
+    n = g.n
+    assignment = [-1] * n
+    sat = [0] * n
+    degree = [g.degree(v) for v in range(n)]
+
+    def neighbors(v: int) -> Iterator[int]:
+        m = g.adj[v]
+        while m:
+            low = m & -m
+            m ^= low
+            yield low.bit_length() - 1
+
+    def pick(k: int) -> int:
+        if not dynamic_order:
+            return k
+        best, best_key = -1, None
+        for v in range(n):
+            if assignment[v] < 0:
+                key = (sat[v].bit_count(), degree[v])
+                if best_key is None or key > best_key:
+                    best, best_key = v, key
+        return best
+
+    def search(k: int) -> bool:
+        if k == n:
+            return True
+        v = pick(k)
+        for c in range(colors):
+            counter.tick()
+            if sat[v] >> c & 1:
+                continue
+            assignment[v] = c
+            saved = [(u, sat[u]) for u in neighbors(v)]
+            for u, _ in saved:
+                sat[u] |= 1 << c
+            if search(k + 1):
+                return True
+            for u, old in saved:
+                sat[u] = old
+            assignment[v] = -1
+        return False
+
+    if not search(0):
+        return {"solved": False, "colors_used": None}
+    return _coloring_result(assignment, colors)
+
+
+def _coloring_greedy(g: graph_coloring.Graph, colors: int, counter: _Counter,
+                     order: List[int]) -> Dict[str, Any]:
+    counter.tick(g.n)
+    return _coloring_result(graph_coloring.greedy_coloring(g, order), colors)
+
+
+def solve_graph_coloring(vertices: int, edges: List[Tuple[int, int]], colors: int,
+                         max_nodes: int = SOLVER_MAX_NODES) -> Dict[str, Dict[str, Any]]:
+    g = graph_coloring.Graph.from_edges(vertices, edges)
+    return {
+        "Backtracking": _run(lambda c: _coloring_backtracking(g, colors, c, dynamic_order=False), max_nodes),
+        "Greedy Coloring": _run(lambda c: _coloring_greedy(g, colors, c, list(range(g.n))), max_nodes),
+        "Welsh-Powell": _run(lambda c: _coloring_greedy(g, colors, c, graph_coloring.welsh_powell_order(g)), max_nodes),
+        "Constraint Satisfaction": _run(lambda c: _coloring_backtracking(g, colors, c, dynamic_order=True), max_nodes),
+    }
+
+# ---------- knight's tour ----------
+
+def _knight_entry(search: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Adaptează rezultatul motorului knight_tour la formatul raportului (noduri = mutări încercate)"""
+    start = time.perf_counter()
+    result = search()
+    elapsed = time.perf_counter() - start
+    return {
+        "measured": True,
+        "complete": result["complete"],
+        "solved": result["found"],
+        "path_length": len(result["path"]) if result["found"] else None,
+        "nodes": result["nodes"],
+        "time_ms": round(elapsed * 1000, 3),
+    }
+
+
+@_memoized
+def solve_knight_tour(size: int, start: Tuple[int, int], closed: bool = False,
+                      max_nodes: int = SOLVER_MAX_NODES) -> Dict[str, Dict[str, Any]]:
+    sq = knight_tour.square(size, start)
+    return {
+        # Warnsdorff cu departajările Pohl/Squirrel, cu backtracking ordonat doar dacă toate eșuează;
+        # primul în raport: la egalitate de noduri, euristica fără revenire e preferată
+        "Warnsdorff's Heuristic": _knight_entry(lambda: knight_tour.find_tour(size, sq, closed=closed,
+                                                                              max_nodes=max_nodes)),
+        # backtracking cu mutările ordonate după continuările libere: fără ordonare nu termină în buget
+        # de la 6x6 în sus; la turul închis revine mai ieftin decât repornirile Warnsdorff
+        "Backtracking": _knight_entry(lambda: knight_tour.backtracking(size, sq, closed=closed, ordered=True,
+                                                                       max_nodes=max_nodes)),
+        # strategii fără solver implementat: apar în opțiuni, dar nu pot fi măsurate
+        "Divide and Conquer": _not_measured(),
+        "Neural Network": _not_measured(),
+    }
+
+# ---------- recomandare ----------
+
+def recommend_strategy(report: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Alege strategia cu cel mai bun rezultat măsurat: întâi rezolvările (optime, unde contează),
+    apoi cele mai puține noduri; la egalitate, ordinea din raport. Timpul nu intră în decizie.
+    """
+    order = {s: k for k, s in enumerate(report)}
+    measured = [s for s, r in report.items() if r.get("measured")]
+    return min(measured, key=lambda s: (not report[s].get("solved"), not report[s].get("optimal", True),
+                                        report[s]["nodes"], order[s]))
+
+
+def effort_summary(report: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Raportul fără timpi și fără soluții complete, pentru payload-uri reproductibile"""
+    return {
+        s: {k: v for k, v in r.items() if k not in ("time_ms", "solution")}
+        for s, r in report.items()
+    }
@@ -0,0 +1,187 @@
+"""
+SmarTest — memoizarea întrebărilor generate cu seed
+Cheia: (tip, parametri canonici, seed). Același quiz deschis de o clasă întreagă costă o singură generare:
+nivelul în memorie este un LRU mărginit, iar cererile concurente pentru aceeași cheie așteaptă
+generarea în curs (single-flight). Opțional, un nivel SQLite partajat între procesele worker.
+
+Configurare prin variabile de mediu:
+    QUESTION_STORE_SIZE  numărul maxim de întrebări în memorie (implicit 1024; 0 dezactivează memoizarea)
+    QUESTION_STORE_DB    calea bazei SQLite partajate (implicit: fără nivel SQLite)
+"""
+
+from __future__ import annotations
+from typing import Optional, Dict, Any, Callable
+from collections import OrderedDict
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# ---------- nivel SQLite ----------
+
+class SQLiteTier:
+    """Tabel cheie -> payload JSON; o conexiune per thread, jurnal WAL (cititori concurenți)"""
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS question_store ("
+            " key TEXT PRIMARY KEY, payload TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute("SELECT payload FROM question_store WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        self._connection().execute(
+            "INSERT OR IGNORE INTO question_store (key, payload, created_at) VALUES (?, ?, ?)",
+            (key, json.dumps(payload, ensure_ascii=False, separators=(",", ":")), time.time()),
+        )
+
+# ---------- store ----------
+
+def canonical_key(kind: str, params: Dict[str, Any], seed: int) -> str:
+    return json.dumps([kind, seed, params], sort_keys=True, separators=(",", ":"))
+
+
+class QuestionStore:
+    """
+    LRU în memorie + nivel SQLite opțional. Payload-urile returnate sunt partajate între cereri:
+    rutele doar le serializează, apelanții care vor să le modifice fac o copie.
+    """
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        self.tier: Optional[SQLiteTier] = None
+        if db_path:
+            try:
+                self.tier = SQLiteTier(db_path)
+            except sqlite3.Error as e:
+                logger.warning(f"Question store SQLite tier disabled ({db_path}): {e}")
+        self.hits = self.db_hits = self.generated = self.waited = 0
+
+    def _remember(self, key: str, payload: Dict[str, Any]) -> None:
+        # apelantul ține lock-ul
+        self._data[key] = payload
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def _tier_get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.tier is None:
+            return None
+        try:
+            return self.tier.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Question store read failed: {e}")
+            return None
+
+    def _tier_put(self, key: str, payload: Dict[str, Any]) -> None:
+        if self.tier is None:
+            return
+        try:
+            self.tier.put(key, payload)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Question store write failed: {e}")
+
+    def get_or_generate(self, kind: str, params: Dict[str, Any], seed: int,
+                        build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Payload-ul pentru (kind, params, seed); build() rulează o singură dată per cheie"""
+        if self.max_entries <= 0:
+            return build()
+        key = canonical_key(kind, params, seed)
+        while True:
+            with self._lock:
+                payload = self._data.get(key)
+                if payload is not None:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return payload
+                event = self._inflight.get(key)
+                if event is None:
+                    event = self._inflight[key] = threading.Event()
+                    break
+                self.waited += 1
+            # altă cerere generează aceeași întrebare; dacă eșuează, reîncercăm noi
+            event.wait()
+
+        try:
+            payload = self._tier_get(key)
+            if payload is not None:
+                with self._lock:
+                    self.db_hits += 1
+            else:
+                payload = build()
+                self._tier_put(key, payload)
+                with self._lock:
+                    self.generated += 1
+            with self._lock:
+                self._remember(key, payload)
+            return payload
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.db_hits = self.generated = self.waited = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "sqlite": self.tier.path if self.tier is not None else None,
+                "hits": self.hits,
+                "sqlite_hits": self.db_hits,
+                "generated": self.generated,
+                "waited": self.waited,
+            }
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+_STORE = QuestionStore(max_entries=_env_int("QUESTION_STORE_SIZE", DEFAULT_MAX_ENTRIES),
+                       db_path=os.environ.get("QUESTION_STORE_DB") or None)
+
+# ---------- API ----------
+
+def get_or_generate(kind: str, params: Dict[str, Any], seed: Optional[int],
+                    build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Fără seed întrebarea e aleatoare de fiecare dată, deci nu se memoizează"""
+    if seed is None:
+        return build()
+    return _STORE.get_or_generate(kind, params, seed, build)
+
+
+def stats() -> Dict[str, Any]:
+    return _STORE.stats()
+
+
+def clear() -> None:
+    _STORE.clear()
@@ -0,0 +1,123 @@
+"""
+SmarTest — token-uri compacte semnate (HMAC-SHA256) pentru întrebări
+Un token conține doar (tip, seed, parametri); la evaluare întrebarea este regenerată pe server
+(generatoarele sunt deterministe pentru același seed), deci clientul nu mai retrimite payload-ul complet.
+Tot aici e registrul generatoarelor folosit de rute: generate() trece prin question_store.
+
+Format: base64url(json {"v", "t", "s", "p"}) + "." + base64url(HMAC-SHA256[:16])
+Cheia: variabila de mediu SMARTEST_TOKEN_SECRET; fără ea se generează o cheie per proces
+(token-urile rămân valide doar până la repornirea serverului).
+"""
+
+from __future__ import annotations
+from typing import Optional, Dict, Any, Callable, Tuple
+from functools import lru_cache
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+
+import app.question_store as question_store
+import app.smartest_csp as csp
+import app.smartest_minmax as mm
+import app.smartest_nash as sm
+import app.smartest_problem1 as p1
+import app.theory_questions as theory_q
+
+TOKEN_VERSION = 1
+
+_SECRET = os.environ.get("SMARTEST_TOKEN_SECRET", "").encode("utf-8") or secrets.token_bytes(32)
+
+_SIGNATURE_BYTES = 16
+
+# tip -> (parametrii acceptați, generatorul rutei /<tip>/generate pentru (seed, parametri))
+_BUILDERS: Dict[str, Tuple[Tuple[str, ...], Callable[[int, Dict[str, Any]], Dict[str, Any]]]] = {
+    "nash": (("rows", "cols", "ensure"),
+             lambda seed, p: sm.build_question_payload(rows=p["rows"], cols=p["cols"], ensure=p["ensure"], seed=seed)),
+    "minmax": (("depth", "branching_factor", "value_min", "value_max"),
+               lambda seed, p: mm.build_question_payload(depth=p["depth"], branching_factor=p["branching_factor"],
+                                                         value_range=(p["value_min"], p["value_max"]), seed=seed)),
+    "problem1": (("problem_type", "question_kind"),
+                 lambda seed, p: p1.build_question_payload(problem_type=p["problem_type"], seed=seed,
+                                                           question_kind=p["question_kind"])),
+    "csp": (("problem_type", "optimization"),
+            lambda seed, p: csp.build_question_payload(problem_type=p["problem_type"], optimization=p["optimization"],
+                                                       seed=seed)),
+    "theory": (("topic_id", "question_type", "theory_file"),
+               lambda seed, p: theory_q.build_question_payload(p["topic_id"], p["question_type"], p["theory_file"],
+                                                               seed)),
+}
+
+# rutele de teorie răspund cu {"question", "payload"}; evaluarea primește doar "payload"
+_GRADED_PART = {"theory": "payload"}
+
+# ---------- codare ----------
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(body: str) -> str:
+    return _b64encode(hmac.new(_SECRET, body.encode("ascii"), hashlib.sha256).digest()[:_SIGNATURE_BYTES])
+
+
+def generate(kind: str, seed: Optional[int], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Răspunsul rutei de generare; cu seed, memoizat în question_store (partajat, doar pentru citire)"""
+    names, build = _BUILDERS[kind]
+    params = {name: params.get(name) for name in names}
+    return question_store.get_or_generate(kind, params, seed, lambda: build(seed, params))
+
+
+def new_seed() -> int:
+    """Seed pentru generările fără seed explicit (altfel întrebarea nu ar putea fi regenerată)"""
+    return secrets.randbelow(2 ** 31)
+
+
+def issue(kind: str, seed: int, params: Dict[str, Any]) -> str:
+    """Token semnat pentru întrebarea de tip `kind` generată cu (seed, params)"""
+    if kind not in _BUILDERS:
+        raise ValueError(f"Unknown question type: {kind}")
+    names = _BUILDERS[kind][0]
+    claims = {"v": TOKEN_VERSION, "t": kind, "s": seed, "p": {name: params.get(name) for name in names}}
+    body = _b64encode(json.dumps(claims, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    return f"{body}.{_sign(body)}"
+
+
+def decode(token: str) -> Dict[str, Any]:
+    """Verifică semnătura și returnează {"v", "t", "s", "p"}; ValueError pentru token invalid"""
+    body, sep, signature = token.partition(".")
+    if not sep or not hmac.compare_digest(signature, _sign(body)):
+        raise ValueError("Invalid question token")
+    try:
+        claims = json.loads(_b64decode(body))
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid question token")
+    if claims.get("v") != TOKEN_VERSION or claims.get("t") not in _BUILDERS:
+        raise ValueError("Unsupported question token")
+    return claims
+
+# ---------- regenerare ----------
+
+@lru_cache(maxsize=1024)
+def _payload(token: str) -> Dict[str, Any]:
+    claims = decode(token)
+    response = generate(claims["t"], claims["s"], claims["p"])
+    part = _GRADED_PART.get(claims["t"])
+    return response[part] if part else response
+
+
+def resolve(token: str, kind: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Payload-ul întrebării din token, regenerat o dată și apoi servit din cache.
+    kind: tipul așteptat de rută (un token de Nash nu poate fi evaluat ca MinMax).
+    Payload-ul returnat este partajat: evaluatorii îl citesc, nu îl modifică.
+    """
+    if kind is not None and decode(token)["t"] != kind:
+        raise ValueError(f"Question token is not for {kind}")
+    return _payload(token)
@@ -0,0 +1,132 @@
+"""
+SmarTest — agregate per (utilizator, capitol) pentru pagina de profil
+Tabela result_aggregates ține numărul de rezultate, suma scorurilor, ultimele LAST_N scoruri și
+seriile de rezultate promovate. Este actualizată incremental în aceeași tranzacție în care
+scriitorul din results_store inserează un lot, deci statisticile unui utilizator costă O(capitole),
+nu O(istoric). backfill() o reconstruiește din tabela results.
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any, Iterable
+import json
+import sqlite3
+
+LAST_N = 10
+PASS_SCORE = 60  # același prag ca recomandările din profile.php
+
+# ---------- schemă ----------
+
+AGGREGATES_DDL = """CREATE TABLE IF NOT EXISTS result_aggregates (
+    user_id INTEGER NOT NULL,
+    topic TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    score_sum REAL NOT NULL,
+    last_scores TEXT NOT NULL,
+    streak INTEGER NOT NULL,
+    best_streak INTEGER NOT NULL,
+    last_at DATETIME,
+    PRIMARY KEY (user_id, topic)
+)"""
+
+_COLUMNS = ("count", "score_sum", "last_scores", "streak", "best_streak", "last_at")
+
+# ---------- actualizare ----------
+
+def _empty() -> Dict[str, Any]:
+    return {"count": 0, "score_sum": 0.0, "last_scores": [], "streak": 0, "best_streak": 0, "last_at": None}
+
+
+def _add(agg: Dict[str, Any], score: float, created_at: Optional[str]) -> None:
+    agg["count"] += 1
+    agg["score_sum"] += score
+    agg["last_scores"] = (agg["last_scores"] + [score])[-LAST_N:]
+    agg["streak"] = agg["streak"] + 1 if score >= PASS_SCORE else 0
+    agg["best_streak"] = max(agg["best_streak"], agg["streak"])
+    if created_at is not None:
+        agg["last_at"] = created_at
+
+
+def _load(conn: sqlite3.Connection, user_id: int, topic: str) -> Dict[str, Any]:
+    row = conn.execute(
+        f"SELECT {', '.join(_COLUMNS)} FROM result_aggregates WHERE user_id = ? AND topic = ?",
+        (user_id, topic),
+    ).fetchone()
+    if row is None:
+        return _empty()
+    agg = dict(zip(_COLUMNS, row))
+    agg["last_scores"] = json.loads(agg["last_scores"])
+    return agg
+
+
+def _store(conn: sqlite3.Connection, aggregates: Dict[Tuple[int, str], Dict[str, Any]]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO result_aggregates (user_id, topic, count, score_sum, last_scores, streak, "
+        "best_streak, last_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (user_id, topic, agg["count"], agg["score_sum"], json.dumps(agg["last_scores"]),
+             agg["streak"], agg["best_streak"], agg["last_at"])
+            for (user_id, topic), agg in aggregates.items()
+        ],
+    )
+
+
+def apply(conn: sqlite3.Connection, rows: Iterable[Tuple[int, str, float, Optional[str]]]) -> None:
+    """
+    Adaugă (user_id, topic, score, created_at) în agregate, în ordinea primită.
+    Apelantul deține tranzacția (aceeași cu INSERT-ul în results).
+    """
+    aggregates: Dict[Tuple[int, str], Dict[str, Any]] = {}
+    for user_id, topic, score, created_at in rows:
+        key = (user_id, topic)
+        agg = aggregates.get(key)
+        if agg is None:
+            agg = aggregates[key] = _load(conn, user_id, topic)
+        _add(agg, score, created_at)
+    if aggregates:
+        _store(conn, aggregates)
+
+
+def backfill(conn: sqlite3.Connection, user_id: Optional[int] = None) -> int:
+    """
+    Reconstruiește agregatele din results (toți utilizatorii sau doar unul); returnează numărul de perechi.
+    Apelantul deține tranzacția.
+    """
+    where, params = ("WHERE user_id = ?", (user_id,)) if user_id is not None else ("", ())
+    conn.execute(f"DELETE FROM result_aggregates {where}", params)
+    aggregates: Dict[Tuple[int, str], Dict[str, Any]] = {}
+    cursor = conn.execute(
+        f"SELECT user_id, topic, score, created_at FROM results {where} ORDER BY created_at, id", params
+    )
+    for uid, topic, score, created_at in cursor:
+        _add(aggregates.setdefault((uid, topic), _empty()), score, created_at)
+    _store(conn, aggregates)
+    return len(aggregates)
+
+# ---------- citire ----------
+
+def user_stats(conn: sqlite3.Connection, user_id: int) -> Dict[str, Any]:
+    """Totalul și statisticile pe capitole ale unui utilizator (ordinea capitolelor: alfabetică)"""
+    topics: List[Dict[str, Any]] = []
+    total_count, total_sum = 0, 0.0
+    cursor = conn.execute(
+        f"SELECT topic, {', '.join(_COLUMNS)} FROM result_aggregates WHERE user_id = ? ORDER BY topic",
+        (user_id,),
+    )
+    for topic, count, score_sum, last_scores, streak, best_streak, last_at in cursor:
+        total_count += count
+        total_sum += score_sum
+        topics.append({
+            "topic": topic,
+            "count": count,
+            "avg_score": round(score_sum / count, 2) if count else None,
+            "last_scores": json.loads(last_scores),
+            "streak": streak,
+            "best_streak": best_streak,
+            "last_at": last_at,
+        })
+    return {
+        "user_id": user_id,
+        "count": total_count,
+        "avg_score": round(total_sum / total_count, 2) if total_count else None,
+        "topics": topics,
+    }
@@ -0,0 +1,254 @@
+"""
+SmarTest — export în flux al istoricului de rezultate (NDJSON, CSV, Arrow IPC)
+Rândurile sunt citite cu un cursor SQLite pe loturi de FETCH_SIZE și scrise în bucăți de cel mult
+CHUNK_BYTES, deci memoria rămâne constantă indiferent de numărul de rânduri exportate.
+Payload-urile (doar în NDJSON) sunt decomprimate o singură dată per întrebare (LRU mărginit).
+
+Rularea din linia de comandă:
+    python -m app.results_export --format csv --out clasa.csv [--user ID] [--topic T] [--from D] [--to D]
+Prin HTTP, GET /export/results cere header-ul X-SmarTest-Internal cu SMARTEST_INTERNAL_SECRET.
+
+Arrow IPC necesită pyarrow (opțional): pip install pyarrow
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any, Iterator
+from collections import OrderedDict
+import argparse
+import csv
+import io
+import json
+import os
+import sqlite3
+import sys
+import time
+
+import app.payload_store as payload_store
+import app.results_store as results_store
+
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+FETCH_SIZE = 1000
+CHUNK_BYTES = 64 * 1024
+
+FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+# coloanele scalare, în ordinea din CSV / Arrow
+COLUMNS = ("id", "user_id", "username", "topic", "score", "feedback", "created_at")
+
+# ---------- interogare ----------
+
+def build_query(user_id: Optional[int] = None, topic: Optional[str] = None, date_from: Optional[str] = None,
+                date_to: Optional[str] = None, with_payload: bool = False) -> Tuple[str, List[Any]]:
+    """
+    SELECT-ul filtrat. Datele sunt în formatul created_at ('YYYY-MM-DD' sau 'YYYY-MM-DD HH:MM:SS', UTC);
+    date_to ca zi simplă include toată ziua.
+    """
+    where, params = [], []
+    if user_id is not None:
+        where.append("r.user_id = ?")
+        params.append(user_id)
+    if topic:
+        where.append("r.topic = ?")
+        params.append(topic)
+    if date_from:
+        where.append("r.created_at >= ?")
+        params.append(date_from)
+    if date_to:
+        where.append("r.created_at < date(?, '+1 day')" if len(date_to) == 10 else "r.created_at <= ?")
+        params.append(date_to)
+    columns = "r.id, r.user_id, u.username, r.topic, r.score, r.feedback, r.created_at"
+    if with_payload:
+        columns += ", r.payload, r.payload_hash"
+    sql = f"SELECT {columns} FROM results r LEFT JOIN users u ON u.id = r.user_id"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return sql + " ORDER BY r.id", params
+
+
+def iter_rows(conn: sqlite3.Connection, sql: str, params: List[Any]) -> Iterator[Tuple]:
+    cursor = conn.execute(sql, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                return
+            yield from rows
+    finally:
+        cursor.close()
+
+
+class PayloadReader:
+    """JSON-ul payload-urilor după hash, cu LRU: o clasă întreagă are aceleași câteva întrebări"""
+    def __init__(self, conn: sqlite3.Connection, max_entries: int = 256):
+        self.conn = conn
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+
+    def text(self, payload: Optional[str], payload_hash: Optional[str]) -> str:
+        """Payload-ul ca text JSON gata de inserat într-o linie NDJSON ("null" dacă lipsește)"""
+        if payload_hash:
+            text = self._cache.get(payload_hash)
+            if text is not None:
+                self._cache.move_to_end(payload_hash)
+                return text
+            row = self.conn.execute("SELECT data FROM questions WHERE hash = ?", (payload_hash,)).fetchone()
+            text = payload_store.inflate(row[0]) if row is not None else "null"
+            self._cache[payload_hash] = text
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+            return text
+        if not payload:
+            return "null"
+        # rânduri vechi, inline: validate, pentru ca fiecare linie să rămână JSON valid
+        try:
+            return json.dumps(json.loads(payload), ensure_ascii=False, separators=(",", ":"))
+        except ValueError:
+            return "null"
+
+# ---------- formate ----------
+
+def _chunks(lines: Iterator[str]) -> Iterator[bytes]:
+    buffer: List[str] = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_BYTES:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def _ndjson_lines(conn: sqlite3.Connection, rows: Iterator[Tuple], with_payload: bool) -> Iterator[str]:
+    reader = PayloadReader(conn) if with_payload else None
+    for row in rows:
+        line = json.dumps(dict(zip(COLUMNS, row)), ensure_ascii=False, separators=(",", ":"))
+        if reader is not None:
+            # payload-ul e deja JSON canonic: se lipește în linie fără parse + dump
+            line = f'{line[:-1]},"payload":{reader.text(row[-2], row[-1])}}}'
+        yield line + "\n"
+
+
+def _csv_lines(rows: Iterator[Tuple]) -> Iterator[str]:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(COLUMNS)
+    for row in rows:
+        writer.writerow(row[:len(COLUMNS)])
+        if out.tell() >= CHUNK_BYTES:
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+    yield out.getvalue()
+
+
+def _arrow_chunks(rows: Iterator[Tuple]) -> Iterator[bytes]:
+    schema = pa.schema([("id", pa.int64()), ("user_id", pa.int64()), ("username", pa.string()),
+                        ("topic", pa.string()), ("score", pa.float64()), ("feedback", pa.string()),
+                        ("created_at", pa.string())])
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema)
+    batch: List[Tuple] = []
+
+    def write_batch() -> bytes:
+        columns = list(zip(*batch)) if batch else [[] for _ in COLUMNS]
+        writer.write_batch(pa.record_batch([pa.array(col, type=field.type) for col, field in zip(columns, schema)],
+                                           schema=schema))
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    for row in rows:
+        batch.append(row[:len(COLUMNS)])
+        if len(batch) >= FETCH_SIZE:
+            yield write_batch()
+            batch = []
+    if batch:
+        yield write_batch()
+    writer.close()
+    yield sink.getvalue()
+
+# ---------- API ----------
+
+def export(fmt: str = "ndjson", user_id: Optional[int] = None, topic: Optional[str] = None,
+           date_from: Optional[str] = None, date_to: Optional[str] = None, with_payload: bool = False,
+           path: Optional[str] = None) -> Iterator[bytes]:
+    """
+    Generator de bucăți de octeți în formatul cerut. Conexiunea e deschisă la primul next() și
+    închisă la final (sau când consumatorul abandonează generatorul).
+    with_payload se aplică doar la NDJSON; CSV și Arrow conțin doar câmpurile scalare.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    if fmt == "arrow" and not ARROW_AVAILABLE:
+        raise ValueError("Arrow export requires pyarrow (pip install pyarrow)")
+    with_payload = with_payload and fmt == "ndjson"
+    sql, params = build_query(user_id, topic, date_from, date_to, with_payload)
+
+    def generate() -> Iterator[bytes]:
+        conn = results_store.connect(path or os.environ.get("SMARTEST_DB") or None)
+        try:
+            results_store.ensure_schema(conn)
+            rows = iter_rows(conn, sql, params)
+            if fmt == "ndjson":
+                yield from _chunks(_ndjson_lines(conn, rows, with_payload))
+            elif fmt == "csv":
+                yield from _chunks(_csv_lines(rows))
+            else:
+                yield from _arrow_chunks(rows)
+        finally:
+            conn.close()
+
+    return generate()
+
+
+def filename(fmt: str) -> str:
+    extension = {"ndjson": "ndjson", "csv": "csv", "arrow": "arrows"}[fmt]
+    return f"results_{time.strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+# ---------- CLI ----------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export în flux al tabelei results")
+    parser.add_argument("--format", choices=list(FORMATS), default="ndjson")
+    parser.add_argument("--out", default=None, help="fișierul de ieșire (implicit stdout)")
+    parser.add_argument("--user", type=int, default=None)
+    parser.add_argument("--topic", default=None)
+    parser.add_argument("--from", dest="date_from", default=None, help="YYYY-MM-DD[ HH:MM:SS], inclusiv")
+    parser.add_argument("--to", dest="date_to", default=None, help="YYYY-MM-DD[ HH:MM:SS], inclusiv")
+    parser.add_argument("--payload", action="store_true", help="include payload-ul întrebării (doar NDJSON)")
+    parser.add_argument("--db", default=None, help="calea bazei (implicit SMARTEST_DB sau db/smartest.db)")
+    args = parser.parse_args(argv)
+
+    try:
+        chunks = export(args.format, args.user, args.topic, args.date_from, args.date_to, args.payload, args.db)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    start = time.perf_counter()
+    written = 0
+    out = open(args.out, "wb") if args.out else sys.stdout.buffer
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+            written += len(chunk)
+    finally:
+        if args.out:
+            out.close()
+    print(f"{written / 1e6:.1f} MB exportați în {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
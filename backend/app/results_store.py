@@ -0,0 +1,342 @@
+"""
+SmarTest — persistarea rezultatelor în baza SQLite comună cu frontend-ul PHP (db/smartest.db)
+Rutele de evaluare pun rezultatul într-o coadă și răspund imediat; un singur thread scriitor golește
+coada în tranzacții pe loturi. Baza rulează în mod WAL, deci cititorii PHP nu blochează scrierile.
+
+În aceeași tranzacție cu lotul se actualizează agregatele pe capitole (result_stats), citite de /stats.
+Payload-urile întrebărilor se scriu o singură dată, comprimate, în tabela questions (payload_store).
+
+Configurare prin variabile de mediu:
+    SMARTEST_DB  calea bazei (implicit <repo>/db/smartest.db)
+
+Reconstruirea agregatelor din istoricul existent:
+    python -m app.results_store backfill [--user ID] [--db CALE]
+Mutarea payload-urilor inline existente în questions:
+    python -m app.results_store compact [--vacuum] [--db CALE]
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any
+from pathlib import Path
+import argparse
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+import app.payload_store as payload_store
+import app.result_stats as result_stats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "db" / "smartest.db"
+
+# PRAGMA user_version după crearea schemei; db_connection.php sare peste DDL când e >= 1
+# 1: tabelele frontend-ului + indexuri, 2: result_aggregates, 3: questions + payload_hash
+SCHEMA_VERSION = 3
+
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 0.05  # secunde de așteptat după primul rezultat, pentru a aduna un lot
+
+# ---------- schemă ----------
+
+_TABLES = [
+    """CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT NOT NULL UNIQUE,
+        password TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )""",
+    """CREATE TABLE IF NOT EXISTS results (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        topic TEXT NOT NULL,
+        score INTEGER NOT NULL,
+        feedback TEXT,
+        payload TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id)
+    )""",
+    """CREATE TABLE IF NOT EXISTS quizzes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        score REAL NOT NULL,
+        question_count INTEGER NOT NULL,
+        time_spent INTEGER DEFAULT 0,
+        payload TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id)
+    )""",
+]
+
+# coloane adăugate ulterior (baze create de versiuni mai vechi ale frontend-ului)
+_MIGRATIONS = [
+    ("results", "payload", "ALTER TABLE results ADD COLUMN payload TEXT"),
+    ("quizzes", "time_spent", "ALTER TABLE quizzes ADD COLUMN time_spent INTEGER DEFAULT 0"),
+]
+
+# referințele către payload-urile comprimate din questions (schema 3)
+_PAYLOAD_COLUMNS = [
+    ("results", "payload_hash", "ALTER TABLE results ADD COLUMN payload_hash TEXT"),
+    ("quizzes", "payload_hash", "ALTER TABLE quizzes ADD COLUMN payload_hash TEXT"),
+]
+
+_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_results_user_created ON results(user_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_quizzes_user_created ON quizzes(user_id, created_at)",
+]
+
+
+def connect(path: Optional[str] = None) -> sqlite3.Connection:
+    """Conexiune în mod WAL, cu autocommit (tranzacțiile se deschid explicit)"""
+    conn = sqlite3.connect(str(path or DEFAULT_DB_PATH), timeout=10.0, isolation_level=None,
+                           check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _user_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _add_columns(conn: sqlite3.Connection, migrations: List[Tuple[str, str, str]]) -> None:
+    for table, column, ddl in migrations:
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            conn.execute(ddl)
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """Aduce baza la SCHEMA_VERSION; fiecare pas rulează o singură dată per bază"""
+    if _user_version(conn) >= SCHEMA_VERSION:
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version = _user_version(conn)  # recitit sub lock: alt proces poate fi migrat între timp
+        if version < 1:
+            for ddl in _TABLES:
+                conn.execute(ddl)
+            _add_columns(conn, _MIGRATIONS)
+            for ddl in _INDEXES:
+                conn.execute(ddl)
+        if version < 2:
+            # agregatele pornesc de la istoricul deja salvat de frontend
+            conn.execute(result_stats.AGGREGATES_DDL)
+            result_stats.backfill(conn)
+        if version < 3:
+            # rândurile vechi rămân inline până la `compact`; cititorii acceptă ambele forme
+            conn.execute(payload_store.QUESTIONS_DDL)
+            _add_columns(conn, _PAYLOAD_COLUMNS)
+        conn.execute(f"PRAGMA user_version = {max(version, SCHEMA_VERSION)}")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+# ---------- scriitor ----------
+
+_STOP = object()
+
+
+class ResultsWriter:
+    """
+    Coadă + un singur thread scriitor. submit() nu atinge discul; payload-ul e serializat tot în
+    thread-ul scriitor. flush() așteaptă până când tot ce a fost trimis e scris.
+    """
+    def __init__(self, path: Optional[str] = None, batch_size: int = BATCH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL, max_queue: int = 10000):
+        self.path = str(path or DEFAULT_DB_PATH)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._pending = 0
+        self._cond = threading.Condition()
+        self.written = self.batches = self.errors = 0
+        self._blobs = payload_store.BlobWriter()
+        conn = connect(self.path)
+        ensure_schema(conn)
+        self._thread = threading.Thread(target=self._run, args=(conn,), name="results-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, user_id: int, topic: str, score: float, feedback: Optional[str],
+               payload: Any = None) -> None:
+        # created_at în formatul CURRENT_TIMESTAMP (UTC), fixat la evaluare, nu la scriere
+        created_at = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+        with self._cond:
+            self._pending += 1
+        # coada plină = scriitorul nu ține pasul; blocarea aici e presiunea inversă dorită
+        self._queue.put((user_id, topic, score, feedback, payload, created_at))
+
+    def _drain(self, first: Any) -> List[Any]:
+        batch = [first]
+        if first is _STOP:
+            return batch
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+            if item is _STOP:
+                break
+        return batch
+
+    def _write(self, conn: sqlite3.Connection, rows: List[Tuple]) -> None:
+        for attempt in range(3):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                params = [
+                    (user_id, topic, score, feedback, self._blobs.store(conn, payload), created_at)
+                    for user_id, topic, score, feedback, payload, created_at in rows
+                ]
+                conn.executemany(
+                    "INSERT INTO results (user_id, topic, score, feedback, payload_hash, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", params)
+                result_stats.apply(conn, [(row[0], row[1], row[2], row[5]) for row in params])
+                conn.execute("COMMIT")
+                self.written += len(params)
+                self.batches += 1
+                return
+            except sqlite3.OperationalError as e:
+                self._rollback(conn)
+                logger.warning(f"Results batch write failed (attempt {attempt + 1}): {e}")
+                time.sleep(0.1 * (attempt + 1))
+            except Exception:
+                self._rollback(conn)
+                raise
+        self.errors += len(rows)
+
+    def _rollback(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        self._blobs.forget()
+
+    def _run(self, conn: sqlite3.Connection) -> None:
+        stop = False
+        while not stop:
+            batch = self._drain(self._queue.get())
+            stop = batch[-1] is _STOP
+            rows = [item for item in batch if item is not _STOP]
+            if rows:
+                try:
+                    self._write(conn, rows)
+                except Exception as e:  # un lot corupt nu oprește scriitorul
+                    self.errors += len(rows)
+                    logger.error(f"Results batch dropped: {e}")
+                with self._cond:
+                    self._pending -= len(rows)
+                    self._cond.notify_all()
+        conn.close()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Așteaptă scrierea tuturor rezultatelor trimise; False la timeout"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            pending = self._pending
+        return {"path": self.path, "pending": pending, "written": self.written,
+                "batches": self.batches, "errors": self.errors,
+                "payloads_stored": self._blobs.stored, "payloads_deduplicated": self._blobs.deduplicated}
+
+
+_WRITER: Optional[ResultsWriter] = None
+_WRITER_LOCK = threading.Lock()
+
+
+def writer() -> ResultsWriter:
+    """Scriitorul procesului, pornit la primul rezultat"""
+    global _WRITER
+    if _WRITER is None:
+        with _WRITER_LOCK:
+            if _WRITER is None:
+                _WRITER = ResultsWriter(os.environ.get("SMARTEST_DB") or None)
+                atexit.register(_WRITER.close)
+    return _WRITER
+
+# ---------- API ----------
+
+def record_result(user_id: int, topic: str, score: float, feedback: Optional[str], payload: Any = None) -> None:
+    """Pune rezultatul în coadă; nu așteaptă scrierea pe disc"""
+    writer().submit(user_id, topic, score, feedback, payload)
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    return _WRITER.flush(timeout) if _WRITER is not None else True
+
+
+_READERS = threading.local()
+
+
+def user_stats(user_id: int, wait: float = 0.2) -> Dict[str, Any]:
+    """
+    Statisticile utilizatorului din result_aggregates (conexiune de citire per thread).
+    wait: cât se așteaptă scrierea rezultatelor din coadă, ca ultimul răspuns să fie inclus.
+    """
+    w = writer()
+    w.flush(wait)
+    conn = getattr(_READERS, "conn", None)
+    if conn is None or _READERS.path != w.path:
+        conn = _READERS.conn = connect(w.path)
+        _READERS.path = w.path
+    return result_stats.user_stats(conn, user_id)
+
+
+def stats() -> Dict[str, Any]:
+    return _WRITER.stats() if _WRITER is not None else {"path": None, "pending": 0, "written": 0,
+                                                          "batches": 0, "errors": 0,
+                                                          "payloads_stored": 0, "payloads_deduplicated": 0}
+
+# ---------- CLI ----------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Întreținerea bazei de rezultate SmarTest")
+    sub = parser.add_subparsers(dest="command", required=True)
+    backfill = sub.add_parser("backfill", help="reconstruiește result_aggregates din tabela results")
+    backfill.add_argument("--user", type=int, default=None, help="doar pentru acest utilizator")
+    backfill.add_argument("--db", default=None, help="calea bazei (implicit SMARTEST_DB sau db/smartest.db)")
+    compact = sub.add_parser("compact", help="mută payload-urile inline din results/quizzes în questions")
+    compact.add_argument("--vacuum", action="store_true", help="recuperează spațiul pe disc la final")
+    compact.add_argument("--db", default=None, help="calea bazei (implicit SMARTEST_DB sau db/smartest.db)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    conn = connect(args.db or os.environ.get("SMARTEST_DB") or None)
+    try:
+        ensure_schema(conn)
+        if args.command == "backfill":
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                pairs = result_stats.backfill(conn, args.user)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            print(f"{pairs} agregate (utilizator, capitol) reconstruite în {time.perf_counter() - start:.2f}s")
+        else:
+            for table in ("results", "quizzes"):
+                rows, blobs = payload_store.migrate(conn, table)
+                print(f"{table}: {rows} payload-uri mutate, {blobs} întrebări noi în questions")
+            if args.vacuum:
+                conn.execute("VACUUM")
+            print(f"Gata în {time.perf_counter() - start:.2f}s")
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,11 @@ from __future__ import annotations
 from typing import List, Tuple, Optional, Dict, Any, Set
 import random
 
+import app.csp_solver as solver
+import app.sudoku as sudoku
+import app.answer_parser as answer_parser
+import app.graph_coloring as graph_coloring
+
 # ---------- definiții probleme CSP ----------
 
 CSP_PROBLEMS = {
@@ -30,37 +35,58 @@ CSP_PROBLEMS = {
     }
 }
 
+# ---------- efort de căutare măsurat ----------
+
+SEARCH_MAX_NODES = 20_000
+# instanțele obișnuite cer sub 3 000 de verificări; bugetul ține căutarea sub o secundă și la sute de noduri
+# (MRV termină colorarea grafurilor de până la ~300 de noduri)
+SEARCH_MAX_CHECKS = 1_000_000
+
+def measure_search_effort(variables: List[str], domains: Dict[str, List[Any]],
+                          constraints: List[Tuple[str, str, str]],
+                          max_nodes: int = SEARCH_MAX_NODES,
+                          max_checks: int = SEARCH_MAX_CHECKS) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+    """
+    Rezolvă instanța cu fiecare tehnică și alege optimizarea cu efortul minim.
+    Returnează (optimizarea recomandată, efort per tehnică: noduri, verificări, rezultat).
+    Timpul de rulare nu este inclus în efort pentru ca payload-ul să rămână reproductibil
+    (de aceea și bugetul e în noduri și verificări, nu în secunde).
+    """
+    report = solver.compare_techniques(variables, domains, constraints, max_nodes=max_nodes, max_checks=max_checks)
+    effort = {
+        t: {
+            "nodes": r["nodes"],
+            "checks": r["checks"],
+            "complete": r["complete"],
+            "satisfiable": r["satisfiable"]
+        }
+        for t, r in report.items()
+    }
+    return solver.recommend_technique(report), effort
+
 # ---------- generare instanță CSP ----------
 
-def generate_simple_csp_instance(variables: int = 4, domain_size: int = 3, constraints: int = 3, seed: Optional[int] = None) -> Dict[str, Any]:
+# operatorii constrângerilor din CSP-ul simplu ('<' o dată din trei: lanțurile de ordine fac AC-3 util)
+SIMPLE_OPERATORS = ("!=", "!=", "<")
+
+def generate_simple_csp_instance(variables: int = 4, domain_size: int = 3, constraints: int = 3, seed: Optional[int] = None,
+                                 rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """Generează o instanță CSP simplă"""
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random.Random(seed)
     
     # Generează variabile
     var_names = [f"X{i+1}" for i in range(variables)]
     domains = {var: list(range(1, domain_size + 1)) for var in var_names}
     
-    # Generează constrângeri binare aleatoare
+    # Generează constrângeri binare aleatoare (var1 != var2 sau var1 < var2)
     constraint_list = []
     for _ in range(constraints):
-        var1, var2 = random.sample(var_names, 2)
-        # Constrângere: var1 != var2
-        constraint_list.append((var1, var2, "!="))
+        var1, var2 = rng.sample(var_names, 2)
+        constraint_list.append((var1, var2, rng.choice(SIMPLE_OPERATORS)))
     
-    # Alege optimizarea corectă în funcție de complexitatea problemei
-    if variables <= 4 and constraints <= 3:
-        # Pentru probleme simple, Backtracking de bază este suficient
-        correct_optimization = "Backtracking"
-    elif variables <= 5:
-        # Pentru probleme medii, Forward Checking reduce spațiul de căutare
-        correct_optimization = "Forward Checking"
-    elif constraints / variables > 1.5:
-        # Pentru multe constrângeri, AC-3 este eficient
-        correct_optimization = "AC-3"
-    else:
-        # Pentru probleme cu multe variabile, MRV alege variabilele eficient
-        correct_optimization = "MRV"
+    # Alege optimizarea corectă după efortul de căutare măsurat pe instanță
+    correct_optimization, effort = measure_search_effort(var_names, domains, constraint_list)
     
     return {
         "problem_type": "simple",
@@ -68,35 +94,38 @@ def generate_simple_csp_instance(variables: int = 4, domain_size: int = 3, const
             "variables": var_names,
             "domains": domains,
             "constraints": constraint_list,
-            "description": f"Rezolvă un CSP cu {variables} variabile ({', '.join(var_names)}), fiecare cu domeniu {{1, 2, ..., {domain_size}}}, și {len(constraint_list)} constrângeri binare."
+            "description": f"Rezolvă un CSP cu {variables} variabile ({', '.join(var_names)}), fiecare cu domeniu {{1, 2, ..., {domain_size}}}, și {len(constraint_list)} constrângeri binare: {', '.join(f'{a} {op} {b}' for a, b, op in constraint_list)}."
         },
-        "correct_optimization": correct_optimization
+        "correct_optimization": correct_optimization,
+        "search_effort": effort
     }
 
-def generate_graph_coloring_csp_instance(vertices: int = 4, colors: int = 3, seed: Optional[int] = None) -> Dict[str, Any]:
-    """Generează o instanță CSP pentru graph coloring"""
-    if seed is not None:
-        random.seed(seed)
+def generate_graph_coloring_csp_instance(vertices: int = 4, colors: Optional[int] = None, model: Optional[str] = None,
+                                         feasible: bool = True, seed: Optional[int] = None,
+                                         rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """
+    Generează o instanță CSP pentru graph coloring.
+    Graful vine din graph_coloring (G(n,p), planar sau k-partit plantat); numărul de culori
+    este ales din numărul cromatic, deci instanța este colorabilă (sau, cu feasible=False, imposibilă).
+    """
+    if rng is None:
+        rng = random.Random(seed)
+    if model is None:
+        model = rng.choice(graph_coloring.GRAPH_MODELS)
+    
+    graph = graph_coloring.generate_instance(vertices, model=model, colors=colors, feasible=feasible, rng=rng)
+    colors = graph["colors"]
+    chi = graph["chromatic"]
     
     var_names = [f"V{i+1}" for i in range(vertices)]
     domains = {var: list(range(1, colors + 1)) for var in var_names}
     
-    # Generează muchii (constrângeri: nodurile adiacente trebuie să aibă culori diferite)
-    edges = []
-    for i in range(vertices):
-        for j in range(i + 1, min(i + 3, vertices)):
-            if random.random() > 0.3:  # 70% probabilitate de muchie
-                edges.append((var_names[i], var_names[j]))
-    
+    # Muchii (constrângeri: nodurile adiacente trebuie să aibă culori diferite)
+    edges = [(var_names[i], var_names[j]) for i, j in graph["edges"]]
     constraint_list = [(v1, v2, "!=") for v1, v2 in edges]
     
-    # Alege optimizarea corectă
-    if vertices <= 4:
-        correct_optimization = "Forward Checking"
-    elif len(edges) / vertices > 1.2:
-        correct_optimization = "AC-3"
-    else:
-        correct_optimization = "MRV"
+    # Alege optimizarea corectă după efortul de căutare măsurat pe instanță
+    correct_optimization, effort = measure_search_effort(var_names, domains, constraint_list)
     
     return {
         "problem_type": "graph_coloring",
@@ -106,50 +135,62 @@ def generate_graph_coloring_csp_instance(vertices: int = 4, colors: int = 3, see
             "constraints": constraint_list,
             "edges": edges,
             "colors": colors,
-            "description": f"Colorează un graf cu {vertices} noduri folosind {colors} culori, astfel încât nodurile conectate să aibă culori diferite."
+            "graph_model": model,
+            "chromatic_number": chi["chromatic"],
+            "chromatic_bounds": [chi["lower"], chi["upper"]],
+            "colorable": graph["colorable"],
+            "description": f"Colorează un graf cu {vertices} noduri și {len(edges)} muchii folosind {colors} culori, astfel încât nodurile conectate să aibă culori diferite."
         },
-        "correct_optimization": correct_optimization
+        "correct_optimization": correct_optimization,
+        "search_effort": effort
     }
 
-def generate_sudoku_csp_instance(size: int = 4, seed: Optional[int] = None) -> Dict[str, Any]:
-    """Generează o instanță CSP pentru Sudoku (simplificat)"""
-    if seed is not None:
-        random.seed(seed)
+def generate_sudoku_csp_instance(size: int = 4, seed: Optional[int] = None,
+                                 rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """Generează o instanță CSP pentru Sudoku: puzzle cu soluție unică (4x4, 9x9 sau 16x16)"""
+    if rng is None:
+        rng = random.Random(seed)
+    
+    puzzle = sudoku.generate_puzzle(size=size, rng=rng)
+    model = sudoku.to_csp(puzzle["puzzle"])
     
-    # Pentru Sudoku, AC-3 este de obicei cea mai bună alegere datorită constrângerilor puternice
-    correct_optimization = "AC-3"
+    # Alege optimizarea corectă după efortul de căutare măsurat pe instanță
+    correct_optimization, effort = measure_search_effort(model["variables"], model["domains"], model["constraints"])
     
     return {
         "problem_type": "sudoku",
         "instance": {
             "size": size,
-            "description": f"Rezolvă un puzzle Sudoku {size}x{size} (simplificat) modelat ca CSP, unde fiecare celulă trebuie să aibă o valoare unică pe rând, coloană și regiune."
+            "grid": puzzle["puzzle"],
+            "clues": puzzle["clues"],
+            "solved_grid": puzzle["solution"],
+            "description": f"Rezolvă puzzle-ul Sudoku {size}x{size} de mai jos ({puzzle['clues']} indicii, '.' = celulă goală), modelat ca CSP, unde fiecare celulă trebuie să aibă o valoare unică pe rând, coloană și regiune.\n\n{sudoku.format_grid(puzzle['puzzle'])}"
         },
-        "correct_optimization": correct_optimization
+        "correct_optimization": correct_optimization,
+        "search_effort": effort
     }
 
 # ---------- generare întrebare ----------
 
-def generate_csp_question(problem_type: str = "simple", optimization: str = "FC", seed: Optional[int] = None) -> Dict[str, Any]:
+def generate_csp_question(problem_type: str = "simple", optimization: str = "FC", seed: Optional[int] = None,
+                          rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """Generează o întrebare despre CSP și optimizarea sa"""
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random.Random(seed)
     
     if problem_type == "simple":
+        # între una și două constrângeri per variabilă: de la instanțe rezolvate fără revenire la imposibile
+        variables = rng.randint(5, 8)
         instance_data = generate_simple_csp_instance(
-            variables=random.randint(4, 6),
-            domain_size=random.randint(3, 4),
-            constraints=random.randint(3, 5),
-            seed=seed
+            variables=variables,
+            domain_size=rng.randint(3, 4),
+            constraints=rng.randint(variables, 2 * variables),
+            rng=rng
         )
     elif problem_type == "graph_coloring":
-        instance_data = generate_graph_coloring_csp_instance(
-            vertices=random.randint(4, 6),
-            colors=random.randint(3, 4),
-            seed=seed
-        )
+        instance_data = generate_graph_coloring_csp_instance(vertices=rng.randint(8, 12), rng=rng)
     elif problem_type == "sudoku":
-        instance_data = generate_sudoku_csp_instance(size=4, seed=seed)
+        instance_data = generate_sudoku_csp_instance(size=4, rng=rng)
     else:
         raise ValueError(f"Problem type {problem_type} not supported")
     
@@ -159,8 +200,8 @@ def generate_csp_question(problem_type: str = "simple", optimization: str = "FC"
     # Generează opțiuni (corectă + 3 greșite)
     all_optimizations = problem_info["optimizations"]
     wrong_optimizations = [opt for opt in all_optimizations if opt != correct_optimization]
-    options = [correct_optimization] + random.sample(wrong_optimizations, min(3, len(wrong_optimizations)))
-    random.shuffle(options)
+    options = [correct_optimization] + rng.sample(wrong_optimizations, min(3, len(wrong_optimizations)))
+    rng.shuffle(options)
     
     return {
         "problem_type": problem_type,
@@ -168,7 +209,8 @@ def generate_csp_question(problem_type: str = "simple", optimization: str = "FC"
         "instance": instance_data["instance"],
         "correct_optimization": correct_optimization,
         "options": options,
-        "all_optimizations": all_optimizations
+        "all_optimizations": all_optimizations,
+        "search_effort": instance_data.get("search_effort")
     }
 
 # ---------- formatare text întrebare ----------
@@ -191,110 +233,10 @@ def format_question_text(csp_data: Dict[str, Any]) -> str:
 
 def _parse_answer(answer: str, options: List[str]) -> Optional[str]:
     """
-    Parsează răspunsul utilizatorului - versiune flexibilă îmbunătățită.
-    Acceptă: numere (1-4), nume complete, abrevieri, variante de scriere, răspunsuri parțiale.
+    Parsează răspunsul utilizatorului: numere (1-4), nume complete, abrevieri, variante fără diacritice,
+    răspunsuri parțiale. Tabelul de alias-uri e compilat o dată per set de opțiuni (answer_parser).
     """
-    import re
-    
-    if not answer or not answer.strip():
-        return None
-    
-    s = answer.strip()
-    s_lower = s.lower()
-    
-    # Normalizează textul: elimină diacritice pentru matching mai flexibil
-    def normalize_text(text: str) -> str:
-        """Normalizează textul eliminând diacritice și caractere speciale"""
-        replacements = {
-            'ă': 'a', 'â': 'a', 'î': 'i', 'ș': 's', 'ț': 't',
-            'Ă': 'a', 'Â': 'a', 'Î': 'i', 'Ș': 's', 'Ț': 't'
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        return text
-    
-    s_normalized = normalize_text(s_lower)
-    
-    # Strategia 1: Caută număr (1, 2, 3, 4) - acceptă și "opțiunea 1", "varianta 2", etc.
-    num_patterns = [
-        r'\b([1-4])\b',  # Simplu: "1", "2", etc.
-        r'(?:opțiunea|optiunea|varianta|varianta|aleg|alegerea)\s*([1-4])',  # "opțiunea 1"
-        r'(?:numărul|numarul|număr|numar)\s*([1-4])',  # "numărul 1"
-    ]
-    for pattern in num_patterns:
-        num_match = re.search(pattern, s_normalized)
-        if num_match:
-            idx = int(num_match.group(1)) - 1
-            if 0 <= idx < len(options):
-                return options[idx]
-    
-    # Strategia 2: Caută nume optimizare direct - matching flexibil
-    for opt in options:
-        opt_lower = opt.lower()
-        opt_normalized = normalize_text(opt_lower)
-        
-        # Verifică potrivire exactă
-        if opt_normalized == s_normalized:
-            return opt
-        
-        # Verifică dacă optimizarea e conținută complet în răspuns
-        if opt_normalized in s_normalized:
-            pattern = r'\b' + re.escape(opt_normalized) + r'\b'
-            if re.search(pattern, s_normalized):
-                return opt
-        
-        # Verifică dacă răspunsul e conținut în optimizare (pentru răspunsuri parțiale)
-        if s_normalized in opt_normalized and len(s_normalized) >= 3:
-            return opt
-    
-    # Strategia 3: Caută cuvinte cheie și abrevieri extinse
-    keywords = {
-        "backtracking": ["backtracking", "backtrack", "bt", "backtracking de baza"],
-        "forward": ["forward checking", "forward", "fc", "forward check", "verificare inainte"],
-        "mrv": ["mrv", "minimum remaining values", "minimum remaining", "min remaining", 
-                "minimum remaining value", "valori minime ramase"],
-        "ac-3": ["ac-3", "ac3", "arc consistency", "arc consistency 3", "ac 3", 
-                 "arc consist", "consistenta arcului", "consistență arc"]
-    }
-    
-    for opt in options:
-        opt_lower = opt.lower()
-        opt_normalized = normalize_text(opt_lower)
-        
-        for key, key_list in keywords.items():
-            if key in opt_normalized:
-                for keyword in key_list:
-                    keyword_normalized = normalize_text(keyword.lower())
-                    if keyword_normalized in s_normalized:
-                        pattern = r'\b' + re.escape(keyword_normalized) + r'\b'
-                        if re.search(pattern, s_normalized):
-                            return opt
-    
-    # Strategia 4: Matching parțial bazat pe cuvinte importante
-    strategy_words = {}
-    for opt in options:
-        opt_normalized = normalize_text(opt.lower())
-        common_words = {'the', 'and', 'or', 'of', 'for', 'with', 'algorithm', 'method'}
-        words = [w for w in re.findall(r'\b\w+\b', opt_normalized) 
-                if w not in common_words and len(w) >= 3]
-        strategy_words[opt] = words
-    
-    best_match = None
-    best_score = 0
-    
-    for opt, words in strategy_words.items():
-        if not words:
-            continue
-        matches = sum(1 for word in words if word in s_normalized)
-        score = matches / len(words) if words else 0
-        if score > best_score and score >= 0.5:
-            best_score = score
-            best_match = opt
-    
-    if best_match:
-        return best_match
-    
-    return None
+    return answer_parser.parse_choice(answer, options)
 
 # ---------- evaluare răspuns ----------
 
@@ -343,18 +285,26 @@ def build_explanation(csp_data: Dict[str, Any]) -> str:
     else:
         base_explanation += f"'{correct_optimization}' este cea mai potrivită optimizare pentru această instanță CSP."
     
+    effort = csp_data.get("search_effort")
+    if effort:
+        base_explanation += "\n\nEfort măsurat pe această instanță (noduri expandate / verificări de constrângeri):"
+        for technique, stats in effort.items():
+            status = "" if stats["complete"] else " (buget depășit)"
+            base_explanation += f"\n - {technique}: {stats['nodes']} noduri, {stats['checks']} verificări{status}"
+    
     return base_explanation
 
 # ---------- pachet complet întrebare ----------
 
 def build_question_payload(problem_type: str = "simple", optimization: str = "FC", seed: Optional[int] = None) -> Dict[str, Any]:
     """Construiește pachetul complet de întrebare"""
-    csp_data = generate_csp_question(problem_type=problem_type, optimization=optimization, seed=seed)
+    rng = random.Random(seed)
+    csp_data = generate_csp_question(problem_type=problem_type, optimization=optimization, rng=rng)
     qtext = format_question_text(csp_data)
     expl = build_explanation(csp_data)
     
     return {
-        "id": f"CSP-{random.randint(100000, 999999)}",
+        "id": f"CSP-{rng.randint(100000, 999999)}",
         "problem_type": csp_data["problem_type"],
         "problem_name": csp_data["problem_name"],
         "instance": csp_data["instance"],
@@ -363,6 +313,7 @@ def build_question_payload(problem_type: str = "simple", optimization: str = "FC
         "correct_optimization": csp_data["correct_optimization"],
         "solution": {
             "optimization": csp_data["correct_optimization"],
+            "search_effort": csp_data["search_effort"],
             "explanation": expl
         }
     }
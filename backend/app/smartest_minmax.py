@@ -5,7 +5,11 @@ Generează arbori de joc și evaluează răspunsuri despre valoarea rădăcinii
 
 from __future__ import annotations
 from typing import List, Tuple, Optional, Dict, Any
+import bisect
 import random
+import re
+
+import app.metrics as metrics
 
 # ---------- structură arbore ----------
 
@@ -22,13 +26,15 @@ class Node:
 
 def generate_game_tree(depth: int = 3, branching_factor: int = 2, 
                        value_range: Tuple[int, int] = (-10, 10),
-                       seed: Optional[int] = None) -> Tuple[Node, Dict[str, Any]]:
+                       seed: Optional[int] = None,
+                       rng: Optional[random.Random] = None) -> Tuple[Node, Dict[str, Any]]:
     """
     Generează un arbore de joc binar sau cu branching_factor.
     Returnează rădăcina și metadata despre arbore.
+    rng: generator explicit; dacă lipsește se creează din seed (fără stare globală)
     """
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random.Random(seed)
     
     node_counter = [0]  # pentru ID-uri unice
     
@@ -38,7 +44,7 @@ def generate_game_tree(depth: int = 3, branching_factor: int = 2,
         
         if current_depth >= depth:
             # frunză
-            value = random.randint(value_range[0], value_range[1])
+            value = rng.randint(value_range[0], value_range[1])
             node = Node(node_id, "LEAF", value)
         else:
             # nod intern
@@ -111,6 +117,7 @@ def minmax_alpha_beta(node: Node, alpha: float, beta: float, visited_leaves: Lis
                 break  # Alpha-Beta pruning
         return int(value)
 
+@metrics.timed("minmax_solve")
 def solve_tree(root: Node) -> Dict[str, Any]:
     """Rezolvă arborele și returnează valoarea rădăcinii și frunzele vizitate"""
     visited_leaves = []
@@ -192,221 +199,176 @@ def format_question_text(root: Node, metadata: Dict[str, Any]) -> str:
 
 # ---------- grading ----------
 
+_DIACRITICS = str.maketrans({
+    'ă': 'a', 'â': 'a', 'î': 'i', 'ș': 's', 'ş': 's', 'ț': 't', 'ţ': 't',
+    'Ă': 'A', 'Â': 'A', 'Î': 'I', 'Ș': 'S', 'Ş': 'S', 'Ț': 'T', 'Ţ': 'T',
+})
+
+# un singur tokenizer, un singur parcurs: numere (cu semn), cuvinte, '=', separatori ',' / ';' / ':'
+_TOKENS = re.compile(r"(?P<num>-?\d+)|(?P<word>[a-z]+)|(?P<eq>=)|(?P<sep>[,;:])")
+
+# clase de cuvinte (text fără diacritice)
+_VALUE, _LEAF_NOUN, _LEAF_VERB, _NODE, _FILLER = range(5)
+_WORD_CLASS: Dict[str, int] = {}
+for _cls, _words in (
+    (_VALUE, "valoare valoarea valoarei value radacina radacinii root rezultat rezultatul result "
+             "returneaza returna return returns"),
+    (_LEAF_NOUN, "frunze frunzele frunza frunzei frunzelor leaves leaf"),
+    (_LEAF_VERB, "viziteaza visits"),
+    (_NODE, "n nod node nodul"),
+    (_FILLER, "din de este e are va fi in numar numarul numarului number egala egal egale cu iar sunt au "
+              "fost vor is was were will be equal to of the la noduri nodes vizitate visited count total "
+              "si and minmax min max algoritmul algorithm alpha beta pruning"),
+):
+    _WORD_CLASS.update(dict.fromkeys(_words.split(), _cls))
+
+# câte cuvinte de legătură pot separa un cuvânt cheie de numărul lui ("valoarea din rădăcină este 5")
+_MAX_GAP = 4
+
+# ferestrele de context (caractere) ale euristicii pentru numere fără cuvânt cheie
+_NODE_WINDOW = 30
+_CONTEXT_WINDOW = 40
+
+_ROOT_STEMS = ("radacina", "root", "valoare", "value")
+_LEAF_STEMS = ("frunze", "leaves", "numar", "number")
+
+
+def _near(spans: List[Tuple[int, int]], start: int, end: int, window: int) -> bool:
+    """Există un marcaj complet inclus în [start - window, end + window)?"""
+    lo, hi = start - window, end + window
+    k = bisect.bisect_left(spans, (lo, -1))
+    return k < len(spans) and spans[k][1] <= hi
+
+
 def _parse_answer(answer: str) -> Dict[str, Optional[int]]:
     """
-    Parsează răspunsul utilizatorului - versiune flexibilă care acceptă propoziții naturale.
-    Extrage valoarea din rădăcină și numărul de frunze vizitate din text.
+    Extrage valoarea din rădăcină și numărul de frunze vizitate dintr-un răspuns liber, într-un singur parcurs.
+    Reguli: un cuvânt cheie ("valoarea", "rădăcina", "frunze", "vizitează") urmat, peste cel mult
+    _MAX_GAP cuvinte de legătură, de un număr; "N frunze" numără frunzele, "N valoarea" dă valoarea. Dacă lipsește una dintre
+    mențiuni, numerele rămase sunt atribuite după context și semn (numerele de lângă "N3" sunt ignorate).
     Returnează dict cu 'value' și 'leaves' (poate fi None dacă nu e găsit).
     """
     if not answer:
         return {"value": None, "leaves": None}
-    
-    import re
-    s = answer.strip()
-    s_lower = s.lower()
-    
-    # Strategia 1: Căutare după cuvinte cheie specifice pentru valoare (prioritară)
-    value_patterns = [
-        r'(?:valoare|value|rădăcină|root|rezultat)\s*(?:din\s*)?(?:rădăcină|root)?\s*[=:]\s*(-?\d+)',
-        r'(?:valoare|value)\s*(?:este|e|are|în\s*numar|in\s*numar)\s*(?:de|este|e)?\s*(-?\d+)',
-        r'(?:rădăcină|root|radacina|radăcina)\s*(?:are|este|e|va\s*fi)\s*(-?\d+)',
-        r'(?:valoarea|value)\s*(?:din\s*)?(?:rădăcină|root)\s*(?:este|e|are|va\s*fi)\s*(-?\d+)',
-        r'(?:valoarea|value)\s*(?:este|e|are)\s*(?:în\s*numar|in\s*numar|egală|egala)\s*(?:de|cu)?\s*(-?\d+)',
-        r'(?:iar\s*)?(?:rădăcină|root|radacina|radăcina)\s*(?:este|e|are|va\s*fi)\s*(-?\d+)',  # "iar radacina este -1"
-        r'(?:iar\s*)?(?:valoarea|value)\s*(?:este|e|are)\s*(-?\d+)',  # "iar valoarea este -1"
-        r'(?:rezultatul|result)\s*(?:este|e|are|va\s*fi)\s*(-?\d+)',  # "rezultatul este 5"
-        r'(?:minmax|min-max|min max)\s*(?:returnează|return|va\s*returna|va\s*returneaza)\s*(-?\d+)',  # "minmax returnează 5"
-        r'(?:algoritmul|algorithm)\s*(?:returnează|return|va\s*returna|va\s*returneaza)\s*(-?\d+)',  # "algoritmul returnează 5"
-    ]
-    
-    # Strategia 2: Căutare după cuvinte cheie specifice pentru frunze (prioritară)
-    # IMPORTANT: Acceptă și numere negative pentru a detecta erorile utilizatorului
-    leaves_patterns = [
-        r'(?:număr|number|numar|count)\s*(?:de\s*)?(?:noduri\s*)?(?:frunze|leaves|noduri\s*frunze|leaf\s*nodes)\s*(?:vizitate|visited)?\s*(?:este|e|are|sunt|au\s*fost|vor\s*fi)\s*(-?\d+)',  # "Numarul de noduri frunze vizitate este 4" sau "este -8"
-        r'(?:frunze|leaves|noduri\s*frunze|leaf\s*nodes)\s*(?:frunze|vizitate|visited)?\s*[=:]\s*(-?\d+)',
-        r'(?:frunze|leaves|noduri)\s*(?:vizitate|visited|au\s*fost|sunt|vor\s*fi)\s*(?:vizitate|visited)?\s*[=:]\s*(-?\d+)',
-        r'(?:număr|number|numar|count)\s*(?:de\s*)?(?:frunze|leaves|noduri\s*frunze)\s*(?:vizitate|visited)?\s*[=:]\s*(-?\d+)',
-        r'(-?\d+)\s*(?:frunze|leaves|noduri\s*frunze)\s*(?:vizitate|visited|au\s*fost|sunt)',
-        r'(?:vizitate|visited)\s*(?:au\s*fost|sunt|vor\s*fi)?\s*(-?\d+)\s*(?:frunze|leaves|noduri)',
-        r'(?:frunze|leaves)\s*(?:sunt|au\s*fost|vor\s*fi)\s*(?:în\s*numar|in\s*numar)\s*(?:de|egal)?\s*(-?\d+)',
-        r'(?:câte|cate|how\s*many)\s*(?:frunze|leaves|noduri)\s*(?:frunze|vizitate)?\s*(?:au\s*fost|sunt|vor\s*fi)?\s*(-?\d+)',
-        r'(?:iar\s*)?(?:număr|number|numar)\s*(?:de\s*)?(?:frunze|leaves|noduri)\s*(?:frunze|vizitate)?\s*(?:este|e|sunt)\s*(-?\d+)',  # "iar numarul de frunze este 4"
-        r'(?:alpha-beta|alpha beta|alpha-beta pruning)\s*(?:vizitează|visits|viziteaza)\s*(-?\d+)',  # "alpha-beta vizitează 4"
-        r'(?:pruning|prună|pruna)\s*(?:elimină|elimina|eliminates)\s*(?:.*?)\s*(?:și|and|si)\s*(?:vizitează|visits|viziteaza)\s*(-?\d+)',  # "pruning elimină și vizitează 4"
-    ]
-    
-    value = None
-    leaves = None
-    
-    # Caută valoarea (prioritară - căutăm după cuvinte cheie specifice)
-    # Folosim findall pentru a găsi toate potrivirile și să le procesăm în ordine
-    for pattern in value_patterns:
-        matches = re.finditer(pattern, s_lower)
-        for match in matches:
-            try:
-                candidate_value = int(match.group(1))
-                # Verifică dacă numărul nu e deja folosit ca frunze
-                # IMPORTANT: Nu suprascrie dacă deja am găsit o valoare prin pattern specific
-                if (leaves is None or candidate_value != leaves) and value is None:
-                    value = candidate_value
-                    break
-            except:
-                continue
-        if value is not None:
-            break
-    
-    # Caută numărul de frunze (prioritară - căutăm după cuvinte cheie specifice)
-    # Folosim findall pentru a găsi toate potrivirile și să le procesăm în ordine
-    for pattern in leaves_patterns:
-        matches = re.finditer(pattern, s_lower)
-        for match in matches:
-            try:
-                candidate_leaves = int(match.group(1))
-                # Verifică dacă numărul nu e deja folosit ca valoare
-                # IMPORTANT: Nu suprascrie dacă deja am găsit frunze prin pattern specific
-                if (value is None or candidate_leaves != value) and leaves is None:
-                    leaves = candidate_leaves
-                    break
-            except:
-                continue
-        if leaves is not None:
-            break
-    
-    # Strategia 3: Dacă nu am găsit prin cuvinte cheie, încercăm să extragem numerele
-    # dar doar dacă nu sunt în context de "noduri vizitate" sau alte informații
-    if value is None or leaves is None:
-        # Extragem toate numerele din text
-        all_numbers = re.findall(r'-?\d+', s)
-        
-        # Filtrăm numerele care sunt în context de "noduri vizitate" sau "nod N"
-        # (acestea nu sunt răspunsurile căutate)
-        filtered_numbers = []
-        for num_str in all_numbers:
-            num = int(num_str)
-            # Verifică contextul în jurul numărului
-            num_pos = s.find(num_str)
-            if num_pos != -1:
-                # Extrage contextul (30 caractere înainte și după pentru mai multă precizie)
-                start = max(0, num_pos - 30)
-                end = min(len(s), num_pos + len(num_str) + 30)
-                context = s_lower[start:end]
-                
-                # Dacă numărul e în context de "nod N", "N0", "N1", etc., îl ignorăm
-                if re.search(r'\bn\s*\d+|\bnod\s*\d+|\bnode\s*\d+', context):
-                    continue
-                
-                # Dacă numărul e în context de "noduri vizitate" fără "frunze", îl ignorăm
-                # (dacă e doar "noduri vizitate" fără "frunze", probabil se referă la noduri interne)
-                if re.search(r'noduri\s*vizitate|nodes\s*visited', context) and not re.search(r'frunze|leaves|număr|number|numar', context):
-                    continue
-                
-                filtered_numbers.append(num)
+    s = answer.strip().translate(_DIACRITICS).lower()
+
+    values: List[int] = []
+    leaves_found: List[int] = []
+    numbers: List[Tuple[int, int, int]] = []   # (număr, început, sfârșit), fără referințele de nod
+    node_spans: List[Tuple[int, int]] = []
+    visited_spans: List[Tuple[int, int]] = []  # "noduri vizitate" (noduri interne, nu frunze)
+    root_spans: List[Tuple[int, int]] = []
+    leaf_spans: List[Tuple[int, int]] = []
+
+    pending: Optional[int] = None              # _VALUE / _LEAF_NOUN: ce așteaptă următorul număr
+    gap = 0
+    loose: Optional[int] = None                # număr fără cuvânt cheie, poate fi urmat de "frunze"
+    loose_gap = 0
+    prev_word, prev_class, prev_end = "", None, -1
+    for m in _TOKENS.finditer(s):
+        kind = m.lastgroup
+        start, end = m.span()
+        if kind == "num":
+            num = int(m.group())
+            if prev_class == _NODE and not s[prev_end:start].strip():
+                node_spans.append((prev_end - len(prev_word), end))
+                pending = loose = None
             else:
-                filtered_numbers.append(num)
-        
-        # Dacă am găsit numere filtrate, le folosim
-        if len(filtered_numbers) >= 2:
-            try:
-                # Dacă avem 2 numere și unul e negativ, probabil negativul e valoarea
-                # și pozitivul e frunze
-                negative_nums = [n for n in filtered_numbers if n < 0]
-                positive_nums = [n for n in filtered_numbers if n > 0]
-                
-                if negative_nums and positive_nums:
-                    if value is None:
-                        value = negative_nums[0]  # Primul negativ e probabil valoarea
-                    if leaves is None:
-                        leaves = positive_nums[0]  # Primul pozitiv e probabil frunze
-                else:
-                    # Dacă nu avem negativ, trebuie să verificăm contextul pentru fiecare număr
-                    # pentru a le asocia corect bazat pe context, nu pe ordine
-                    for num in filtered_numbers:
-                        if value is not None and leaves is not None:
-                            break
-                        
-                        num_str = str(num)
-                        num_pos = s.find(num_str)
-                        if num_pos != -1:
-                            start = max(0, num_pos - 40)
-                            end = min(len(s), num_pos + len(num_str) + 40)
-                            context = s_lower[start:end]
-                            
-                            # Dacă numărul e în context de "radacina" sau "valoare", e valoare
-                            if value is None and re.search(r'radacina|radăcina|rădăcină|root|valoare|value', context):
-                                value = num
-                                continue
-                            
-                            # Dacă numărul e în context de "frunze" sau "noduri frunze", e frunze
-                            if leaves is None and re.search(r'frunze|leaves|noduri\s*frunze|număr|number|numar', context):
-                                leaves = num
-                                continue
-                    
-                    # Dacă încă nu am asociat, folosim prima logică (primul = valoare, al doilea = frunze)
-                    # dar doar dacă nu am găsit prin context
-                    if value is None and len(filtered_numbers) > 0:
-                        value = filtered_numbers[0]
-                    if leaves is None and len(filtered_numbers) > 1:
-                        # Evită să folosim același număr pentru ambele
-                        for num in filtered_numbers[1:]:
-                            if num != value:
-                                leaves = num
-                                break
-            except:
-                pass
-        elif len(filtered_numbers) == 1:
-            # Dacă avem un singur număr, încercăm să-l asociem
-            # IMPORTANT: Nu suprascrie valorile deja găsite prin pattern-uri specifice
-            num = filtered_numbers[0]
-            if value is None and leaves is None:
-                # Verifică contextul pentru a decide
-                num_pos = s.find(str(num))
-                if num_pos != -1:
-                    start = max(0, num_pos - 40)
-                    end = min(len(s), num_pos + len(str(num)) + 40)
-                    context = s_lower[start:end]
-                    
-                    # Dacă e în context de "frunze" sau "noduri frunze", e frunze
-                    if re.search(r'frunze|leaves|noduri\s*frunze|număr|number|numar', context):
-                        leaves = num
-                    # Dacă e în context de "radacina" sau "valoare", e valoare
-                    elif re.search(r'radacina|radăcina|rădăcină|root|valoare|value', context):
-                        value = num
-                    # Dacă numărul e negativ și nu am găsit context clar, probabil e valoare
-                    elif num < 0:
-                        value = num
-                    # Dacă e pozitiv și mic (< 20), default e valoare
-                    elif num < 20:
-                        value = num
-                    else:
-                        # Număr mare pozitiv, probabil e frunze (deși rare)
-                        leaves = num
+                numbers.append((num, start, end))
+                if pending is not None:
+                    (values if pending == _VALUE else leaves_found).append(num)
+                    pending = loose = None
                 else:
-                    # Default: dacă e negativ, e valoare; altfel, e valoare dacă e mic
-                    if num < 0:
-                        value = num
-                    elif num < 20:
-                        value = num
-                    else:
-                        leaves = num
-    
-    # Strategia 4: Format explicit "valoare=5, frunze=4" sau "5 4"
-    if value is None or leaves is None:
-        # Format: "valoare=5, frunze=4" sau "value=5, leaves=4"
-        value_match = re.search(r'(?:valoare|value)\s*[=:]\s*(-?\d+)', s_lower)
-        leaves_match = re.search(r'(?:frunze|leaves|noduri\s*frunze)\s*[=:]\s*(\d+)', s_lower)
-        
-        if value_match:
-            try:
-                value = int(value_match.group(1))
-            except:
-                pass
-        if leaves_match:
-            try:
-                leaves = int(leaves_match.group(1))
-            except:
-                pass
-    
-    # Returnează dict cu valorile găsite (poate fi None)
+                    loose, loose_gap = num, 0
+            prev_word, prev_class, prev_end = "", None, end
+            continue
+        if kind == "eq":
+            continue
+        if kind == "sep":
+            # "5, frunze 4": un număr nu trece peste separator ca să devină numărul de frunze
+            loose = None
+            continue
+        word = m.group()
+        cls = _WORD_CLASS.get(word)
+        if any(stem in word for stem in _ROOT_STEMS):
+            root_spans.append((start, end))
+        if any(stem in word for stem in _LEAF_STEMS):
+            leaf_spans.append((start, end))
+        if word in ("vizitate", "visited") and prev_word in ("noduri", "nodes"):
+            visited_spans.append((prev_end - len(prev_word), end))
+        if cls == _LEAF_NOUN:
+            if loose is not None and loose_gap <= 1:
+                leaves_found.append(loose)
+                loose = None
+            pending, gap = _LEAF_NOUN, 0
+        elif cls == _LEAF_VERB:
+            pending, gap = _LEAF_NOUN, 0
+        elif cls == _VALUE:
+            if loose is not None and loose_gap <= 1:
+                # "5 value 4 leaves": numărul dinaintea cuvântului e valoarea, următorul rămâne liber
+                values.append(loose)
+                pending = loose = None
+            else:
+                pending, gap = _VALUE, 0
+        elif cls == _FILLER or cls == _NODE:
+            gap += 1
+            loose_gap += 1
+            if gap > _MAX_GAP:
+                pending = None
+        else:
+            pending = loose = None
+        prev_word, prev_class, prev_end = word, cls, end
+
+    value = values[0] if values else None
+    leaves = leaves_found[0] if leaves_found else None
+    if value is not None and leaves is not None:
+        return {"value": value, "leaves": leaves}
+
+    # numere fără cuvânt cheie: se ignoră cele de lângă "N3" și cele despre noduri interne vizitate
+    filtered = []
+    for num, start, end in numbers:
+        if _near(node_spans, start, end, _NODE_WINDOW):
+            continue
+        if _near(visited_spans, start, end, _NODE_WINDOW) and not _near(leaf_spans, start, end, _NODE_WINDOW):
+            continue
+        filtered.append((num, start, end))
+
+    def near_root(start: int, end: int) -> bool:
+        return _near(root_spans, start, end, _CONTEXT_WINDOW)
+
+    def near_leaf(start: int, end: int) -> bool:
+        return _near(leaf_spans, start, end, _CONTEXT_WINDOW)
+
+    if len(filtered) >= 2:
+        negative = [n for n, _, _ in filtered if n < 0]
+        positive = [n for n, _, _ in filtered if n > 0]
+        if negative and positive:
+            # negativul e probabil valoarea, pozitivul numărul de frunze
+            if value is None:
+                value = negative[0]
+            if leaves is None:
+                leaves = positive[0]
+        else:
+            for num, start, end in filtered:
+                if value is not None and leaves is not None:
+                    break
+                if value is None and near_root(start, end):
+                    value = num
+                elif leaves is None and near_leaf(start, end):
+                    leaves = num
+            if value is None:
+                value = filtered[0][0]
+            if leaves is None:
+                leaves = next((n for n, _, _ in filtered[1:] if n != value), None)
+    elif len(filtered) == 1 and value is None and leaves is None:
+        num, start, end = filtered[0]
+        if near_leaf(start, end):
+            leaves = num
+        elif near_root(start, end) or num < 20:
+            # număr negativ sau mic fără context clar: probabil valoarea
+            value = num
+        else:
+            leaves = num
     return {"value": value, "leaves": leaves}
 
 def _extract_mentioned_nodes(answer: str) -> List[str]:
@@ -562,11 +524,12 @@ def build_question_payload(depth: int = 3, branching_factor: int = 2,
                           value_range: Tuple[int, int] = (-10, 10),
                           seed: Optional[int] = None) -> Dict[str, Any]:
     """Construiește pachetul complet de întrebare"""
+    rng = random.Random(seed)
     root, metadata = generate_game_tree(
         depth=depth,
         branching_factor=branching_factor,
         value_range=value_range,
-        seed=seed
+        rng=rng
     )
     
     solution = solve_tree(root)
@@ -583,7 +546,7 @@ def build_question_payload(depth: int = 3, branching_factor: int = 2,
         }
     
     return {
-        "id": f"MINMAX-{random.randint(100000, 999999)}",
+        "id": f"MINMAX-{rng.randint(100000, 999999)}",
         "depth": depth,
         "branching_factor": branching_factor,
         "value_range": list(value_range),
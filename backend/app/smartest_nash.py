@@ -5,8 +5,12 @@ Dep: numpy
 
 from __future__ import annotations
 from typing import List, Tuple, Optional, Dict, Any
+from functools import lru_cache
+import re
+
 import numpy as np
-import random
+
+import app.metrics as metrics
 
 # ---------- utilități best-responses ----------
 
@@ -48,22 +52,25 @@ def _rand_labels(prefix: str, n: int) -> List[str]:
         return [f"{prefix}{ABC[k]}" for k in range(n)]
     return [f"{prefix}{k+1}" for k in range(n)]
 
+@metrics.timed("nash_generate")
 def generate_game(rows: int = 2, cols: int = 2,
                   payoff_min: int = -5, payoff_max: int = 9,
                   ensure: str = "any",
-                  seed: Optional[int] = None) -> Dict[str, Any]:
+                  seed: Optional[int] = None,
+                  rng: Optional[np.random.Generator] = None) -> Dict[str, Any]:
     """
     ensure ∈ {"any","atleast_one","unique","none"}
+    rng: generator explicit; dacă lipsește se creează din seed (fără stare globală)
     """
     assert rows >= 2 and cols >= 2
-    if seed is not None:
-        random.seed(seed); np.random.seed(seed)
+    if rng is None:
+        rng = np.random.default_rng(seed)
 
     attempts = 0
     while True:
         attempts += 1
-        A = np.random.randint(payoff_min, payoff_max+1, size=(rows, cols))
-        B = np.random.randint(payoff_min, payoff_max+1, size=(rows, cols))
+        A = rng.integers(payoff_min, payoff_max+1, size=(rows, cols))
+        B = rng.integers(payoff_min, payoff_max+1, size=(rows, cols))
         eq = find_pure_nash(A, B)
         ok = (
             (ensure == "any") or
@@ -73,6 +80,7 @@ def generate_game(rows: int = 2, cols: int = 2,
         )
         if ok or attempts > 5000:
             break
+    metrics.observe("smartest_nash_generate_attempts", attempts, (1, 2, 5, 10, 50, 100, 500, 1000, 5000))
 
     return {
         "rows": rows, "cols": cols,
@@ -140,347 +148,178 @@ def format_question_text(payload: Dict[str, Any]) -> str:
 
 # ---------- grading ----------
 
-def _parse_pairs(answer: str, rl: List[str], cl: List[str]):
+_DIACRITICS = str.maketrans({
+    'ă': 'a', 'â': 'a', 'î': 'i', 'ș': 's', 'ş': 's', 'ț': 't', 'ţ': 't',
+    'Ă': 'A', 'Â': 'A', 'Î': 'I', 'Ș': 'S', 'Ş': 'S', 'Ț': 'T', 'Ţ': 'T',
+})
+
+# numere scrise în cuvinte (fără diacritice); "al doilea" / "a doua" se reduc la ultimul cuvânt
+NUMBER_WORDS = {
+    # Română
+    "unu": 1, "una": 1, "primul": 1, "prima": 1, "intai": 1,
+    "doi": 2, "doua": 2, "doilea": 2,
+    "trei": 3, "treia": 3, "treilea": 3,
+    "patru": 4, "patra": 4, "patrulea": 4,
+    "cinci": 5, "cincea": 5, "cincilea": 5,
+    "sase": 6, "sasea": 6, "saselea": 6,
+    "sapte": 7, "saptea": 7, "saptelea": 7,
+    "opt": 8, "opta": 8, "optulea": 8,
+    "noua": 9, "noualea": 9,
+    "zece": 10, "zecea": 10, "zecelea": 10,
+    # Engleză
+    "one": 1, "first": 1, "two": 2, "second": 2, "three": 3, "third": 3,
+    "four": 4, "fourth": 4, "five": 5, "fifth": 5, "six": 6, "sixth": 6,
+    "seven": 7, "seventh": 7, "eight": 8, "eighth": 8, "nine": 9, "ninth": 9,
+    "ten": 10, "tenth": 10,
+}
+
+# răspunsuri de tip "nu există echilibru" (potrivire exactă) și fraze care îl implică oriunde în text
+_NONE_ANSWERS = {
+    "none", "no", "no ne", "no nash", "no pure ne", "nu", "nu exista", "nu sunt", "nu avem",
+    "lipsa", "niciun", "nici un", "zero", "0", "nimic", "fara", "absent", "lipseste", "nu e",
+    "nu este", "nu se gaseste", "nu se gasesc", "nu gasim", "nu gasim echilibru",
+    "lipsa echilibrelor",
+}
+_NONE_PHRASES = (
+    "nu exista", "nu sunt", "niciun echilibru", "nu avem echilibru", "lipsa echilibru", "fara echilibru",
+)
+
+# tipuri de token
+_OPEN, _CLOSE, _SEP, _NUM, _AXIS, _AXIS_WORD = range(6)
+
+_AXIS_WORDS = {
+    "rand": "r", "randul": "r", "randului": "r", "row": "r",
+    "coloana": "c", "coloanei": "c", "col": "c", "column": "c",
+}
+_CONJUNCTIONS = {"si", "and", "sau", "or"}
+
+# un singur lexer: paranteze, separatori, "r1"/"c 2", numere, cuvinte (etichete, numere în litere, filler)
+_LEXER = re.compile(r"""
+    (?P<open>[(\[{]) | (?P<close>[)\]}]) | (?P<sep>[;|&\n]) |
+    (?<![a-z])(?P<axis>[rc])\s*(?P<axis_num>\d+) |
+    (?P<num>\d+) | (?P<word>[a-z]+)
+""", re.IGNORECASE | re.VERBOSE)
+
+
+@lru_cache(maxsize=256)
+def _lexicon(payload_id: Optional[str], row_labels: Tuple[str, ...],
+             col_labels: Tuple[str, ...]) -> Dict[str, Tuple[int, Any]]:
+    """Cuvânt -> (tip token, valoare), precalculat o dată per payload (etichetele au prioritate)"""
+    table: Dict[str, Tuple[int, Any]] = {w: (_NUM, v) for w, v in NUMBER_WORDS.items()}
+    table.update({w: (_AXIS_WORD, axis) for w, axis in _AXIS_WORDS.items()})
+    table.update({w: (_SEP, None) for w in _CONJUNCTIONS})
+    table.update({x.lower(): (_AXIS, ("r", i)) for i, x in enumerate(row_labels)})
+    table.update({x.lower(): (_AXIS, ("c", j)) for j, x in enumerate(col_labels)})
+    return table
+
+
+def _lexicon_for(payload: Dict[str, Any]) -> Dict[str, Tuple[int, Any]]:
+    return _lexicon(payload.get("id"), tuple(payload["row_labels"]), tuple(payload["col_labels"]))
+
+
+def _tokenize(text: str, lexicon: Dict[str, Tuple[int, Any]]) -> List[Tuple[int, Any, str]]:
     """
-    Parsează răspunsul utilizatorului pentru echilibru Nash - versiune flexibilă îmbunătățită.
-    Acceptă multiple formate: "R1C1", "1,1", "A B", "(1,1)", "r1 c1", "rând 1 coloană 2", etc.
-    Acceptă și numere în format text: "unu, doi", "primul, al doilea", etc.
+    Transformă răspunsul în (tip, valoare, text). Cuvintele de axă ("rând", "coloana") marchează
+    numărul vecin: înainte ("rând 1") sau după ("primul rând"). Cuvintele necunoscute sunt ignorate.
     """
-    if not answer:
-        return []
-    
-    s = answer.strip()
-    s_lower = s.lower()
-    
-    # Funcție helper pentru conversia numerelor în text la numere
-    def text_to_number(text: str) -> Optional[int]:
-        """Convertește numere în format text la numere întregi"""
-        text = text.strip().lower()
-        number_map = {
-            # Română
-            "unu": 1, "una": 1, "primul": 1, "prima": 1, "intai": 1, "întâi": 1, "intâi": 1,
-            "doi": 2, "doua": 2, "două": 2, "al doilea": 2, "a doua": 2, "doilea": 2,
-            "trei": 3, "treia": 3, "al treilea": 3, "a treia": 3, "treilea": 3,
-            "patru": 4, "patra": 4, "al patrulea": 4, "a patra": 4, "patrulea": 4,
-            "cinci": 5, "cincea": 5, "a cincea": 5, "al cincilea": 5, "cincilea": 5,
-            "sase": 6, "șase": 6, "sasea": 6, "șasea": 6, "a șasea": 6, "al șaselea": 6,
-            "sapte": 7, "șapte": 7, "saptea": 7, "șaptea": 7, "a șaptea": 7, "al șaptelea": 7,
-            "opt": 8, "opta": 8, "a opta": 8, "al optulea": 8, "optulea": 8,
-            "noua": 9, "nouă": 9, "a noua": 9, "al nouălea": 9, "nouălea": 9,
-            "zece": 10, "zecea": 10, "a zecea": 10, "al zecelea": 10,
-            # Engleză
-            "one": 1, "first": 1,
-            "two": 2, "second": 2,
-            "three": 3, "third": 3,
-            "four": 4, "fourth": 4,
-            "five": 5, "fifth": 5,
-            "six": 6, "sixth": 6,
-            "seven": 7, "seventh": 7,
-            "eight": 8, "eighth": 8,
-            "nine": 9, "ninth": 9,
-            "ten": 10, "tenth": 10
-        }
-        return number_map.get(text)
-    
-    # Verifică dacă utilizatorul spune că nu există echilibru Nash
-    
-    # Verifică dacă utilizatorul spune că nu există echilibru Nash
-    # Versiune extinsă cu mai multe variante
-    none_patterns = [
-        "none", "no", "no ne", "no nash", "no pure ne", "nu", "nu exista", 
-        "nu există", "nu sunt", "nu avem", "lipsă", "lipsa", "niciun", 
-        "nici un", "zero", "0", "nimic", "fără", "fara", "nu există echilibru",
-        "nu exista echilibru", "nu sunt echilibre", "nu avem echilibru",
-        "nu exista nash", "nu există nash", "nu exista echilibre", "nu există echilibre",
-        "nu exista echilibru nash", "nu există echilibru nash", "nu exista ne",
-        "nu există ne", "nu exista nash pur", "nu există nash pur",
-        "lipsa echilibrelor", "lipsă echilibrelor", "fara echilibru", "fără echilibru",
-        "nu se gaseste", "nu se găsește", "nu se gasesc", "nu se găsesc",
-        "nu gasim", "nu găsim", "nu gasim echilibru", "nu găsim echilibru",
-        "absent", "lipseste", "lipsește", "nu e", "nu este", "nu sunt echilibre nash"
-    ]
-    
-    # Verifică potrivire exactă
-    if s_lower in none_patterns:
-        return None
-    
-    # Verifică pattern-uri în text
-    none_phrases = [
-        "nu există", "nu exista", "nu sunt", "niciun echilibru", "nu avem echilibru",
-        "nu există nash", "nu exista nash", "nu există ne", "nu exista ne",
-        "nu există echilibru", "nu exista echilibru", "nu sunt echilibre",
-        "lipsă echilibru", "lipsa echilibru", "fără echilibru", "fara echilibru"
-    ]
-    if any(phrase in s_lower for phrase in none_phrases):
-        return None
-    
-    import re
-    
-    # Extrage perechi din formate complexe: "perechile (1,2) și (2,3)" sau "echilibrele R1C1, R2C2"
-    # Caută pattern-uri de tipul "(1,2)" sau "[1,2]" sau "R1C1" în întregul text
-    complex_pairs = []
-    
-    # Pattern pentru perechi în paranteze: (1,2), [1,2], {1,2}
-    # IMPORTANT: Caută în textul original, înainte de normalizare
-    paren_pairs = re.findall(r'[\(\[\{]\s*(\d+)\s*[,:]\s*(\d+)\s*[\)\]\}]', s)
-    for pair in paren_pairs:
-        try:
-            complex_pairs.append((int(pair[0])-1, int(pair[1])-1))
-        except:
-            pass
-    
-    # Pattern pentru perechi cu etichete în paranteze: (RA,CB), (RA CB), [RA,CB], etc.
-    # Caută pattern-uri precum (RA,CB) sau (RA CB) - etichete de rând și coloană
-    rl_map = {x.lower(): i for i, x in enumerate(rl)}
-    cl_map = {x.lower(): j for j, x in enumerate(cl)}
-    
-    # Pattern pentru (RA,CB) sau (RA CB) - etichete separate prin virgulă sau spațiu
-    label_paren_pattern = r'[\(\[\{]\s*([A-Za-z]+)\s*[,:\s]+\s*([A-Za-z]+)\s*[\)\]\}]'
-    label_paren_matches = re.findall(label_paren_pattern, s)
-    for match in label_paren_matches:
-        tok1 = match[0].strip().upper()
-        tok2 = match[1].strip().upper()
-        # Verifică dacă sunt etichete valide (rând și coloană)
-        if tok1.lower() in rl_map and tok2.lower() in cl_map:
-            complex_pairs.append((rl_map[tok1.lower()], cl_map[tok2.lower()]))
-        # Dacă sunt ambele rânduri sau ambele coloane, le ignorăm (vor fi detectate ca invalide mai târziu)
-    
-    # Pattern pentru R1C1 sau R1 C1
-    rc_pairs = re.findall(r'r\s*(\d+)\s*c\s*(\d+)', s_lower)
-    for pair in rc_pairs:
-        try:
-            complex_pairs.append((int(pair[0])-1, int(pair[1])-1))
-        except:
-            pass
-    
-    # Elimină duplicate din complex_pairs
-    seen = set()
-    unique_complex_pairs = []
-    for pair in complex_pairs:
-        if pair not in seen:
-            seen.add(pair)
-            unique_complex_pairs.append(pair)
-    complex_pairs = unique_complex_pairs
-    
-    # Dacă am găsit perechi în paranteze (numere sau etichete), le folosim direct
-    # și nu mai procesăm prin split(",") pentru a evita probleme când nu există virgulă între perechi
-    if complex_pairs:
-        return complex_pairs
-    
-    # Normalizează separatori - extinde lista (doar dacă nu am găsit perechi complexe)
-    for sep in [";", "\n", "și", "and", "&", "si", "sau", "or", "|"]:
-        s = s.replace(sep, ",")
-    
-    # IMPORTANT: Înainte de split(","), încercăm să extragem perechi separate doar prin spațiu
-    # Pattern pentru perechi în paranteze separate prin spațiu: (1,3) (2,3)
-    spaced_paren_pairs = re.findall(r'[\(\[\{]\s*(\d+)\s*[,:]\s*(\d+)\s*[\)\]\}]', s)
-    if spaced_paren_pairs and len(spaced_paren_pairs) > 1:
-        # Dacă am găsit multiple perechi în paranteze, le procesăm direct
-        result = []
-        for pair in spaced_paren_pairs:
-            try:
-                result.append((int(pair[0])-1, int(pair[1])-1))
-            except:
-                pass
-        if result:
-            return result
-    
-    # Împarte în părți pentru procesare ulterioară
-    parts = [p.strip() for p in s.split(",") if p.strip()]
-    if not parts:
-        return []
+    tokens: List[Tuple[int, Any, str]] = []
+    axis_next: Optional[str] = None
+    for m in _LEXER.finditer(text):
+        kind = m.lastgroup
+        raw = m.group()
+        if kind == "open":
+            tok = (_OPEN, None, raw)
+        elif kind == "close":
+            tok = (_CLOSE, None, raw)
+        elif kind == "sep":
+            tok = (_SEP, None, raw)
+        elif kind == "axis_num":
+            tok = (_AXIS, (m.group("axis").lower(), int(m.group("axis_num")) - 1), raw)
+        elif kind == "num":
+            tok = (_NUM, int(raw), raw)
+        else:
+            entry = lexicon.get(raw.lower())
+            if entry is None:
+                continue
+            tok = (entry[0], entry[1], raw)
+        if tok[0] == _AXIS_WORD:
+            if tokens and tokens[-1][0] == _NUM:
+                last = tokens[-1]
+                tokens[-1] = (_AXIS, (tok[1], last[1] - 1), last[2])
+            else:
+                axis_next = tok[1]
+            continue
+        if tok[0] == _NUM and axis_next is not None:
+            tok = (_AXIS, (axis_next, tok[1] - 1), raw)
+        axis_next = None
+        tokens.append(tok)
+    return tokens
 
-    rl_map = {x.lower(): i for i, x in enumerate(rl)}
-    cl_map = {x.lower(): j for j, x in enumerate(cl)}
 
-    out = list(complex_pairs)  # Pornește cu perechile găsite din pattern-uri complexe
-    
-    for token in parts:
-        t = token.strip()
-        t_clean = t.replace("(", "").replace(")", "").replace("[", "").replace("]", "").replace("{", "").replace("}", "").replace("-", " ").replace("_", " ").replace(":", " ")
-        
-        # Skip dacă token-ul a fost deja procesat în complex_pairs
-        # Verifică dacă token-ul conține o pereche care a fost deja găsită
-        nums_in_token = re.findall(r'\d+', t_clean)
-        if len(nums_in_token) >= 2:
-            try:
-                token_pair = (int(nums_in_token[0])-1, int(nums_in_token[1])-1)
-                if token_pair in complex_pairs:
-                    continue
-            except:
-                pass
-        
-        # Format: "rând 1 coloană 2" sau "rand 1 coloana 2" sau "rândul 1, coloana 2"
-        m_rand_col = re.search(r'(?:rând|rand|rândul|randul|row)\s*(\d+).*?(?:coloană|coloană|coloana|col|column)\s*(\d+)', t_clean, re.IGNORECASE)
-        if m_rand_col:
-            try:
-                pair = (int(m_rand_col.group(1))-1, int(m_rand_col.group(2))-1)
-                if pair not in out:
-                    out.append(pair)
-                continue
-            except:
-                pass
-        
-        # Format invers: "coloană 2 rând 1"
-        m_col_rand = re.search(r'(?:coloană|coloană|coloana|col|column)\s*(\d+).*?(?:rând|rand|rândul|randul|row)\s*(\d+)', t_clean, re.IGNORECASE)
-        if m_col_rand:
-            try:
-                pair = (int(m_col_rand.group(2))-1, int(m_col_rand.group(1))-1)
-                if pair not in out:
-                    out.append(pair)
-                continue
-            except:
-                pass
-        
-        # Format: "r1c1" sau "r 1 c 1" sau "R1 C1"
-        m = re.search(r"r\s*(\d+)\s*c\s*(\d+)", t_clean, re.IGNORECASE)
-        if m:
-            try:
-                pair = (int(m.group(1))-1, int(m.group(2))-1)
-                if pair not in out:
-                    out.append(pair)
-                continue
-            except:
-                pass
-        
-        # Format: "1,1" sau "1 1" sau "1:1" - două numere consecutive
-        m2 = re.findall(r"\d+", t_clean)
-        if len(m2) >= 2:
-            try:
-                pair = (int(m2[0])-1, int(m2[1])-1)
-                if pair not in out:
-                    out.append(pair)
-                continue
-            except:
-                pass
-        
-        # Format: numere în format text - "unu, doi" sau "primul, al doilea"
-        text_number_pattern = r'\b(unu|una|primul|prima|intai|întâi|intâi|doi|doua|două|al doilea|a doua|doilea|trei|treia|al treilea|a treia|treilea|patru|patra|al patrulea|a patra|patrulea|cinci|cincea|a cincea|al cincilea|cincilea|sase|șase|sasea|șasea|a șasea|al șaselea|sapte|șapte|saptea|șaptea|a șaptea|al șaptelea|opt|opta|a opta|al optulea|optulea|noua|nouă|a noua|al nouălea|nouălea|zece|zecea|a zecea|al zecelea|one|first|two|second|three|third|four|fourth|five|fifth|six|sixth|seven|seventh|eight|eighth|nine|ninth|ten|tenth)\b'
-        text_numbers = re.findall(text_number_pattern, t_clean, re.IGNORECASE)
-        if len(text_numbers) >= 2:
-            try:
-                num1 = text_to_number(text_numbers[0])
-                num2 = text_to_number(text_numbers[1])
-                if num1 is not None and num2 is not None:
-                    pair = (num1-1, num2-1)
-                    if pair not in out:
-                        out.append(pair)
-                    continue
-            except:
-                pass
-        
-        # Format: "A B" sau "A, B" sau "A și B" - etichete de rând și coloană
-        toks = t_clean.split()
-        if len(toks) >= 2:
-            tok1 = toks[0].lower()
-            tok2 = toks[1].lower()
-            # IMPORTANT: Verifică că primul e rând și al doilea e coloană
-            # Dacă ambele sunt rânduri sau ambele sunt coloane, ignoră (e greșit)
-            if tok1 in rl_map and tok2 in cl_map:
-                pair = (rl_map[tok1], cl_map[tok2])
-                if pair not in out:
-                    out.append(pair)
-                continue
-            # Dacă ambele sunt rânduri sau ambele sunt coloane, ignoră (nu e o pereche validă)
-            elif (tok1 in rl_map and tok2 in rl_map) or (tok1 in cl_map and tok2 in cl_map):
-                # Ignoră - nu e o pereche validă (ex: "RB RB" sau "CA CB")
-                continue
-        
-        # Format: "rând A coloană B" sau "A și B" - căutare în orice ordine
-        if len(toks) >= 2:
-            found_r = None
-            found_c = None
-            for tok in toks:
-                if tok.lower() in rl_map and found_r is None:
-                    found_r = rl_map[tok.lower()]
-                if tok.lower() in cl_map and found_c is None:
-                    found_c = cl_map[tok.lower()]
-            # IMPORTANT: Trebuie să avem exact un rând și o coloană
-            if found_r is not None and found_c is not None:
-                pair = (found_r, found_c)
-                if pair not in out:
-                    out.append(pair)
-                continue
-            # Dacă avem doar rânduri sau doar coloane, ignoră (nu e o pereche validă)
-            elif (found_r is not None and found_c is None) or (found_r is None and found_c is not None):
-                # Ignoră - nu e o pereche completă validă
-                continue
-        
-        # Format: "strategia R1 cu C2" sau "echilibru la R1 C2"
-        m_strategie = re.search(r'(?:strategia|strategie|echilibru|ne|nash)\s*(?:la|la|cu|with)?\s*r\s*(\d+).*?c\s*(\d+)', t_clean, re.IGNORECASE)
-        if m_strategie:
-            try:
-                pair = (int(m_strategie.group(1))-1, int(m_strategie.group(2))-1)
-                if pair not in out:
-                    out.append(pair)
+def _is_none_answer(text: str) -> bool:
+    s = text.lower().strip(" .!")
+    return s in _NONE_ANSWERS or any(phrase in s for phrase in _NONE_PHRASES)
+
+
+def _parse_answer(answer: str, lexicon: Dict[str, Tuple[int, Any]]) -> Tuple[Optional[List[Tuple[int, int]]], List[str]]:
+    """
+    Gramatica peste fluxul de tokeni: două numere consecutive formează o pereche (rând, coloană);
+    un rând și o coloană (în orice ordine) formează o pereche; rând-rând sau coloană-coloană sunt
+    perechi invalide. Parantezele și separatorii închid o pereche neterminată.
+    Returnează (perechi 0-based sau None pentru "nu există", perechi invalide ca text).
+    """
+    if not answer or not answer.strip():
+        return [], []
+    text = answer.strip().translate(_DIACRITICS)
+    if _is_none_answer(text):
+        return None, []
+
+    pairs: List[Tuple[int, int]] = []
+    invalid: List[str] = []
+    pending: Optional[Tuple[int, Any, str]] = None
+    in_paren = False
+    for tok in _tokenize(text, lexicon):
+        kind = tok[0]
+        if kind in (_OPEN, _CLOSE, _SEP):
+            pending = None
+            in_paren = kind == _OPEN
+            continue
+        if pending is None or pending[0] != kind:
+            # un număr simplu nu se combină cu o etichetă; noul element pornește o pereche nouă
+            pending = tok
+            continue
+        if kind == _NUM:
+            pair = (pending[1] - 1, tok[1] - 1)
+        else:
+            (axis1, idx1), (axis2, idx2) = pending[1], tok[1]
+            if axis1 == axis2:
+                if in_paren:
+                    invalid.append(f"({pending[2].upper()},{tok[2].upper()})")
+                else:
+                    invalid.append(f"{pending[2]} {tok[2]}")
+                pending = None
                 continue
-            except:
-                pass
-    
-    return out
+            pair = (idx1, idx2) if axis1 == "r" else (idx2, idx1)
+        if pair not in pairs:
+            pairs.append(pair)
+        pending = None
+    return pairs, invalid
+
+
+def _parse_pairs(answer: str, rl: List[str], cl: List[str]):
+    """
+    Parsează răspunsul utilizatorului pentru echilibru Nash.
+    Acceptă: "R1C1", "1,1", "RA CB", "(1,1)", "r1 c1", "rând 1 coloană 2", "primul rând, a doua coloană".
+    Returnează lista de perechi 0-based sau None dacă utilizatorul spune că nu există echilibru.
+    """
+    return _parse_answer(answer, _lexicon(None, tuple(rl), tuple(cl)))[0]
 
 def grade_answer(answer: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     A = np.array(payload["A"]); B = np.array(payload["B"])
-    rl, cl = payload["row_labels"], payload["col_labels"]
     gold = set(find_pure_nash(A,B))
-    
-    # Verifică dacă există perechi invalide în răspuns (două rânduri sau două coloane)
-    invalid_pairs = []
-    import re
-    s = answer.strip()
-    s_lower = s.lower()
-    
-    # Normalizează separatori
-    for sep in [";", "\n", "și", "and", "&", "si", "sau", "or", "|"]:
-        s = s.replace(sep, ",")
-    
-    # IMPORTANT: Extrage perechi în paranteze înainte de split(",") pentru a detecta corect
-    # perechile chiar și când nu există virgulă între ele: (1,3) (2,3)
-    rl_map = {x.lower(): i for i, x in enumerate(rl)}
-    cl_map = {x.lower(): j for j, x in enumerate(cl)}
-    
-    # Extrage toate perechile cu etichete în paranteze pentru detectarea perechilor invalide
-    paren_label_matches = re.findall(r'[\(\[\{]\s*([A-Za-z]+)\s*[,:\s]+\s*([A-Za-z]+)\s*[\)\]\}]', s)
-    for match in paren_label_matches:
-        tok1 = match[0].strip().upper()
-        tok2 = match[1].strip().upper()
-        # Verifică dacă ambele sunt rânduri (invalid)
-        if tok1.lower() in rl_map and tok2.lower() in rl_map:
-            invalid_pairs.append(f"({tok1},{tok2})")
-        # Verifică dacă ambele sunt coloane (invalid)
-        elif tok1.lower() in cl_map and tok2.lower() in cl_map:
-            invalid_pairs.append(f"({tok1},{tok2})")
-    
-    parts = [p.strip() for p in s.split(",") if p.strip()]
-    
-    for token in parts:
-        t_original = token.strip()
-        # Verifică dacă token-ul conține paranteze cu etichete (ex: (RA,CB) sau (CC,CC))
-        paren_label_match = re.search(r'[\(\[\{]\s*([A-Za-z]+)\s*[,:\s]+\s*([A-Za-z]+)\s*[\)\]\}]', t_original)
-        if paren_label_match:
-            tok1 = paren_label_match.group(1).strip().upper()
-            tok2 = paren_label_match.group(2).strip().upper()
-            # Verifică dacă ambele sunt rânduri (invalid) - inclusiv cazul când sunt identice (RA RA)
-            if tok1.lower() in rl_map and tok2.lower() in rl_map:
-                invalid_pairs.append(f"({tok1},{tok2})")
-            # Verifică dacă ambele sunt coloane (invalid) - inclusiv cazul când sunt identice (CC CC)
-            elif tok1.lower() in cl_map and tok2.lower() in cl_map:
-                invalid_pairs.append(f"({tok1},{tok2})")
-        
-        # Continuă cu verificarea normală (fără paranteze)
-        t_clean = t_original.replace("(", "").replace(")", "").replace("[", "").replace("]", "").replace("-", " ").replace("_", " ")
-        toks = t_clean.split()
-        if len(toks) >= 2:
-            tok1 = toks[0].lower()
-            tok2 = toks[1].lower()
-            # Verifică dacă ambele sunt rânduri (invalid) - inclusiv cazul când sunt identice (RA RA)
-            if tok1 in rl_map and tok2 in rl_map:
-                invalid_pairs.append(f"{toks[0]} {toks[1]}")
-            # Verifică dacă ambele sunt coloane (invalid) - inclusiv cazul când sunt identice (CC CC)
-            elif tok1 in cl_map and tok2 in cl_map:
-                invalid_pairs.append(f"{toks[0]} {toks[1]}")
-    
-    parsed = _parse_pairs(answer, rl, cl)
+
+    # un singur parcurs: perechile valide și perechile invalide (rând-rând / coloană-coloană)
+    parsed, invalid_pairs = _parse_answer(answer, _lexicon_for(payload))
 
     if parsed is None:  # user a zis "none"
         if len(gold) == 0:
@@ -531,13 +370,14 @@ def grade_answer(answer: str, payload: Dict[str, Any]) -> Dict[str, Any]:
 # ---------- pachet complet întrebare ----------
 
 def build_question_payload(rows=2, cols=2, ensure="unique", seed=None) -> Dict[str, Any]:
-    p = generate_game(rows=rows, cols=cols, ensure=ensure, seed=seed)
+    rng = np.random.default_rng(seed)
+    p = generate_game(rows=rows, cols=cols, ensure=ensure, rng=rng)
     A = np.array(p["A"]); B = np.array(p["B"])
     eq = find_pure_nash(A,B)
     qtext = format_question_text(p)
     expl = build_explanation(A,B,p["row_labels"],p["col_labels"])
     p_out = dict(p)
-    p_out["id"] = f"NASH-{random.randint(100000,999999)}"
+    p_out["id"] = f"NASH-{int(rng.integers(100000, 1000000))}"
     p_out["question_text"] = qtext
     p_out["solution"] = {
         "equilibria": [[i+1,j+1] for (i,j) in eq],
@@ -6,7 +6,16 @@ Strategii: Backtracking, Greedy, Hill Climbing, Simulated Annealing, Genetic Alg
 
 from __future__ import annotations
 from typing import List, Tuple, Optional, Dict, Any
+import itertools
 import random
+import re
+
+import app.answer_parser as answer_parser
+import app.graph_coloring as graph_coloring
+import app.hanoi as hanoi
+import app.knight_tour as knight_tour
+import app.nqueens as nqueens
+import app.problem_solvers as solvers
 
 # ---------- definiții probleme ----------
 
@@ -37,89 +46,86 @@ PROBLEMS = {
     }
 }
 
+# tipuri de întrebări: alegerea strategiei (toate problemele) sau numărul minim de mutări (Hanoi)
+QUESTION_KINDS = ["strategy", "min_moves"]
+
+# variantele de Hanoi pentru întrebările "câte mutări"
+HANOI_MOVES_PEGS = (4, 5)
+
 # ---------- generare instanță problemă ----------
 
-def generate_n_queens_instance(n: int = 4, seed: Optional[int] = None) -> Dict[str, Any]:
+def generate_n_queens_instance(n: int = 4, seed: Optional[int] = None,
+                               rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """Generează o instanță pentru n-queens"""
-    if seed is not None:
-        random.seed(seed)
-    
-    # Alege strategia corectă în funcție de dimensiunea problemei
-    if n <= 6:
-        # Pentru probleme mici, Backtracking este eficient și garantează soluția optimă
-        correct_strategy = "Backtracking"
-    elif n == 7:
-        # Pentru probleme medii, Constraint Satisfaction cu propagare este eficient
-        correct_strategy = "Constraint Satisfaction"
-    else:  # n >= 8
-        # Pentru probleme mari, algoritmi metaheuristici sunt mai rapizi
-        # Simulated Annealing este de obicei mai bun decât Genetic Algorithm pentru n-queens
-        correct_strategy = "Simulated Annealing"
+    if rng is None:
+        rng = random.Random(seed)
+    
+    # Alege strategia corectă după efortul măsurat al fiecărui solver pe instanță
+    report = solvers.solve_n_queens(n)
+    correct_strategy = solvers.recommend_strategy(report)
+    
+    solutions = nqueens.count_solutions(n)
     
     return {
         "problem_type": "n-queens",
         "instance": {
             "n": n,
-            "description": f"Plasează {n} regine pe o tablă de {n}x{n} astfel încât să nu se atace reciproc."
+            "solutions": solutions,
+            "description": f"Plasează {n} regine pe o tablă de {n}x{n} astfel încât să nu se atace reciproc (instanța are exact {solutions} soluții)."
         },
-        "correct_strategy": correct_strategy
+        "correct_strategy": correct_strategy,
+        "search_effort": solvers.effort_summary(report)
     }
 
-def generate_hanoi_instance(disks: int = 3, pegs: int = 3, seed: Optional[int] = None) -> Dict[str, Any]:
+def generate_hanoi_instance(disks: int = 3, pegs: int = 3, seed: Optional[int] = None,
+                            rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """Generează o instanță pentru Hanoi"""
-    if seed is not None:
-        random.seed(seed)
-    
-    # Alege strategia corectă în funcție de numărul de discuri
-    if disks <= 4:
-        # Pentru puține discuri, Recursive Backtracking este natural și eficient
-        correct_strategy = "Recursive Backtracking"
-    elif disks == 5:
-        # Pentru probleme medii, Iterative Deepening găsește soluția optimă eficient
-        correct_strategy = "Iterative Deepening"
-    else:  # disks >= 6
-        # Pentru multe discuri, Dynamic Programming evită recalcularea subproblemelor
-        correct_strategy = "Dynamic Programming"
+    if rng is None:
+        rng = random.Random(seed)
+    
+    # Alege strategia corectă după efortul măsurat al fiecărui solver pe instanță
+    report = solvers.solve_hanoi(disks, pegs)
+    correct_strategy = solvers.recommend_strategy(report)
     
     return {
         "problem_type": "hanoi",
         "instance": {
             "disks": disks,
             "pegs": pegs,
+            "min_moves": hanoi.min_moves(disks, pegs),
             "description": f"Mută {disks} discuri de pe tija inițială pe tija finală folosind {pegs} tije, respectând regulile clasice."
         },
-        "correct_strategy": correct_strategy
+        "correct_strategy": correct_strategy,
+        "search_effort": solvers.effort_summary(report)
     }
 
-def generate_graph_coloring_instance(vertices: int = 5, edges: List[Tuple[int, int]] = None, colors: int = 3, seed: Optional[int] = None) -> Dict[str, Any]:
-    """Generează o instanță pentru graph coloring"""
-    if seed is not None:
-        random.seed(seed)
+def generate_graph_coloring_instance(vertices: int = 5, edges: List[Tuple[int, int]] = None, colors: Optional[int] = None,
+                                     model: Optional[str] = None, seed: Optional[int] = None,
+                                     rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """
+    Generează o instanță pentru graph coloring.
+    Fără muchii date, graful vine din graph_coloring (model aleator); colors implicit = numărul cromatic
+    (sau marginea superioară demonstrată de o colorare), deci instanța este mereu colorabilă.
+    """
+    if rng is None:
+        rng = random.Random(seed)
     
     if edges is None:
-        # Generează un graf simplu
-        edges = []
-        for i in range(vertices):
-            for j in range(i + 1, min(i + 3, vertices)):
-                if random.random() > 0.3:  # 70% probabilitate de muchie
-                    edges.append((i, j))
+        if model is None:
+            model = rng.choice(graph_coloring.GRAPH_MODELS)
+        graph = graph_coloring.generate_instance(vertices, model=model, colors=colors, rng=rng)
+        edges, colors, chi = graph["edges"], graph["colors"], graph["chromatic"]
+    else:
+        chi = graph_coloring.chromatic_number(graph_coloring.Graph.from_edges(vertices, edges))
+        if colors is None:
+            colors = chi["upper"]
     
     num_edges = len(edges)
     edge_density = num_edges / (vertices * (vertices - 1) / 2) if vertices > 1 else 0
     
-    # Alege strategia corectă în funcție de dimensiunea și densitatea grafului
-    if vertices <= 5 and edge_density > 0.5:
-        # Grafuri mici și dense: Backtracking garantează soluția optimă
-        correct_strategy = "Backtracking"
-    elif vertices <= 5:
-        # Grafuri mici și rare: Constraint Satisfaction este eficient
-        correct_strategy = "Constraint Satisfaction"
-    elif edge_density < 0.4:
-        # Grafuri mari și rare: Greedy Coloring este rapid și eficient
-        correct_strategy = "Greedy Coloring"
-    else:
-        # Grafuri mari și dense: Welsh-Powell oferă un compromis bun
-        correct_strategy = "Welsh-Powell"
+    # Alege strategia corectă după efortul măsurat al fiecărui solver pe instanță
+    report = solvers.solve_graph_coloring(vertices, edges, colors)
+    correct_strategy = solvers.recommend_strategy(report)
     
     return {
         "problem_type": "graph_coloring",
@@ -127,64 +133,81 @@ def generate_graph_coloring_instance(vertices: int = 5, edges: List[Tuple[int, i
             "vertices": vertices,
             "edges": edges,
             "colors": colors,
+            "graph_model": model,
+            "chromatic_number": chi["chromatic"],
+            "colorable": graph_coloring.colorability(chi, colors),
             "description": f"Colorează un graf cu {vertices} noduri și {num_edges} muchii folosind cel mult {colors} culori, astfel încât nodurile adiacente să aibă culori diferite."
         },
-        "correct_strategy": correct_strategy
+        "correct_strategy": correct_strategy,
+        "search_effort": solvers.effort_summary(report)
     }
 
-def generate_knight_tour_instance(size: int = 5, seed: Optional[int] = None) -> Dict[str, Any]:
-    """Generează o instanță pentru knight's tour"""
-    if seed is not None:
-        random.seed(seed)
-    
-    start_pos = (random.randint(0, size-1), random.randint(0, size-1))
-    
-    # Alege strategia corectă în funcție de dimensiunea tablei
-    if size == 5:
-        # Pentru table mici, Backtracking găsește soluția completă eficient
-        correct_strategy = "Backtracking"
-    elif size == 6:
-        # Pentru table medii, Warnsdorff's Heuristic este foarte eficient și rapid
-        correct_strategy = "Warnsdorff's Heuristic"
-    else:  # size >= 7
-        # Pentru table mari, Warnsdorff's Heuristic rămâne cea mai bună alegere
-        correct_strategy = "Warnsdorff's Heuristic"
+def generate_knight_tour_instance(size: int = 5, seed: Optional[int] = None,
+                                  rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """
+    Generează o instanță pentru knight's tour.
+    Poziția de start este verificată cu motorul knight_tour: dacă din ea nu există tur
+    (ex. culoarea minoritară pe o tablă impară), se alege alt pătrat. Când din start există și un tur
+    închis, jumătate din instanțe îl cer pe acesta (acolo backtracking-ul ordonat bate des Warnsdorff).
+    """
+    if rng is None:
+        rng = random.Random(seed)
+    
+    start_pos = (rng.randint(0, size-1), rng.randint(0, size-1))
+    tour = knight_tour.find_tour(size, knight_tour.square(size, start_pos))
+    if not tour["found"]:
+        squares = list(range(size * size))
+        rng.shuffle(squares)
+        for sq in squares:
+            tour = knight_tour.find_tour(size, sq)
+            if tour["found"]:
+                start_pos = knight_tour.position(size, sq)
+                break
+    closed = knight_tour.find_tour(size, knight_tour.square(size, start_pos), closed=True)
+    ask_closed = rng.random() < 0.5 and closed["found"]
+    
+    # Alege strategia corectă după efortul măsurat al fiecărui solver pe instanță
+    report = solvers.solve_knight_tour(size, start_pos, closed=ask_closed)
+    correct_strategy = solvers.recommend_strategy(report)
+    tour_kind = "tur închis al calului (ultima săritură revine în poziția de start)" if ask_closed else "tur complet al calului"
     
     return {
         "problem_type": "knight_tour",
         "instance": {
             "board_size": size,
             "start_position": start_pos,
-            "description": f"Găsește un tur complet al calului pe o tablă de {size}x{size}, începând din poziția {start_pos}."
+            "tour_exists": tour["found"],
+            "closed_tour_exists": closed["found"],
+            "closed": ask_closed,
+            "description": f"Găsește un {tour_kind} pe o tablă de {size}x{size}, începând din poziția {start_pos}."
         },
-        "correct_strategy": correct_strategy
+        "correct_strategy": correct_strategy,
+        "search_effort": solvers.effort_summary(report)
     }
 
 # ---------- generare întrebare ----------
 
-def generate_problem_question(problem_type: Optional[str] = None, seed: Optional[int] = None) -> Dict[str, Any]:
+def generate_problem_question(problem_type: Optional[str] = None, seed: Optional[int] = None,
+                              rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """Generează o întrebare despre o problemă și strategia sa"""
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random.Random(seed)
     
     if problem_type is None:
-        problem_type = random.choice(list(PROBLEMS.keys()))
+        problem_type = rng.choice(list(PROBLEMS.keys()))
     
     problem_info = PROBLEMS[problem_type]
     
     # Generează instanța
     if problem_type == "n-queens":
-        instance_data = generate_n_queens_instance(n=random.randint(4, 8), seed=seed)
+        instance_data = generate_n_queens_instance(n=rng.randint(4, 8), rng=rng)
     elif problem_type == "hanoi":
-        instance_data = generate_hanoi_instance(disks=random.randint(3, 5), pegs=3, seed=seed)
+        instance_data = generate_hanoi_instance(disks=rng.randint(3, 5), pegs=rng.randint(3, 5), rng=rng)
     elif problem_type == "graph_coloring":
-        instance_data = generate_graph_coloring_instance(
-            vertices=random.randint(4, 6),
-            colors=random.randint(3, 4),
-            seed=seed
-        )
+        # de la ~8 noduri colorarea greedy în ordinea naturală ratează des numărul cromatic
+        instance_data = generate_graph_coloring_instance(vertices=rng.randint(8, 14), rng=rng)
     elif problem_type == "knight_tour":
-        instance_data = generate_knight_tour_instance(size=random.randint(5, 6), seed=seed)
+        instance_data = generate_knight_tour_instance(size=rng.randint(5, 8), rng=rng)
     else:
         raise ValueError(f"Problem type {problem_type} not supported")
     
@@ -193,8 +216,8 @@ def generate_problem_question(problem_type: Optional[str] = None, seed: Optional
     # Generează opțiuni (corectă + 3 greșite)
     all_strategies = problem_info["strategies"]
     wrong_strategies = [s for s in all_strategies if s != correct_strategy]
-    options = [correct_strategy] + random.sample(wrong_strategies, min(3, len(wrong_strategies)))
-    random.shuffle(options)
+    options = [correct_strategy] + rng.sample(wrong_strategies, min(3, len(wrong_strategies)))
+    rng.shuffle(options)
     
     return {
         "problem_type": problem_type,
@@ -202,7 +225,33 @@ def generate_problem_question(problem_type: Optional[str] = None, seed: Optional
         "instance": instance_data["instance"],
         "correct_strategy": correct_strategy,
         "options": options,
-        "all_strategies": all_strategies
+        "all_strategies": all_strategies,
+        "search_effort": instance_data["search_effort"]
+    }
+
+def generate_hanoi_moves_question(disks: Optional[int] = None, pegs: Optional[int] = None, seed: Optional[int] = None,
+                                  rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """Generează o întrebare "câte mutări minime" pentru Hanoi cu 4 sau 5 tije (răspuns exact, Frame–Stewart)"""
+    if rng is None:
+        rng = random.Random(seed)
+    if pegs is None:
+        pegs = rng.choice(HANOI_MOVES_PEGS)
+    if disks is None:
+        disks = rng.randint(4, 20)
+    moves, split = hanoi.frame_stewart(disks, pegs)
+    
+    return {
+        "problem_type": "hanoi",
+        "problem_name": PROBLEMS["hanoi"]["name"],
+        "question_kind": "min_moves",
+        "instance": {
+            "disks": disks,
+            "pegs": pegs,
+            "description": f"Turnurile din Hanoi cu {pegs} tije și {disks} discuri: toate discurile pornesc pe prima tijă și trebuie mutate pe ultima, câte un disc pe rând, fără a pune un disc mai mare peste unul mai mic."
+        },
+        "correct_moves": moves,
+        "split": split,
+        "first_moves": hanoi.format_moves(list(itertools.islice(hanoi.moves(disks, pegs), 8)))
     }
 
 # ---------- formatare text întrebare ----------
@@ -214,6 +263,11 @@ def format_question_text(problem_data: Dict[str, Any]) -> str:
     
     text = f"Pentru problema {problem_name} și instanța dată:\n"
     text += f"{instance_desc}\n\n"
+    
+    if problem_data.get("question_kind") == "min_moves":
+        text += "Care este numărul minim de mutări necesare? Răspunde cu un număr întreg.\n"
+        return text
+    
     text += "Care este cea mai potrivită strategie de rezolvare dintre următoarele?\n"
     
     for i, option in enumerate(problem_data["options"], 1):
@@ -225,132 +279,61 @@ def format_question_text(problem_data: Dict[str, Any]) -> str:
 
 def _parse_answer(answer: str, options: List[str]) -> Optional[str]:
     """
-    Parsează răspunsul utilizatorului - versiune flexibilă îmbunătățită.
-    Acceptă: numere (1-4), nume complete, abrevieri, variante de scriere, răspunsuri parțiale.
+    Parsează răspunsul utilizatorului: numere (1-4), nume complete, abrevieri, variante fără diacritice,
+    răspunsuri parțiale. Tabelul de alias-uri e compilat o dată per set de opțiuni (answer_parser).
     """
-    import re
-    
-    if not answer or not answer.strip():
+    return answer_parser.parse_choice(answer, options)
+
+# ---------- evaluare răspuns ----------
+
+_NUMBER = re.compile(r"\d{1,3}(?:[.,\s]\d{3})+(?!\d)|\d+")
+_WORD = re.compile(r"[^\W\d_]+")
+# cuvintele care numesc mutările, respectiv dimensiunea instanței (numerele lor nu sunt răspunsul)
+_MOVES_WORD = re.compile(r"mut[aă]r[ie]|mișc[aă]r[ie]|miscar[ie]|moves?$", re.IGNORECASE)
+_SIZE_WORD = re.compile(r"dis[ck]|tij[aăei]|pegs?$|rods?$", re.IGNORECASE)
+
+def _parse_number(answer: str) -> Optional[int]:
+    """
+    Extrage numărul de mutări din răspuns (acceptă separatori de mii: 1.023, 1,023, 1 023).
+    Numerele urmate de discuri/tije ("10 discuri", "4 pegs") sunt ignorate; dintre celelalte, are prioritate
+    ultimul lipit de "mutări"/"moves" ("1023 mutări", "mutări: 1023"), altfel ultimul din răspuns.
+    """
+    if not answer:
         return None
-    
-    s = answer.strip()
-    s_lower = s.lower()
-    
-    # Normalizează textul: elimină diacritice pentru matching mai flexibil
-    def normalize_text(text: str) -> str:
-        """Normalizează textul eliminând diacritice și caractere speciale"""
-        replacements = {
-            'ă': 'a', 'â': 'a', 'î': 'i', 'ș': 's', 'ț': 't',
-            'Ă': 'a', 'Â': 'a', 'Î': 'i', 'Ș': 's', 'Ț': 't'
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        return text
-    
-    s_normalized = normalize_text(s_lower)
-    
-    # Strategia 1: Caută număr (1, 2, 3, 4) - acceptă și "opțiunea 1", "varianta 2", etc.
-    num_patterns = [
-        r'\b([1-4])\b',  # Simplu: "1", "2", etc.
-        r'(?:opțiunea|optiunea|varianta|varianta|aleg|alegerea)\s*([1-4])',  # "opțiunea 1"
-        r'(?:numărul|numarul|număr|numar)\s*([1-4])',  # "numărul 1"
-    ]
-    for pattern in num_patterns:
-        num_match = re.search(pattern, s_normalized)
-        if num_match:
-            idx = int(num_match.group(1)) - 1
-            if 0 <= idx < len(options):
-                return options[idx]
-    
-    # Strategia 2: Caută nume strategie direct - matching flexibil
-    # Normalizează opțiunile pentru comparație
-    normalized_options = {normalize_text(opt.lower()): opt for opt in options}
-    
-    for strategy in options:
-        strategy_lower = strategy.lower()
-        strategy_normalized = normalize_text(strategy_lower)
-        
-        # Verifică potrivire exactă (case-insensitive, fără diacritice)
-        if strategy_normalized == s_normalized:
-            return strategy
-        
-        # Verifică dacă strategia e conținută complet în răspuns
-        if strategy_normalized in s_normalized:
-            # Verifică că nu e doar o parte dintr-un cuvânt
-            pattern = r'\b' + re.escape(strategy_normalized) + r'\b'
-            if re.search(pattern, s_normalized):
-                return strategy
-        
-        # Verifică dacă răspunsul e conținut în strategie (pentru răspunsuri parțiale)
-        if s_normalized in strategy_normalized and len(s_normalized) >= 3:
-            return strategy
-    
-    # Strategia 3: Caută cuvinte cheie și abrevieri extinse
-    keywords = {
-        "backtracking": ["backtracking", "backtrack", "bt"],
-        "genetic": ["genetic", "genetic algorithm", "ga", "genetic algo"],
-        "simulated": ["simulated annealing", "simulated", "annealing", "sa", "simulated anneal"],
-        "greedy": ["greedy", "greedy coloring", "greedy col"],
-        "welsh": ["welsh-powell", "welsh", "powell", "welsh powell", "wp"],
-        "warnsdorff": ["warnsdorff", "warnsdorff's", "warnsdorffs", "warnsdorff heuristic"],
-        "recursive": ["recursive", "recursive backtracking", "recursive bt", "rec bt"],
-        "iterative": ["iterative deepening", "iterative", "iterative deep", "id", "ids"],
-        "a*": ["a*", "a star", "astar", "a-star", "a star search"],
-        "dynamic": ["dynamic programming", "dp", "dynamic prog", "memoization"],
-        "constraint": ["constraint satisfaction", "csp", "constraint", "constraint sat"],
-        "divide": ["divide and conquer", "divide", "divide conquer", "d&c", "d and c"],
-        "neural": ["neural network", "neural", "nn", "neural net", "deep learning"]
-    }
-    
-    # Caută potriviri bazate pe cuvinte cheie
-    for strategy in options:
-        strategy_lower = strategy.lower()
-        strategy_normalized = normalize_text(strategy_lower)
-        
-        for key, key_list in keywords.items():
-            if key in strategy_normalized:
-                for keyword in key_list:
-                    keyword_normalized = normalize_text(keyword.lower())
-                    # Verifică dacă keyword-ul e în răspuns
-                    if keyword_normalized in s_normalized:
-                        # Verifică că nu e doar o parte dintr-un cuvânt
-                        pattern = r'\b' + re.escape(keyword_normalized) + r'\b'
-                        if re.search(pattern, s_normalized):
-                            return strategy
-    
-    # Strategia 4: Matching parțial bazat pe cuvinte importante
-    # Extrage cuvintele importante din fiecare strategie
-    strategy_words = {}
-    for strategy in options:
-        strategy_normalized = normalize_text(strategy.lower())
-        # Elimină cuvinte comune
-        common_words = {'the', 'and', 'or', 'of', 'for', 'with', 'algorithm', 'method', 'search'}
-        words = [w for w in re.findall(r'\b\w+\b', strategy_normalized) 
-                if w not in common_words and len(w) >= 3]
-        strategy_words[strategy] = words
-    
-    # Verifică dacă majoritatea cuvintelor importante dintr-o strategie sunt în răspuns
-    best_match = None
-    best_score = 0
-    
-    for strategy, words in strategy_words.items():
-        if not words:
+    candidates, moves = [], []
+    previous_end = 0
+    for m in _NUMBER.finditer(answer):
+        after = _WORD.search(answer, m.end())
+        next_word = after.group() if after and not _NUMBER.search(answer, m.end(), after.start()) else ""
+        before = _WORD.findall(answer, previous_end, m.start())[-3:]
+        previous_end = m.end()
+        if _SIZE_WORD.match(next_word):
             continue
-        matches = sum(1 for word in words if word in s_normalized)
-        score = matches / len(words) if words else 0
-        if score > best_score and score >= 0.5:  # Cel puțin 50% din cuvinte
-            best_score = score
-            best_match = strategy
-    
-    if best_match:
-        return best_match
-    
-    return None
+        value = int(re.sub(r"\D", "", m.group()))
+        candidates.append(value)
+        if _MOVES_WORD.match(next_word) or any(_MOVES_WORD.match(word) for word in before):
+            moves.append(value)
+    if moves:
+        return moves[-1]
+    return candidates[-1] if candidates else None
 
-# ---------- evaluare răspuns ----------
+def _grade_min_moves(answer: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    correct = payload["correct_moves"]
+    parsed = _parse_number(answer)
+    if parsed is None:
+        return {
+            "score": 0,
+            "feedback": "Nu am putut identifica un număr în răspunsul tău. Te rog scrie numărul minim de mutări."
+        }
+    if parsed == correct:
+        return {"score": 100, "feedback": f"Corect! Numărul minim de mutări este {correct}."}
+    return {"score": 0, "feedback": f"Greșit. Ai răspuns {parsed}, dar numărul minim de mutări este {correct}."}
 
 def grade_answer(answer: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul utilizatorului"""
+    if payload.get("question_kind") == "min_moves":
+        return _grade_min_moves(answer, payload)
+    
     correct_strategy = payload["correct_strategy"]
     options = payload["options"]
     
@@ -401,7 +384,7 @@ def build_explanation(problem_data: Dict[str, Any]) -> str:
             "Constraint Satisfaction": "Constraint Satisfaction este ideal pentru graph coloring deoarece problema poate fi modelată direct ca CSP. Algoritmii CSP pot folosi forward checking, arc consistency și alte tehnici pentru a reduce eficient spațiul de căutare."
         },
         "knight_tour": {
-            "Backtracking": "Backtracking este potrivit pentru knight's tour deoarece permite explorarea tuturor căilor posibile ale calului, revenind la poziții anterioare când o cale nu mai poate continua. Este eficient pentru găsirea unei soluții complete.",
+            "Backtracking": "Backtracking este potrivit pentru knight's tour deoarece permite explorarea tuturor căilor posibile ale calului, revenind la poziții anterioare când o cale nu mai poate continua. Cu mutările ordonate după numărul de continuări libere, revine rar și este deosebit de eficient pentru turul închis, unde euristica fără revenire trebuie repornită de mai multe ori.",
             "Warnsdorff's Heuristic": "Warnsdorff's Heuristic este foarte eficient pentru knight's tour. La fiecare pas, alege mutarea către pătratul cu cel mai mic număr de mutări posibile viitoare. Această euristică reduce dramatic spațiul de căutare și găsește soluții rapid.",
             "Divide and Conquer": "Divide and Conquer poate fi aplicat pentru knight's tour prin împărțirea tablei în regiuni mai mici, rezolvarea turului pentru fiecare regiune, apoi conectarea soluțiilor. Este util pentru table mari unde backtracking-ul ar fi prea lent.",
             "Neural Network": "Neural Network poate fi folosit pentru knight's tour ca o abordare de învățare. Poate învăța pattern-uri din soluții existente și generaliza pentru table de dimensiuni diferite. Este util pentru probleme complexe cu multe variabile."
@@ -415,28 +398,109 @@ def build_explanation(problem_data: Dict[str, Any]) -> str:
     else:
         base_explanation += f"'{correct_strategy}' este cea mai potrivită strategie pentru această instanță a problemei {problem_data['problem_name']}."
     
+    if problem_type == "n-queens":
+        n = instance["n"]
+        base_explanation += (
+            f"\n\nPentru n = {n} există exact {instance['solutions']} soluții (numărate cu backtracking pe bitboard-uri, "
+            f"folosind simetria prin oglindire); strategia aleasă trebuie să găsească doar una dintre ele."
+        )
+    
+    if problem_type == "knight_tour":
+        closed = "există și un tur închis" if instance["closed_tour_exists"] else "nu există tur închis"
+        base_explanation += (
+            f"\n\nDin poziția {tuple(instance['start_position'])} există un tur complet (verificat la generare); "
+            f"pe tabla de {instance['board_size']}x{instance['board_size']} {closed} din această poziție."
+        )
+    
+    effort = problem_data.get("search_effort")
+    if effort:
+        base_explanation += "\n\nEfort măsurat pe această instanță (noduri explorate de fiecare solver):"
+        for strategy, stats in effort.items():
+            if not stats["measured"]:
+                base_explanation += f"\n - {strategy}: fără solver implementat"
+                continue
+            if not stats["complete"]:
+                status = " (buget depășit)"
+            elif not stats["solved"]:
+                status = " (nu a găsit soluție)"
+            elif stats.get("optimal") is False:
+                status = " (soluție neoptimă)"
+            else:
+                status = ""
+            base_explanation += f"\n - {strategy}: {stats['nodes']} noduri{status}"
+    
     return base_explanation
 
+def build_moves_explanation(problem_data: Dict[str, Any]) -> str:
+    """Explicația pentru întrebările "câte mutări": recurența Frame–Stewart și primele mutări"""
+    disks = problem_data["instance"]["disks"]
+    pegs = problem_data["instance"]["pegs"]
+    moves = problem_data["correct_moves"]
+    k = problem_data["split"]
+    
+    explanation = f"Numărul minim de mutări este {moves}.\n\n"
+    explanation += (
+        f"Cu {pegs} tije se aplică recurența Frame–Stewart: T(n, p) = min_k [2·T(k, p) + T(n−k, p−1)], "
+        f"cu T(n, 3) = 2^n − 1. Pentru n = {disks} split-ul optim este k = {k}: se mută {k} discuri pe o tijă "
+        f"intermediară folosind toate cele {pegs} tije ({hanoi.min_moves(k, pegs)} mutări), apoi cele {disks - k} "
+        f"discuri rămase pe tija finală cu {pegs - 1} tije ({hanoi.min_moves(disks - k, pegs - 1)} mutări), "
+        f"apoi cele {k} discuri peste ele ({hanoi.min_moves(k, pegs)} mutări)."
+    )
+    if pegs == 4:
+        explanation += " Pentru 4 tije această valoare este demonstrat optimă."
+    explanation += f"\n\nPrimele mutări (tijele A, B, C, ...): {problem_data['first_moves']}"
+    return explanation
+
 # ---------- pachet complet întrebare ----------
 
-def build_question_payload(problem_type: Optional[str] = None, seed: Optional[int] = None) -> Dict[str, Any]:
-    """Construiește pachetul complet de întrebare"""
-    problem_data = generate_problem_question(problem_type=problem_type, seed=seed)
+def build_question_payload(problem_type: Optional[str] = None, seed: Optional[int] = None,
+                           question_kind: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Construiește pachetul complet de întrebare.
+    question_kind: "strategy" (implicit) | "min_moves" (doar Hanoi, doar la cerere explicită: interfața
+    de strategie afișează opțiuni și cere numele strategiei, nu un număr de mutări)
+    """
+    rng = random.Random(seed)
+    if question_kind is None:
+        question_kind = "strategy"
+    if question_kind not in QUESTION_KINDS:
+        raise ValueError(f"Question kind {question_kind} not supported")
+    
+    if question_kind == "min_moves":
+        if problem_type not in (None, "hanoi"):
+            raise ValueError("min_moves questions are only available for hanoi")
+        problem_data = generate_hanoi_moves_question(rng=rng)
+        return {
+            "id": f"PROB1-{rng.randint(100000, 999999)}",
+            "problem_type": problem_data["problem_type"],
+            "problem_name": problem_data["problem_name"],
+            "question_kind": "min_moves",
+            "instance": problem_data["instance"],
+            "question_text": format_question_text(problem_data),
+            "options": [],
+            "correct_moves": problem_data["correct_moves"],
+            "solution": {
+                "moves": problem_data["correct_moves"],
+                "explanation": build_moves_explanation(problem_data)
+            }
+        }
+    
+    problem_data = generate_problem_question(problem_type=problem_type, rng=rng)
     qtext = format_question_text(problem_data)
     expl = build_explanation(problem_data)
     
     return {
-        "id": f"PROB1-{random.randint(100000, 999999)}",
+        "id": f"PROB1-{rng.randint(100000, 999999)}",
         "problem_type": problem_data["problem_type"],
         "problem_name": problem_data["problem_name"],
+        "question_kind": "strategy",
         "instance": problem_data["instance"],
         "question_text": qtext,
         "options": problem_data["options"],
         "correct_strategy": problem_data["correct_strategy"],
         "solution": {
             "strategy": problem_data["correct_strategy"],
+            "search_effort": problem_data["search_effort"],
             "explanation": expl
         }
     }
-
-
@@ -0,0 +1,289 @@
+"""
+SmarTest — Sudoku: generator de puzzle-uri cu soluție unică + solver cu propagare pe bitmask-uri
+Dimensiuni: 4x4, 9x9, 16x16. Grila este o listă de liste, 0 = celulă goală.
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, Optional, Dict, Any
+from functools import lru_cache
+import random
+
+SUPPORTED_SIZES = (4, 9, 16)
+
+# buget de ramificări pentru o verificare de unicitate la generare; la depășire indiciul e păstrat
+UNIQUENESS_CHECK_BUDGET = 200
+
+# la 16x16 puzzle-urile minimale cer secunde de verificări; implicit ne oprim la acest număr de indicii
+DEFAULT_TARGET_CLUES = {16: 120}
+
+# ---------- geometrie precalculată ----------
+
+class _Geometry:
+    """Tabele precalculate pentru o dimensiune: unități (rânduri, coloane, regiuni) și vecini (peers)"""
+    def __init__(self, size: int):
+        box = int(size ** 0.5)
+        if box * box != size:
+            raise ValueError(f"Sudoku size must be a perfect square, got {size}")
+        self.size = size
+        self.box = box
+        self.cells = size * size
+        self.full = (1 << size) - 1
+        rows = [tuple(r * size + c for c in range(size)) for r in range(size)]
+        cols = [tuple(r * size + c for r in range(size)) for c in range(size)]
+        boxes = [tuple((br * box + r) * size + bc * box + c for r in range(box) for c in range(box))
+                 for br in range(box) for bc in range(box)]
+        self.units: Tuple[Tuple[int, ...], ...] = tuple(rows + cols + boxes)
+        peers = [set() for _ in range(self.cells)]
+        for unit in self.units:
+            for cell in unit:
+                peers[cell].update(unit)
+        self.peers: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(sorted(p - {cell})) for cell, p in enumerate(peers)
+        )
+
+
+@lru_cache(maxsize=None)
+def _geometry(size: int) -> _Geometry:
+    return _Geometry(size)
+
+# ---------- propagare ----------
+
+def _propagate(cands: List[int], queue: List[int], geo: _Geometry) -> bool:
+    """
+    Propagă celulele fixate din coadă până la punct fix.
+    Pentru constrângerile '!=' dintre vecini, AC-3 pe arcele (vecin, celulă) se reduce exact la
+    eliminarea valorii unei celule fixate din vecinii ei (naked singles); după golirea cozii
+    se caută hidden singles pe fiecare unitate. Returnează False la contradicție.
+    """
+    peers, units, full = geo.peers, geo.units, geo.full
+    while True:
+        while queue:
+            cell = queue.pop()
+            bit = cands[cell]
+            for p in peers[cell]:
+                m = cands[p]
+                if m & bit:
+                    m ^= bit
+                    if not m:
+                        return False
+                    cands[p] = m
+                    if not m & (m - 1):
+                        queue.append(p)
+
+        # hidden singles: cifre care apar o singură dată într-o unitate
+        for unit in units:
+            once = twice = 0
+            for cell in unit:
+                m = cands[cell]
+                twice |= once & m
+                once |= m
+            if once != full:
+                return False
+            hidden = once & ~twice
+            while hidden:
+                bit = hidden & -hidden
+                hidden ^= bit
+                for cell in unit:
+                    if cands[cell] & bit:
+                        if cands[cell] != bit:
+                            cands[cell] = bit
+                            queue.append(cell)
+                        break
+        if not queue:
+            return True
+
+
+def _initial_candidates(grid: List[int], geo: _Geometry) -> Optional[List[int]]:
+    cands = [geo.full] * geo.cells
+    queue = []
+    for cell, value in enumerate(grid):
+        if value:
+            cands[cell] = 1 << (value - 1)
+            queue.append(cell)
+    if not _propagate(cands, queue, geo):
+        return None
+    return cands
+
+
+def _search(cands: List[int], geo: _Geometry, limit: int, found: List[List[int]],
+            stats: Dict[str, int]) -> None:
+    """Căutare cu MRV peste candidați; se oprește după `limit` soluții sau la depășirea bugetului"""
+    best, best_count = -1, geo.size + 1
+    for cell, m in enumerate(cands):
+        if m & (m - 1):
+            count = m.bit_count()
+            if count < best_count:
+                best, best_count = cell, count
+                if count == 2:
+                    break
+    if best < 0:
+        found.append(cands)
+        return
+    m = cands[best]
+    while m and len(found) < limit:
+        bit = m & -m
+        m ^= bit
+        stats["nodes"] += 1
+        if stats["nodes"] > stats.get("budget", stats["nodes"]):
+            raise _BudgetExceeded()
+        child = list(cands)
+        child[best] = bit
+        if _propagate(child, [best], geo):
+            _search(child, geo, limit, found, stats)
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def _decode(cands: List[int]) -> List[int]:
+    return [m.bit_length() for m in cands]
+
+
+def _flatten(grid: List[List[int]]) -> List[int]:
+    return [v for row in grid for v in row]
+
+
+def _to_rows(flat: List[int], size: int) -> List[List[int]]:
+    return [flat[r * size:(r + 1) * size] for r in range(size)]
+
+# ---------- API solver ----------
+
+def solve(grid: List[List[int]], limit: int = 2) -> Dict[str, Any]:
+    """
+    Rezolvă grila și numără soluțiile până la `limit`.
+    Returnează {"solutions": număr (<= limit), "solution": prima soluție sau None, "nodes": ramificări}.
+    """
+    size = len(grid)
+    geo = _geometry(size)
+    stats = {"nodes": 0}
+    cands = _initial_candidates(_flatten(grid), geo)
+    found: List[List[int]] = []
+    if cands is not None:
+        _search(cands, geo, limit, found, stats)
+    return {
+        "solutions": len(found),
+        "solution": _to_rows(_decode(found[0]), size) if found else None,
+        "nodes": stats["nodes"],
+    }
+
+
+def has_unique_solution(grid: List[List[int]]) -> bool:
+    return solve(grid, limit=2)["solutions"] == 1
+
+# ---------- generare ----------
+
+def _random_solution(size: int, rng: random.Random) -> List[int]:
+    """Soluție completă: model de bază valid, permutat (cifre, rânduri în benzi, benzi, coloane, stive, transpunere)"""
+    box = int(size ** 0.5)
+    digits = list(range(1, size + 1))
+    rng.shuffle(digits)
+
+    def shuffled_lines() -> List[int]:
+        bands = list(range(box))
+        rng.shuffle(bands)
+        lines = []
+        for b in bands:
+            inner = list(range(box))
+            rng.shuffle(inner)
+            lines.extend(b * box + i for i in inner)
+        return lines
+
+    rows, cols = shuffled_lines(), shuffled_lines()
+    grid = [digits[(box * (r % box) + r // box + c) % size] for r in rows for c in cols]
+    if rng.random() < 0.5:
+        grid = [grid[c * size + r] for r in range(size) for c in range(size)]
+    return grid
+
+
+def _still_unique(puzzle: List[int], cell: int, digit: int, geo: _Geometry) -> bool:
+    """
+    După golirea celulei `cell`, puzzle-ul rămâne unic dacă nu există nicio soluție în care
+    celula are altă cifră decât cea din soluția cunoscută: o singură căutare de satisfiabilitate.
+    Dacă bugetul de căutare se epuizează, răspunsul este conservator (False), deci unicitatea rămâne garantată.
+    """
+    cands = [geo.full] * geo.cells
+    queue = []
+    for c, value in enumerate(puzzle):
+        if value:
+            cands[c] = 1 << (value - 1)
+            queue.append(c)
+    cands[cell] = geo.full & ~(1 << (digit - 1))
+    if not cands[cell] & (cands[cell] - 1):
+        queue.append(cell)
+    if not _propagate(cands, queue, geo):
+        return True
+    found: List[List[int]] = []
+    try:
+        _search(cands, geo, 1, found, {"nodes": 0, "budget": UNIQUENESS_CHECK_BUDGET})
+    except _BudgetExceeded:
+        return False
+    return not found
+
+
+def generate_puzzle(size: int = 9, target_clues: Optional[int] = None, seed: Optional[int] = None,
+                    rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """
+    Generează un puzzle cu soluție unică: pornește de la o soluție completă și elimină indicii
+    în ordine aleatoare, păstrând doar eliminările care mențin unicitatea.
+    target_clues: se oprește când rămân atâtea indicii (None = DEFAULT_TARGET_CLUES sau cât se poate).
+    """
+    if size not in SUPPORTED_SIZES:
+        raise ValueError(f"Sudoku size {size} not supported (use one of {SUPPORTED_SIZES})")
+    if rng is None:
+        rng = random.Random(seed)
+    if target_clues is None:
+        target_clues = DEFAULT_TARGET_CLUES.get(size)
+    geo = _geometry(size)
+    solution = _random_solution(size, rng)
+    puzzle = list(solution)
+    clues = geo.cells
+    order = list(range(geo.cells))
+    rng.shuffle(order)
+    for cell in order:
+        if target_clues is not None and clues <= target_clues:
+            break
+        digit = puzzle[cell]
+        puzzle[cell] = 0
+        if _still_unique(puzzle, cell, digit, geo):
+            clues -= 1
+        else:
+            puzzle[cell] = digit
+    return {
+        "size": size,
+        "box": geo.box,
+        "puzzle": _to_rows(puzzle, size),
+        "solution": _to_rows(solution, size),
+        "clues": clues,
+    }
+
+# ---------- conversii ----------
+
+def cell_name(r: int, c: int, size: int) -> str:
+    return f"C{r+1}{c+1}" if size < 10 else f"C{r+1}_{c+1}"
+
+
+def to_csp(puzzle: List[List[int]]) -> Dict[str, Any]:
+    """Modelează grila ca CSP binar (variabile, domenii, constrângeri '!=') pentru csp_solver"""
+    size = len(puzzle)
+    geo = _geometry(size)
+    names = [cell_name(cell // size, cell % size, size) for cell in range(geo.cells)]
+    flat = _flatten(puzzle)
+    domains = {names[cell]: ([flat[cell]] if flat[cell] else list(range(1, size + 1)))
+               for cell in range(geo.cells)}
+    constraints = [(names[a], names[b], "!=") for a in range(geo.cells) for b in geo.peers[a] if a < b]
+    return {"variables": names, "domains": domains, "constraints": constraints}
+
+
+def format_grid(grid: List[List[int]]) -> str:
+    """Formatează grila ca text, cu '.' pentru celulele goale și separatori de regiuni"""
+    size = len(grid)
+    box = int(size ** 0.5)
+    width = len(str(size))
+    lines = []
+    for r, row in enumerate(grid):
+        if r and r % box == 0:
+            lines.append("-+-".join(["-" * ((width + 1) * box - 1)] * box))
+        cells = [(str(v) if v else ".").rjust(width) for v in row]
+        lines.append(" | ".join(" ".join(cells[b * box:(b + 1) * box]) for b in range(box)))
+    return "\n".join(lines)
@@ -3,9 +3,16 @@ Modul pentru evaluarea răspunsurilor la întrebările de teorie.
 Folosește procesare de limbaj natural (NLP) pentru înțelegere semantică.
 """
 
+import logging
 import re
 from typing import Dict, Any, List, Optional
 
+import app.metrics as metrics
+
+import app.log_config as log_config
+
+logger = logging.getLogger(__name__)
+
 # Import NLP utils (cu fallback dacă nu sunt disponibile)
 try:
     from app.nlp_utils import (
@@ -14,16 +21,13 @@ try:
         SEMANTIC_SIMILARITY_AVAILABLE, NLP_AVAILABLE
     )
     NLP_ENABLED = True
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.info(f"NLP enabled: SEMANTIC_SIMILARITY_AVAILABLE={SEMANTIC_SIMILARITY_AVAILABLE}, NLP_AVAILABLE={NLP_AVAILABLE}")
+    logger.info("NLP enabled: SEMANTIC_SIMILARITY_AVAILABLE=%s, NLP_AVAILABLE=%s",
+                SEMANTIC_SIMILARITY_AVAILABLE, NLP_AVAILABLE)
 except ImportError as e:
     NLP_ENABLED = False
     SEMANTIC_SIMILARITY_AVAILABLE = False
     NLP_AVAILABLE = False
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.warning(f"NLP not available: {e}")
+    logger.warning("NLP not available: %s", e)
     # Funcții fallback simple
     def semantic_similarity(text1: str, text2: str) -> float:
         if not text1 or not text2:
@@ -173,7 +177,7 @@ def _understand_answer_semantics(answer: str, question: Dict[str, Any]) -> Dict[
     # Extrage cuvinte cheie potențiale din întrebare
     question_text = question.get("question_text", "").lower()
     correct_keywords = [kw.lower() for kw in question.get("correct_keywords", [])]
-    correct_answer = question.get("correct_answer", "").lower()
+    correct_answer = str(question.get("correct_answer", "")).lower()
     
     # Caută cuvinte cheie în răspuns
     keywords_found = []
@@ -571,6 +575,7 @@ def grade_answer(answer: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+@metrics.timed("theory_multiple_choice")
 def _grade_multiple_choice(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul la o întrebare multiple choice - flexibil cu NLP și înțelegere semantică"""
     answer = answer.strip()
@@ -693,6 +698,7 @@ def _grade_multiple_choice(answer: str, question: Dict[str, Any]) -> Dict[str, A
     }
 
 
+@metrics.timed("theory_true_false")
 def _grade_true_false(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul la o întrebare true/false - foarte flexibil cu NLP"""
     answer_original = answer.strip()
@@ -705,8 +711,7 @@ def _grade_true_false(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     if NLP_ENABLED and correct_answer_str and correct_answer_str.strip():
         try:
             similarity = semantic_similarity(answer_original, correct_answer_str)
-            import logging
-            logging.getLogger(__name__).info(f"NLP semantic similarity for true/false: {similarity:.2f}")
+            log_config.hot_event(logger, "theory_similarity", "kind=true_false similarity=%.2f", similarity)
             
             # Dacă similaritatea este mare, verifică dacă răspunsul indică același boolean
             if similarity >= 0.60:
@@ -734,8 +739,7 @@ def _grade_true_false(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
                         "method": method
                     }
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(f"Error in NLP for true/false: {e}")
+            logger.warning("Error in NLP for true/false: %s", e)
             # Continuă cu pattern matching
     
     # Lista extinsă de variante pentru True
@@ -816,6 +820,7 @@ def _grade_true_false(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+@metrics.timed("theory_fill_blank")
 def _grade_fill_blank(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul la o întrebare fill-in-the-blank - flexibil cu NLP"""
     answer_original = answer.strip()
@@ -837,8 +842,7 @@ def _grade_fill_blank(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     if NLP_ENABLED and correct_answer and correct_answer.strip():
         try:
             similarity = semantic_similarity(answer_original, correct_answer)
-            import logging
-            logging.getLogger(__name__).info(f"NLP semantic similarity for fill_blank: {similarity:.2f}")
+            log_config.hot_event(logger, "theory_similarity", "kind=fill_blank similarity=%.2f", similarity)
             
             # Dacă similaritatea este suficient de mare, acceptă răspunsul
             if similarity >= 0.70:
@@ -858,8 +862,7 @@ def _grade_fill_blank(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
                     "method": method
                 }
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(f"Error in NLP for fill_blank: {e}")
+            logger.warning("Error in NLP for fill_blank: %s", e)
             # Continuă cu verificarea exactă
     
     answer_normalized = answer if case_sensitive else answer.lower()
@@ -978,6 +981,7 @@ def _grade_fill_blank(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@metrics.timed("theory_short_answer")
 def _grade_short_answer(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul la o întrebare cu răspuns scurt - flexibil cu NLP și înțelegere semantică"""
     answer_original = answer.strip()
@@ -1022,13 +1026,11 @@ def _grade_short_answer(answer: str, question: Dict[str, Any]) -> Dict[str, Any]
             if SEMANTIC_SIMILARITY_AVAILABLE:
                 # Folosește semantic_similarity care folosește modelul Sentence Transformer
                 similarity = semantic_similarity(answer_original, correct_answer)
-                import logging
-                logging.getLogger(__name__).info(f"NLP semantic similarity: {similarity:.2f} for answer: '{answer_original[:50]}...' vs correct: '{correct_answer[:50]}...' (SEMANTIC_SIMILARITY_AVAILABLE={SEMANTIC_SIMILARITY_AVAILABLE})")
+                log_config.hot_event(logger, "theory_similarity", "kind=short_answer similarity=%.2f", similarity)
             else:
                 # Fallback la semantic_similarity simplu (care folosește fuzzy matching)
                 similarity = semantic_similarity(answer_original, correct_answer)
-                import logging
-                logging.getLogger(__name__).info(f"Fallback similarity: {similarity:.2f} for answer: '{answer_original[:50]}...' vs correct: '{correct_answer[:50]}...' (SEMANTIC_SIMILARITY_AVAILABLE={SEMANTIC_SIMILARITY_AVAILABLE})")
+                log_config.hot_event(logger, "theory_similarity", "kind=short_answer similarity=%.2f", similarity)
             
             # Dacă similaritatea este suficient de mare, acceptă răspunsul
             # Prag foarte scăzut (0.40) pentru a accepta răspunsuri corecte care exprimă ideea corectă
@@ -1058,8 +1060,7 @@ def _grade_short_answer(answer: str, question: Dict[str, Any]) -> Dict[str, Any]
                     "method": method
                 }
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(f"Error in NLP comparison: {e}")
+            logger.warning("Error in NLP comparison: %s", e)
             # Continuă cu verificarea conceptelor
     
     # PRIORITATE 2: Folosește NLP pentru extragere concepte (similaritate semantică)
@@ -1104,9 +1105,7 @@ def _grade_short_answer(answer: str, question: Dict[str, Any]) -> Dict[str, Any]
                         "method": method
                     }
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Error in NLP concept extraction: {e}")
+            logger.warning("Error in NLP concept extraction: %s", e)
             # Continuă cu fallback
     
     # Normalizare cuvinte cheie - elimină diacritice și variante
@@ -1203,6 +1202,7 @@ def _grade_short_answer(answer: str, question: Dict[str, Any]) -> Dict[str, Any]
         }
 
 
+@metrics.timed("theory_justification")
 def _grade_justification(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul la o întrebare care cere justificare - foarte flexibil cu NLP"""
     answer_original = answer.strip()
@@ -1234,8 +1234,7 @@ def _grade_justification(answer: str, question: Dict[str, Any]) -> Dict[str, Any
         try:
             # Compară justificarea cu răspunsul corect folosind NLP
             similarity = semantic_similarity(answer_original, correct_answer)
-            import logging
-            logging.getLogger(__name__).info(f"NLP semantic similarity for justification: {similarity:.2f} for answer: '{answer_original[:50]}...' vs correct: '{correct_answer[:50]}...'")
+            log_config.hot_event(logger, "theory_similarity", "kind=justification similarity=%.2f", similarity)
             
             # Dacă similaritatea este suficient de mare, acceptă justificarea
             # Prag scăzut (0.40) pentru a accepta justificări corecte semantic
@@ -1260,8 +1259,7 @@ def _grade_justification(answer: str, question: Dict[str, Any]) -> Dict[str, Any
                     "method": method
                 }
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(f"Error in NLP comparison for justification: {e}")
+            logger.warning("Error in NLP comparison for justification: %s", e)
             # Continuă cu verificarea conceptelor
     
     # PRIORITATE 2: Folosește NLP pentru extragere concepte (similaritate semantică)
@@ -1359,6 +1357,7 @@ def _grade_justification(answer: str, question: Dict[str, Any]) -> Dict[str, Any
         }
 
 
+@metrics.timed("theory_example")
 def _grade_example(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul la o întrebare care cere exemple - foarte flexibil cu NLP"""
     answer_original = answer.strip()
@@ -1373,8 +1372,7 @@ def _grade_example(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     if NLP_ENABLED and correct_answer and correct_answer.strip():
         try:
             similarity = semantic_similarity(answer_original, correct_answer)
-            import logging
-            logging.getLogger(__name__).info(f"NLP semantic similarity for example: {similarity:.2f}")
+            log_config.hot_event(logger, "theory_similarity", "kind=example similarity=%.2f", similarity)
             
             # Dacă similaritatea este suficient de mare, acceptă răspunsul
             if similarity >= 0.70:
@@ -1394,8 +1392,7 @@ def _grade_example(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
                     "method": method
                 }
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(f"Error in NLP for example: {e}")
+            logger.warning("Error in NLP for example: %s", e)
             # Continuă cu verificarea keyword-urilor
     
     # Fallback: verificare keyword-uri
@@ -1473,6 +1470,7 @@ def _grade_example(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+@metrics.timed("theory_comparison")
 def _grade_comparison(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul la o întrebare care cere comparare - foarte flexibil cu NLP"""
     answer_original = answer.strip()
@@ -1496,7 +1494,7 @@ def _grade_comparison(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     if NLP_ENABLED and correct_answer and correct_answer.strip():
         try:
             similarity = semantic_similarity(answer_original, correct_answer)
-            logging.getLogger(__name__).info(f"NLP semantic similarity for comparison: {similarity:.2f}")
+            log_config.hot_event(logger, "theory_similarity", "kind=comparison similarity=%.2f", similarity)
             
             if similarity >= 0.80:
                 return {
@@ -1522,7 +1520,7 @@ def _grade_comparison(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
                     "method": "NLP Semantic Similarity" if SEMANTIC_SIMILARITY_AVAILABLE else ("Fuzzy Matching" if NLP_AVAILABLE else "Fallback")
                 }
         except Exception as e:
-            logging.getLogger(__name__).warning(f"Error in NLP semantic similarity for comparison: {e}")
+            logger.warning("Error in NLP semantic similarity for comparison: %s", e)
             # Continuă cu fallback
     
     # PRIORITATE 2: Fallback la keyword matching
@@ -1583,6 +1581,7 @@ def _grade_comparison(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+@metrics.timed("theory_definition")
 def _grade_definition(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul la o întrebare care cere definiție - foarte flexibil"""
     answer_original = answer.strip()
@@ -1606,7 +1605,7 @@ def _grade_definition(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     if NLP_ENABLED and correct_answer and correct_answer.strip():
         try:
             similarity = semantic_similarity(answer_original, correct_answer)
-            logging.getLogger(__name__).info(f"NLP semantic similarity for definition: {similarity:.2f}")
+            log_config.hot_event(logger, "theory_similarity", "kind=definition similarity=%.2f", similarity)
             
             if similarity >= 0.80:
                 return {
@@ -1640,7 +1639,7 @@ def _grade_definition(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
                     "method": "NLP Semantic Similarity" if SEMANTIC_SIMILARITY_AVAILABLE else ("Fuzzy Matching" if NLP_AVAILABLE else "Fallback")
                 }
         except Exception as e:
-            logging.getLogger(__name__).warning(f"Error in NLP semantic similarity for definition: {e}")
+            logger.warning("Error in NLP semantic similarity for definition: %s", e)
             # Continuă cu fallback
     
     # PRIORITATE 2: Fallback la keyword matching
@@ -1698,6 +1697,7 @@ def _grade_definition(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+@metrics.timed("theory_calculation")
 def _grade_calculation(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul la o întrebare care cere calcul - foarte flexibil"""
     answer_original = answer.strip()
@@ -1763,6 +1763,7 @@ def _grade_calculation(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@metrics.timed("theory_matrix_analysis")
 def _grade_matrix_analysis(answer: str, question: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluează răspunsul la o întrebare despre analiza jocurilor matriceale - foarte flexibil"""
     answer_original = answer.strip()
@@ -38,7 +38,8 @@ class TheoryQuestionGenerator:
     
     def generate_question(self, topic_id: Optional[str] = None, 
                          question_type: Optional[str] = None, 
-                         seed: Optional[int] = None) -> Dict[str, Any]:
+                         seed: Optional[int] = None,
+                         rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Generează o întrebare aleatorie pentru un topic.
         Dacă nu există template pentru tipul cerut, generează dinamic din teoria topic-ului.
@@ -47,9 +48,10 @@ class TheoryQuestionGenerator:
             topic_id: ID-ul topicului (ex: "nash_equilibrium_basics"). Dacă None, alege aleatoriu.
             question_type: Tipul întrebării (opțional, altfel aleatoriu)
             seed: Seed pentru reproducibilitate
+            rng: Generator explicit (opțional); dacă lipsește se creează din seed, fără stare globală
         """
-        if seed is not None:
-            random.seed(seed)
+        if rng is None:
+            rng = random.Random(seed)
         
         # Alege topic-ul
         topics = self.theory_data.get("topics", [])
@@ -61,14 +63,14 @@ class TheoryQuestionGenerator:
             if not topic:
                 raise ValueError(f"Topic {topic_id} not found")
         else:
-            topic = random.choice(topics)
+            topic = rng.choice(topics)
         
         # Dacă nu este specificat tipul, alege aleatoriu
         if not question_type:
             available_types = ["multiple_choice", "true_false", "fill_blank", 
                              "short_answer", "justification", "definition", 
                              "example", "comparison"]
-            question_type = random.choice(available_types)
+            question_type = rng.choice(available_types)
         
         # Încearcă mai întâi să folosească template-urile existente
         templates = topic.get("question_templates", [])
@@ -76,51 +78,48 @@ class TheoryQuestionGenerator:
         
         # Dacă există template-uri pentru tipul cerut, folosește-le
         if matching_templates:
-            template = random.choice(matching_templates)
-            return self._build_question_from_template(template, topic, seed)
+            template = rng.choice(matching_templates)
+            return self._build_question_from_template(template, topic, rng)
         
         # Altfel, generează dinamic din teoria topic-ului
-        return self._generate_dynamic_question(topic, question_type, seed)
+        return self._generate_dynamic_question(topic, question_type, rng)
     
     def _build_question_from_template(self, template: Dict, topic: Dict, 
-                                     seed: Optional[int]) -> Dict[str, Any]:
+                                     rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebarea din template"""
         question_type = template.get("type", "multiple_choice")
         
         if question_type == "multiple_choice":
-            return self._build_multiple_choice(template, topic, seed)
+            return self._build_multiple_choice(template, topic, rng)
         elif question_type == "true_false":
-            return self._build_true_false(template, topic, seed)
+            return self._build_true_false(template, topic, rng)
         elif question_type == "fill_blank":
-            return self._build_fill_blank(template, topic, seed)
+            return self._build_fill_blank(template, topic, rng)
         elif question_type == "short_answer":
-            return self._build_short_answer(template, topic, seed)
+            return self._build_short_answer(template, topic, rng)
         elif question_type == "justification":
-            return self._build_justification(template, topic, seed)
+            return self._build_justification(template, topic, rng)
         elif question_type == "example":
-            return self._build_example(template, topic, seed)
+            return self._build_example(template, topic, rng)
         elif question_type == "comparison":
-            return self._build_comparison(template, topic, seed)
+            return self._build_comparison(template, topic, rng)
         elif question_type == "definition":
-            return self._build_definition(template, topic, seed)
+            return self._build_definition(template, topic, rng)
         elif question_type == "calculation":
-            return self._build_calculation(template, topic, seed)
+            return self._build_calculation(template, topic, rng)
         elif question_type == "matrix_analysis":
-            return self._build_matrix_analysis(template, topic, seed)
+            return self._build_matrix_analysis(template, topic, rng)
         else:
             raise ValueError(f"Unsupported question type: {question_type}")
     
     def _build_multiple_choice(self, template: Dict, topic: Dict, 
-                               seed: Optional[int]) -> Dict[str, Any]:
+                               rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebare multiple choice"""
-        if seed is not None:
-            random.seed(seed)
-        
         # Amestecă opțiunile
         correct_answer = template["correct_answer"]
         distractors = template.get("distractors", [])
         options = [correct_answer] + distractors
-        random.shuffle(options)
+        rng.shuffle(options)
         
         correct_index = options.index(correct_answer)
         
@@ -142,7 +141,7 @@ class TheoryQuestionGenerator:
         }
     
     def _build_true_false(self, template: Dict, topic: Dict, 
-                         seed: Optional[int]) -> Dict[str, Any]:
+                         rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebare true/false"""
         correct_answer = template["correct_answer"]
         
@@ -162,7 +161,7 @@ class TheoryQuestionGenerator:
         }
     
     def _build_fill_blank(self, template: Dict, topic: Dict, 
-                         seed: Optional[int]) -> Dict[str, Any]:
+                         rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebare fill-in-the-blank"""
         correct_answers = template.get("correct_answers", [])
         case_sensitive = template.get("case_sensitive", False)
@@ -184,7 +183,7 @@ class TheoryQuestionGenerator:
         }
     
     def _build_short_answer(self, template: Dict, topic: Dict, 
-                           seed: Optional[int]) -> Dict[str, Any]:
+                           rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebare cu răspuns scurt"""
         correct_keywords = template.get("correct_keywords", [])
         min_keywords = template.get("min_keywords", 2)
@@ -212,7 +211,7 @@ class TheoryQuestionGenerator:
         }
     
     def _build_justification(self, template: Dict, topic: Dict, 
-                           seed: Optional[int]) -> Dict[str, Any]:
+                           rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebare care cere justificare"""
         correct_keywords = template.get("correct_keywords", [])
         required_concepts = template.get("required_concepts", [])
@@ -246,7 +245,7 @@ class TheoryQuestionGenerator:
         }
     
     def _build_example(self, template: Dict, topic: Dict, 
-                      seed: Optional[int]) -> Dict[str, Any]:
+                      rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebare care cere exemple"""
         correct_keywords = template.get("correct_keywords", [])
         example_types = template.get("example_types", [])
@@ -275,7 +274,7 @@ class TheoryQuestionGenerator:
         }
     
     def _build_comparison(self, template: Dict, topic: Dict, 
-                         seed: Optional[int]) -> Dict[str, Any]:
+                         rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebare care cere compararea a două concepte"""
         concepts_to_compare = template.get("concepts_to_compare", [])
         comparison_keywords = template.get("comparison_keywords", [])
@@ -304,7 +303,7 @@ class TheoryQuestionGenerator:
         }
     
     def _build_definition(self, template: Dict, topic: Dict, 
-                        seed: Optional[int]) -> Dict[str, Any]:
+                        rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebare care cere definiție"""
         correct_keywords = template.get("correct_keywords", [])
         definition_elements = template.get("definition_elements", [])
@@ -333,7 +332,7 @@ class TheoryQuestionGenerator:
         }
     
     def _build_calculation(self, template: Dict, topic: Dict, 
-                          seed: Optional[int]) -> Dict[str, Any]:
+                          rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebare care cere calcul (cu răspunsuri flexibile)"""
         correct_answer = template.get("correct_answer", "")
         correct_answer_numeric = template.get("correct_answer_numeric", None)
@@ -359,7 +358,7 @@ class TheoryQuestionGenerator:
         }
     
     def _build_matrix_analysis(self, template: Dict, topic: Dict, 
-                              seed: Optional[int]) -> Dict[str, Any]:
+                              rng: random.Random) -> Dict[str, Any]:
         """Construiește întrebare despre analiza jocurilor matriceale (Nash, etc.)"""
         matrix_data = template.get("matrix_data", {})
         analysis_type = template.get("analysis_type", "nash_equilibrium")  # nash, dominant_strategy, etc.
@@ -385,39 +384,33 @@ class TheoryQuestionGenerator:
         }
     
     def _generate_dynamic_question(self, topic: Dict, question_type: str, 
-                                  seed: Optional[int]) -> Dict[str, Any]:
+                                  rng: random.Random) -> Dict[str, Any]:
         """Generează dinamic o întrebare bazată pe teoria topic-ului"""
-        if seed is not None:
-            random.seed(seed)
-        
         theory = topic.get("theory", {})
         
         if question_type == "multiple_choice":
-            return self._generate_dynamic_multiple_choice(topic, theory, seed)
+            return self._generate_dynamic_multiple_choice(topic, theory, rng)
         elif question_type == "true_false":
-            return self._generate_dynamic_true_false(topic, theory, seed)
+            return self._generate_dynamic_true_false(topic, theory, rng)
         elif question_type == "fill_blank":
-            return self._generate_dynamic_fill_blank(topic, theory, seed)
+            return self._generate_dynamic_fill_blank(topic, theory, rng)
         elif question_type == "short_answer":
-            return self._generate_dynamic_short_answer(topic, theory, seed)
+            return self._generate_dynamic_short_answer(topic, theory, rng)
         elif question_type == "justification":
-            return self._generate_dynamic_justification(topic, theory, seed)
+            return self._generate_dynamic_justification(topic, theory, rng)
         elif question_type == "definition":
-            return self._generate_dynamic_definition(topic, theory, seed)
+            return self._generate_dynamic_definition(topic, theory, rng)
         elif question_type == "example":
-            return self._generate_dynamic_example(topic, theory, seed)
+            return self._generate_dynamic_example(topic, theory, rng)
         elif question_type == "comparison":
-            return self._generate_dynamic_comparison(topic, theory, seed)
+            return self._generate_dynamic_comparison(topic, theory, rng)
         else:
             # Fallback la short_answer
-            return self._generate_dynamic_short_answer(topic, theory, seed)
+            return self._generate_dynamic_short_answer(topic, theory, rng)
     
     def _generate_dynamic_multiple_choice(self, topic: Dict, theory: Dict, 
-                                         seed: Optional[int]) -> Dict[str, Any]:
+                                         rng: random.Random) -> Dict[str, Any]:
         """Generează dinamic întrebare multiple choice din teoria topic-ului"""
-        if seed is not None:
-            random.seed(seed)
-        
         # Extrage informații din teorie
         definition = theory.get("definition", "")
         key_concepts = theory.get("key_concepts", [])
@@ -440,7 +433,7 @@ class TheoryQuestionGenerator:
             question_text = f"Care este definiția corectă pentru {topic.get('topic_name', 'acest concept')}?"
             correct_answer = definition if definition else f"Concept din domeniul {topic.get('category', 'AI')}"
         else:
-            source_type, source_data = random.choice(sources)
+            source_type, source_data = rng.choice(sources)
             
             if source_type == "definition":
                 question_text = f"Care este definiția corectă pentru {topic.get('topic_name', 'acest concept')}?"
@@ -471,13 +464,13 @@ class TheoryQuestionGenerator:
             "Funcționează doar pentru probleme mici"
         ]
         while len(distractors) < 3:
-            distractor = random.choice(generic_distractors)
+            distractor = rng.choice(generic_distractors)
             if distractor not in distractors:
                 distractors.append(distractor)
         
         # Amestecă opțiunile
         options = [correct_answer] + distractors[:3]
-        random.shuffle(options)
+        rng.shuffle(options)
         correct_index = options.index(correct_answer)
         
         return {
@@ -498,28 +491,25 @@ class TheoryQuestionGenerator:
         }
     
     def _generate_dynamic_true_false(self, topic: Dict, theory: Dict, 
-                                    seed: Optional[int]) -> Dict[str, Any]:
+                                    rng: random.Random) -> Dict[str, Any]:
         """Generează dinamic întrebare true/false din teoria topic-ului"""
-        if seed is not None:
-            random.seed(seed)
-        
         theorems = theory.get("theorems", [])
         common_mistakes = theory.get("common_mistakes", [])
         key_concepts = theory.get("key_concepts", [])
         
         # Alege o sursă pentru afirmație
         if theorems:
-            theorem = random.choice(theorems)
+            theorem = rng.choice(theorems)
             question_text = theorem.get("statement", "")
             correct_answer = True
             explanation = theorem.get("importance", theorem.get("proof_hint", ""))
         elif common_mistakes:
-            mistake = random.choice(common_mistakes)
+            mistake = rng.choice(common_mistakes)
             question_text = mistake.get("mistake", "")
             correct_answer = False
             explanation = mistake.get("correction", "")
         elif key_concepts:
-            concept = random.choice(key_concepts)
+            concept = rng.choice(key_concepts)
             if isinstance(concept, dict):
                 # Creează o afirmație falsă bazată pe concept
                 concept_name = concept.get("concept", "")
@@ -559,17 +549,14 @@ class TheoryQuestionGenerator:
         }
     
     def _generate_dynamic_fill_blank(self, topic: Dict, theory: Dict, 
-                                    seed: Optional[int]) -> Dict[str, Any]:
+                                    rng: random.Random) -> Dict[str, Any]:
         """Generează dinamic întrebare fill-in-the-blank din teoria topic-ului"""
-        if seed is not None:
-            random.seed(seed)
-        
         key_concepts = theory.get("key_concepts", [])
         definition = theory.get("definition", "")
         
         # Caută formule sau definiții cu părți care pot fi completate
         if key_concepts:
-            concept = random.choice(key_concepts)
+            concept = rng.choice(key_concepts)
             if isinstance(concept, dict):
                 formula = concept.get("formula", "")
                 concept_name = concept.get("concept", "")
@@ -618,11 +605,8 @@ class TheoryQuestionGenerator:
         }
     
     def _generate_dynamic_short_answer(self, topic: Dict, theory: Dict, 
-                                      seed: Optional[int]) -> Dict[str, Any]:
+                                      rng: random.Random) -> Dict[str, Any]:
         """Generează dinamic întrebare short answer din teoria topic-ului"""
-        if seed is not None:
-            random.seed(seed)
-        
         definition = theory.get("definition", "")
         key_concepts = theory.get("key_concepts", [])
         
@@ -634,11 +618,11 @@ class TheoryQuestionGenerator:
         ]
         
         if key_concepts:
-            concept = random.choice(key_concepts)
+            concept = rng.choice(key_concepts)
             if isinstance(concept, dict):
                 question_templates.append(f"Explică conceptul {concept.get('concept', '')}.")
         
-        question_text = random.choice(question_templates)
+        question_text = rng.choice(question_templates)
         
         # Extrage keywords din definiție și concepte
         correct_keywords = []
@@ -689,11 +673,8 @@ class TheoryQuestionGenerator:
         }
     
     def _generate_dynamic_justification(self, topic: Dict, theory: Dict, 
-                                       seed: Optional[int]) -> Dict[str, Any]:
+                                       rng: random.Random) -> Dict[str, Any]:
         """Generează dinamic întrebare justification din teoria topic-ului"""
-        if seed is not None:
-            random.seed(seed)
-        
         key_concepts = theory.get("key_concepts", [])
         examples = theory.get("examples", [])
         
@@ -705,12 +686,12 @@ class TheoryQuestionGenerator:
         ]
         
         if examples:
-            example = random.choice(examples)
+            example = rng.choice(examples)
             example_name = example.get("name", "")
             if example_name:
                 question_templates.append(f"De ce este {example_name} un exemplu bun pentru {topic.get('topic_name', 'acest concept')}? Justificați.")
         
-        question_text = random.choice(question_templates)
+        question_text = rng.choice(question_templates)
         
         # Extrage keywords și concepte
         correct_keywords = []
@@ -767,15 +748,12 @@ class TheoryQuestionGenerator:
         }
     
     def _generate_dynamic_definition(self, topic: Dict, theory: Dict, 
-                                   seed: Optional[int]) -> Dict[str, Any]:
+                                   rng: random.Random) -> Dict[str, Any]:
         """Generează dinamic întrebare definition din teoria topic-ului"""
-        if seed is not None:
-            random.seed(seed)
-        
         key_concepts = theory.get("key_concepts", [])
         
         if key_concepts:
-            concept = random.choice(key_concepts)
+            concept = rng.choice(key_concepts)
             if isinstance(concept, dict):
                 concept_name = concept.get("concept", "")
                 question_text = f"Care este definiția pentru {concept_name}? Exemplificați."
@@ -820,11 +798,8 @@ class TheoryQuestionGenerator:
         }
     
     def _generate_dynamic_example(self, topic: Dict, theory: Dict, 
-                                 seed: Optional[int]) -> Dict[str, Any]:
+                                 rng: random.Random) -> Dict[str, Any]:
         """Generează dinamic întrebare example din teoria topic-ului"""
-        if seed is not None:
-            random.seed(seed)
-        
         examples = theory.get("examples", [])
         key_concepts = theory.get("key_concepts", [])
         algorithms = theory.get("algorithms", [])
@@ -837,7 +812,7 @@ class TheoryQuestionGenerator:
         explanation = ""
         
         if examples:
-            example = random.choice(examples)
+            example = rng.choice(examples)
             example_name = example.get("name", "")
             example_desc = example.get("description", "")
             explanation = f"Exemplu: {example_name}. {example_desc}"
@@ -846,7 +821,7 @@ class TheoryQuestionGenerator:
             correct_keywords.extend([w.lower().strip('.,!?;:') for w in words if len(w) > 4][:4])
         elif algorithms:
             # Folosește algoritmi ca exemple
-            algorithm = random.choice(algorithms)
+            algorithm = rng.choice(algorithms)
             algo_name = algorithm.get("name", topic.get("topic_name", ""))
             improvement = algorithm.get("improvement", "")
             if improvement:
@@ -858,7 +833,7 @@ class TheoryQuestionGenerator:
                 correct_keywords.extend(["joc", "strategie", "șah", "x", "o"])
         elif optimization_tips:
             # Folosește tips ca exemple
-            tip = random.choice(optimization_tips)
+            tip = rng.choice(optimization_tips)
             explanation = f"Exemplu: {tip}."
             words = tip.split()
             correct_keywords.extend([w.lower().strip('.,!?;:') for w in words if len(w) > 4][:4])
@@ -935,16 +910,13 @@ class TheoryQuestionGenerator:
         }
     
     def _generate_dynamic_comparison(self, topic: Dict, theory: Dict, 
-                                    seed: Optional[int]) -> Dict[str, Any]:
+                                    rng: random.Random) -> Dict[str, Any]:
         """Generează dinamic întrebare comparison din teoria topic-ului"""
-        if seed is not None:
-            random.seed(seed)
-        
         key_concepts = theory.get("key_concepts", [])
         
         if len(key_concepts) >= 2:
             # Alege două concepte pentru comparare
-            concepts = random.sample(key_concepts, min(2, len(key_concepts)))
+            concepts = rng.sample(key_concepts, min(2, len(key_concepts)))
             concept1 = concepts[0] if isinstance(concepts[0], dict) else None
             concept2 = concepts[1] if isinstance(concepts[1], dict) else None
             
@@ -0,0 +1,105 @@
+"""
+Compară un rezultat pytest-benchmark (--benchmark-json) cu baseline-ul salvat și semnalează regresiile.
+
+    python benchmarks/compare.py bench.json --write-baseline benchmarks/baselines/baseline.json
+    python benchmarks/compare.py bench.json --check benchmarks/baselines/baseline.json [--tolerance 0.25]
+
+Baseline-ul păstrează doar statisticile necesare comparației (minim, mediană, medie, ops, runde), nu
+datele mașinii. Regresie = statistica curentă > cea din baseline × (1 + toleranță); implicit se compară
+minimul, cel mai puțin sensibil la zgomotul mașinii pentru funcții de ordinul microsecundelor.
+Codul de ieșire este 1 dacă există regresii.
+"""
+
+from __future__ import annotations
+from typing import List, Optional, Dict, Any
+from pathlib import Path
+import argparse
+import json
+import sys
+
+DEFAULT_TOLERANCE = 0.25
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """fullname -> statistici, din fișierul JSON scris de pytest-benchmark"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    results = {}
+    for bench in data["benchmarks"]:
+        stats = bench["stats"]
+        results[bench["fullname"]] = {
+            "group": bench.get("group"),
+            "min": stats["min"],
+            "median": stats["median"],
+            "mean": stats["mean"],
+            "ops": stats["ops"],
+            "rounds": stats["rounds"],
+        }
+    return results
+
+
+def build_baseline(results: Dict[str, Dict[str, Any]], source: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "python": source.get("machine_info", {}).get("python_version"),
+        "datetime": source.get("datetime"),
+        "benchmarks": results,
+    }
+
+
+def compare(current: Dict[str, Dict[str, Any]], baseline: Dict[str, Any],
+            tolerance: float = DEFAULT_TOLERANCE, stat: str = "min") -> Dict[str, List[str]]:
+    """Returnează {"regressions", "improvements", "missing", "new"} ca liste de linii de raport"""
+    report: Dict[str, List[str]] = {"regressions": [], "improvements": [], "missing": [], "new": []}
+    reference = baseline["benchmarks"]
+    for name, stats in sorted(current.items()):
+        base = reference.get(name)
+        if base is None:
+            report["new"].append(name)
+            continue
+        ratio = stats[stat] / base[stat] if base[stat] else float("inf")
+        line = f"{name}: {base[stat] * 1e6:.1f}µs -> {stats[stat] * 1e6:.1f}µs ({ratio:.2f}x)"
+        if ratio > 1 + tolerance:
+            report["regressions"].append(line)
+        elif ratio < 1 / (1 + tolerance):
+            report["improvements"].append(line)
+    report["missing"] = sorted(set(reference) - set(current))
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Regresii de performanță față de baseline")
+    parser.add_argument("results", type=Path, help="fișierul --benchmark-json al rulării curente")
+    parser.add_argument("--write-baseline", type=Path, default=None)
+    parser.add_argument("--check", type=Path, default=None, help="baseline-ul cu care se compară")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="creșterea relativă tolerată (implicit 0.25 = 25%%)")
+    parser.add_argument("--stat", choices=["min", "median", "mean"], default="min")
+    args = parser.parse_args(argv)
+
+    with open(args.results, "r", encoding="utf-8") as f:
+        source = json.load(f)
+    current = load_results(args.results)
+    print(f"{len(current)} benchmark-uri în {args.results}")
+
+    if args.write_baseline:
+        args.write_baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.write_baseline, "w", encoding="utf-8") as f:
+            json.dump(build_baseline(current, source), f, indent=2, sort_keys=True)
+        print(f"Baseline scris în {args.write_baseline}")
+    if args.check:
+        with open(args.check, "r", encoding="utf-8") as f:
+            report = compare(current, json.load(f), args.tolerance, args.stat)
+        for title, key in (("Îmbunătățiri", "improvements"), ("Noi (fără baseline)", "new"),
+                           ("Lipsă din rularea curentă", "missing"), ("Regresii", "regressions")):
+            if report[key]:
+                print(f"{title}:")
+                for line in report[key]:
+                    print(f"  - {line}")
+        if report["regressions"]:
+            return 1
+        print(f"Fără regresii (toleranță {args.tolerance:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
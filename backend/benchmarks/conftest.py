@@ -0,0 +1,70 @@
+"""
+Suita de benchmark-uri (pytest-benchmark) pentru generatoare, evaluatori și chatbot.
+
+    pip install pytest-benchmark
+    python -m pytest benchmarks --benchmark-json=bench.json
+    python benchmarks/compare.py bench.json --check benchmarks/baselines/baseline.json
+
+Într-o rulare obișnuită (`python -m pytest` din backend/) benchmark-urile sunt sărite:
+rulează doar când directorul benchmarks este dat explicit.
+"""
+
+import importlib.util
+import itertools
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BENCH_DIR = Path(__file__).resolve().parent
+
+# fără plugin, fixture-ul `benchmark` nu există: modulele nu se colectează deloc
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["test_*.py"]
+
+
+def _targets_benchmarks(config) -> bool:
+    for arg in config.args:
+        path = Path(arg.split("::")[0]).resolve()
+        if path == BENCH_DIR or BENCH_DIR in path.parents:
+            return True
+    return False
+
+
+def pytest_collection_modifyitems(config, items):
+    if _targets_benchmarks(config):
+        return
+    skip = pytest.mark.skip(reason="benchmark: rulează cu `python -m pytest benchmarks`")
+    for item in items:
+        if BENCH_DIR in Path(item.fspath).parents:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    """Evenimentele de log nu trebuie să intre în timpii măsurați"""
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.WARNING)
+    yield
+    root.setLevel(level)
+
+
+@pytest.fixture
+def seeds():
+    """Seed-uri consecutive: aceeași secvență de întrebări la fiecare rulare, deci timpi comparabili"""
+    return itertools.count(1)
+
+
+@pytest.fixture
+def hashed_encoder(monkeypatch):
+    """Encoder-ul local din nlp_utils (SMARTEST_ENCODER=hashed) în locul modelului, doar pe durata testului"""
+    import app.nlp_utils as nlp_utils
+    encoder = nlp_utils.HashedNgramEncoder(nlp_utils.ENCODER_DIM)
+    monkeypatch.setattr(nlp_utils, "_semantic_model", encoder)
+    monkeypatch.setattr(nlp_utils, "SEMANTIC_SIMILARITY_AVAILABLE", True)
+    return encoder
@@ -0,0 +1,27 @@
+"""
+Benchmark: chatbot.answer_question (răspunsuri pe reguli și căutare în fragmentele de teorie),
+cu backend-ul de similaritate implicit și cu encoder-ul local de n-grame hash-uite
+"""
+
+import pytest
+
+import app.chatbot as chatbot
+
+QUESTIONS = {
+    "theory": "ce este echilibrul nash?",
+    "theory-topic": "cum functioneaza alpha beta pruning",
+    "rule-minmax": "genereaza o intrebare minmax",
+    "unknown": "care este capitala frantei",
+}
+
+
+@pytest.mark.parametrize("kind", list(QUESTIONS))
+def test_answer_question(benchmark, kind):
+    benchmark.group = "chatbot"
+    benchmark(chatbot.answer_question, QUESTIONS[kind])
+
+
+@pytest.mark.parametrize("kind", list(QUESTIONS))
+def test_answer_question_hashed(benchmark, hashed_encoder, kind):
+    benchmark.group = "chatbot-hashed"
+    benchmark(chatbot.answer_question, QUESTIONS[kind])
@@ -0,0 +1,32 @@
+"""Benchmark: generarea (cu măsurarea efortului fiecărei optimizări) și evaluarea întrebărilor CSP"""
+
+import itertools
+
+import pytest
+
+import app.smartest_csp as csp
+
+PROBLEM_TYPES = list(csp.CSP_PROBLEMS)
+
+
+@pytest.mark.parametrize("problem_type", PROBLEM_TYPES)
+def test_build_question_payload(benchmark, seeds, problem_type):
+    benchmark.group = "csp-build"
+    benchmark(lambda: csp.build_question_payload(problem_type=problem_type, seed=next(seeds)))
+
+
+@pytest.mark.parametrize("problem_type", PROBLEM_TYPES)
+def test_grade_answer(benchmark, problem_type):
+    benchmark.group = "csp-grade"
+    cases = []
+    for seed in range(4):
+        payload = csp.build_question_payload(problem_type=problem_type, seed=seed)
+        cases += [(payload["correct_optimization"], payload), ("fc", payload), ("cred că MRV", payload),
+                  ("2", payload), ("nu știu", payload)]
+    cycle = itertools.cycle(cases)
+
+    def run():
+        answer, payload = next(cycle)
+        return csp.grade_answer(answer, payload)
+
+    benchmark(run)
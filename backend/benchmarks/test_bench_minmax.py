@@ -0,0 +1,40 @@
+"""Benchmark: generarea (inclusiv rezolvarea arborelui) și evaluarea MinMax, pe adâncime × ramificare"""
+
+import itertools
+
+import pytest
+
+import app.smartest_minmax as mm
+
+DEPTHS = [2, 3, 4]
+BRANCHING = [2, 3, 4]
+
+
+@pytest.mark.parametrize("branching_factor", BRANCHING)
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_build_question_payload(benchmark, seeds, depth, branching_factor):
+    benchmark.group = "minmax-build"
+    benchmark(lambda: mm.build_question_payload(depth=depth, branching_factor=branching_factor, seed=next(seeds)))
+
+
+@pytest.mark.parametrize("branching_factor", BRANCHING)
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_grade_answer(benchmark, depth, branching_factor):
+    benchmark.group = "minmax-grade"
+    cases = []
+    for seed in range(8):
+        payload = mm.build_question_payload(depth=depth, branching_factor=branching_factor, seed=seed)
+        solution = payload["solution"]
+        cases += [
+            (f"Valoarea rădăcinii este {solution['root_value']} și se vizitează "
+             f"{solution['visited_count']} frunze", payload),
+            (f"{solution['root_value']}, {solution['visited_count']}", payload),
+            ("valoarea este 0, frunze vizitate: 3", payload),
+        ]
+    cycle = itertools.cycle(cases)
+
+    def run():
+        answer, payload = next(cycle)
+        return mm.grade_answer(answer, payload)
+
+    benchmark(run)
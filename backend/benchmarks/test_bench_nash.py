@@ -0,0 +1,46 @@
+"""Benchmark: generarea și evaluarea întrebărilor Nash, pe dimensiuni și moduri `ensure`"""
+
+import itertools
+
+import pytest
+
+import app.smartest_nash as sm
+
+SIZES = [(2, 2), (3, 3), (4, 4), (5, 5)]
+ENSURE_MODES = ["any", "atleast_one", "unique", "none"]
+
+
+@pytest.mark.parametrize("ensure", ENSURE_MODES)
+@pytest.mark.parametrize("rows,cols", SIZES)
+def test_build_question_payload(benchmark, seeds, rows, cols, ensure):
+    benchmark.group = "nash-build"
+    benchmark(lambda: sm.build_question_payload(rows=rows, cols=cols, ensure=ensure, seed=next(seeds)))
+
+
+def _answers(payload):
+    rl, cl = payload["row_labels"], payload["col_labels"]
+    gold = payload["solution"]["equilibria"]
+    correct = ", ".join(f"({r},{c})" for r, c in gold) if gold else "nu există echilibru"
+    return [
+        correct,
+        f"Echilibrele sunt {rl[0]} {cl[-1]} și {rl[-1]} {cl[0]}",
+        "(1,1) și (2, 2)",
+        "nu există echilibru Nash pur",
+        "răspuns fără perechi",
+    ]
+
+
+@pytest.mark.parametrize("rows,cols", SIZES)
+def test_grade_answer(benchmark, rows, cols):
+    benchmark.group = "nash-grade"
+    cases = []
+    for seed in range(8):
+        payload = sm.build_question_payload(rows=rows, cols=cols, ensure="atleast_one", seed=seed)
+        cases.extend((answer, payload) for answer in _answers(payload))
+    cycle = itertools.cycle(cases)
+
+    def run():
+        answer, payload = next(cycle)
+        return sm.grade_answer(answer, payload)
+
+    benchmark(run)
@@ -0,0 +1,34 @@
+"""Benchmark: generarea și evaluarea întrebărilor Problem 1 (identificarea strategiei)"""
+
+import itertools
+
+import pytest
+
+import app.smartest_problem1 as p1
+
+PROBLEM_TYPES = list(p1.PROBLEMS)
+
+
+@pytest.mark.parametrize("problem_type", PROBLEM_TYPES)
+def test_build_question_payload(benchmark, seeds, problem_type):
+    benchmark.group = "problem1-build"
+    benchmark(lambda: p1.build_question_payload(problem_type=problem_type, seed=next(seeds)))
+
+
+@pytest.mark.parametrize("problem_type", PROBLEM_TYPES)
+def test_grade_answer(benchmark, problem_type):
+    benchmark.group = "problem1-grade"
+    cases = []
+    for seed in range(4):
+        payload = p1.build_question_payload(problem_type=problem_type, seed=seed)
+        options = payload.get("options") or []
+        answers = [str(payload.get("correct_moves", 0)), "nu știu", "1"]
+        answers += [options[0], f"aș folosi {options[-1].lower()}"] if options else ["81 de mutări"]
+        cases += [(answer, payload) for answer in answers]
+    cycle = itertools.cycle(cases)
+
+    def run():
+        answer, payload = next(cycle)
+        return p1.grade_answer(answer, payload)
+
+    benchmark(run)
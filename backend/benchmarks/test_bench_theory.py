@@ -0,0 +1,64 @@
+"""
+Benchmark: generarea întrebărilor de teorie și evaluarea pe tip de întrebare,
+cu backend-ul de similaritate fuzzy (fuzzywuzzy), cu fallback-ul simplu și cu
+encoder-ul local de n-grame hash-uite (drumul semantic complet, fără model)
+"""
+
+import itertools
+
+import pytest
+
+import app.nlp_utils as nlp_utils
+import app.theory_grading as theory_g
+import app.theory_questions as theory_q
+
+QUESTION_TYPES = ["multiple_choice", "true_false", "fill_blank", "short_answer", "justification",
+                  "definition", "example", "comparison"]
+
+
+@pytest.fixture(params=["fallback", "fuzzy", "hashed"])
+def similarity_backend(request, monkeypatch):
+    """Fixează backend-ul din nlp_utils; modelul semantic nu e folosit (timpii ar fi dominați de encode)"""
+    if request.param == "hashed":
+        request.getfixturevalue("hashed_encoder")
+        monkeypatch.setattr(theory_g, "SEMANTIC_SIMILARITY_AVAILABLE", True)
+        return request.param
+    if request.param == "fuzzy":
+        pytest.importorskip("fuzzywuzzy")
+    fuzzy = request.param == "fuzzy"
+    monkeypatch.setattr(nlp_utils, "SEMANTIC_SIMILARITY_AVAILABLE", False)
+    monkeypatch.setattr(nlp_utils, "NLP_AVAILABLE", fuzzy)
+    monkeypatch.setattr(nlp_utils, "_semantic_model", None)
+    monkeypatch.setattr(theory_g, "SEMANTIC_SIMILARITY_AVAILABLE", False)
+    monkeypatch.setattr(theory_g, "NLP_AVAILABLE", fuzzy)
+    return request.param
+
+
+@pytest.mark.parametrize("question_type", QUESTION_TYPES)
+def test_build_question_payload(benchmark, seeds, question_type):
+    benchmark.group = "theory-build"
+    benchmark(lambda: theory_q.build_question_payload(question_type=question_type, seed=next(seeds)))
+
+
+def _answers(question):
+    correct = question.get("correct_answer")
+    if correct is None:
+        correct = (question.get("correct_answers") or [""])[0]
+    return [str(correct), "nu știu", "un răspuns parțial care menționează doar câteva idei din teorie",
+            str(correct)[:40] + " deoarece așa spune definiția"]
+
+
+@pytest.mark.parametrize("question_type", QUESTION_TYPES)
+def test_grade_answer(benchmark, similarity_backend, question_type):
+    benchmark.group = f"theory-grade-{similarity_backend}"
+    cases = []
+    for seed in range(4):
+        question = theory_q.build_question_payload(question_type=question_type, seed=seed)["payload"]
+        cases += [(answer, question) for answer in _answers(question)]
+    cycle = itertools.cycle(cases)
+
+    def run():
+        answer, question = next(cycle)
+        return theory_g.grade_answer(answer, question)
+
+    benchmark(run)
@@ -1,6 +1,13 @@
 @echo off
 echo Starting SmarTest Backend Server...
 cd /d %~dp0
+if "%SMARTEST_INTERNAL_SECRET%"=="" (
+    echo SMARTEST_INTERNAL_SECRET is not set: graded results would not be saved.
+    echo Set the same value for the backend and for PHP, e.g.: set SMARTEST_INTERNAL_SECRET=o-valoare-lunga-si-aleatoare
+    echo See START_PROJECT.md.
+    pause
+    exit /b 1
+)
 if not exist .venv (
     echo Creating virtual environment...
     py -m venv .venv
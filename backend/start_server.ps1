@@ -1,6 +1,13 @@
 Write-Host "Starting SmarTest Backend Server..." -ForegroundColor Green
 Set-Location $PSScriptRoot
 
+if (-not $env:SMARTEST_INTERNAL_SECRET) {
+    Write-Host "SMARTEST_INTERNAL_SECRET is not set: graded results would not be saved." -ForegroundColor Red
+    Write-Host "Set the same value for the backend and for PHP, e.g.: `$env:SMARTEST_INTERNAL_SECRET = 'o-valoare-lunga-si-aleatoare'" -ForegroundColor Red
+    Write-Host "See START_PROJECT.md." -ForegroundColor Red
+    exit 1
+}
+
 if (-not (Test-Path .venv)) {
     Write-Host "Creating virtual environment..." -ForegroundColor Yellow
     py -m venv .venv
@@ -0,0 +1,45 @@
+"""Test: verificările de constrângeri se numără la fel în toate tehnicile, recomandarea variază între instanțe,
+iar generarea rămâne mărginită pe grafuri cu sute de noduri"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app.csp_solver as solver
+import app.smartest_csp as smartest_csp
+
+
+def test_forward_checking_counts_each_tested_value():
+    # X1 are un singur vecin cu 3 valori: FC testează toate cele 3 valori, nu doar vecinul
+    csp = solver.compile_csp(["X1", "X2"], {"X1": [1], "X2": [1, 2, 3]}, [("X1", "X2", "!=")])
+    result = solver.solve(csp, "Forward Checking")
+    assert result["satisfiable"]
+    assert result["checks"] == 3
+
+
+def test_recommendation_varies_across_seeds():
+    for problem_type, minimum in (("simple", 3), ("graph_coloring", 2), ("sudoku", 2)):
+        recommended = {smartest_csp.generate_csp_question(problem_type, seed=seed)["correct_optimization"]
+                       for seed in range(60)}
+        assert len(recommended) >= minimum, (problem_type, recommended)
+
+
+def test_large_graph_coloring_is_bounded():
+    limit = sys.getrecursionlimit()
+    start = time.perf_counter()
+    instance = smartest_csp.generate_graph_coloring_csp_instance(vertices=200, model="gnp", seed=1)
+    assert time.perf_counter() - start < 10
+    effort = instance["search_effort"]
+    assert effort["MRV"]["complete"] and effort["MRV"]["satisfiable"]
+    # bugetul de verificări oprește și tehnicile care nu termină (un nod MAC poate costa mii de verificări)
+    assert all(e["checks"] < 2 * smartest_csp.SEARCH_MAX_CHECKS for e in effort.values())
+    assert sys.getrecursionlimit() == limit
+
+
+if __name__ == "__main__":
+    test_forward_checking_counts_each_tested_value()
+    test_recommendation_varies_across_seeds()
+    test_large_graph_coloring_is_bounded()
+    print("✓ Recomandarea CSP depinde de instanță")
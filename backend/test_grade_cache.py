@@ -0,0 +1,54 @@
+"""Test: cache-ul evaluărilor — răspunsuri echivalente împart intrarea, rezultatele memorate nu pot fi modificate de apelant"""
+
+import os
+import sys
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+import app.grade_cache as grade_cache
+
+PAYLOAD = {"id": 123456, "question_text": "Care este echilibrul Nash?", "correct": "R2 C1"}
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    monkeypatch.setattr(grade_cache, "_CACHE", grade_cache.GradeCache())
+    seen = []
+
+    def grade(answer, payload):
+        seen.append(answer)
+        return {"score": 100, "feedback": "Corect.", "details": {"parsed": ["R2", "C1"]}}
+
+    return seen, grade
+
+
+def test_equivalent_answers_share_an_entry(calls):
+    seen, grade = calls
+    decomposed = unicodedata.normalize("NFD", "echilibru în R2 C1, strategia dominantă")
+    for answer in ("echilibru în R2 C1, strategia dominantă", f"  {decomposed} ",
+                   "echilibru  în\tR2 C1,   strategia dominantă"):
+        grade_cache.cached_grade("nash", PAYLOAD, answer, grade)
+    assert len(seen) == 1
+    # literele mari contează: alt răspuns, altă intrare
+    grade_cache.cached_grade("nash", PAYLOAD, "ECHILIBRU ÎN R2 C1, STRATEGIA DOMINANTĂ", grade)
+    assert len(seen) == 2
+    assert grade_cache.stats()["hits"] == 2
+
+
+def test_cached_result_is_not_shared_with_callers(calls):
+    seen, grade = calls
+    first = grade_cache.cached_grade("nash", PAYLOAD, "R2 C1", grade)
+    first["score"] = 0
+    first["details"]["parsed"].append("R1")
+    second = grade_cache.cached_grade("nash", PAYLOAD, "R2 C1", grade)
+    assert second == {"score": 100, "feedback": "Corect.", "details": {"parsed": ["R2", "C1"]}}
+    second["details"]["parsed"].clear()
+    assert grade_cache.cached_grade("nash", PAYLOAD, "R2 C1", grade)["details"]["parsed"] == ["R2", "C1"]
+    assert len(seen) == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,47 @@
+"""Test: numărul de mutări din răspunsurile la întrebările Hanoi "câte mutări minime" """
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.smartest_problem1 import _parse_number, build_question_payload
+
+# (răspuns, numărul extras)
+CORPUS = [
+    ("1023", 1023),
+    ("1.023", 1023),
+    ("1,023 mutări", 1023),
+    ("1 023 de mutari", 1023),
+    ("1023 mutări pentru 10 discuri", 1023),
+    ("10 discuri necesită 1023 mutări", 1023),
+    ("Pentru 10 discuri și 4 tije: 49", 49),
+    ("numărul minim de mutări este 49 cu 4 tije", 49),
+    ("49 moves for 10 disks and 4 pegs", 49),
+    ("am calculat 1023 (10 discuri)", 1023),
+    ("mutări: 161, split 5", 161),
+    ("cu 4 tije sunt 33", 33),
+    ("10 discuri", None),
+    ("nu știu", None),
+    ("", None),
+]
+
+
+def test_corpus():
+    for answer, expected in CORPUS:
+        assert _parse_number(answer) == expected, answer
+
+
+def test_min_moves_only_on_request():
+    # interfața de strategie cere numele strategiei: fără question_kind, Hanoi rămâne o întrebare de strategie
+    for seed in range(20):
+        payload = build_question_payload("hanoi", seed=seed)
+        assert payload["question_kind"] == "strategy" and payload["options"]
+    payload = build_question_payload("hanoi", seed=0, question_kind="min_moves")
+    assert payload["question_kind"] == "min_moves" and payload["correct_moves"] > 0
+
+
+if __name__ == "__main__":
+    test_corpus()
+    test_min_moves_only_on_request()
+    print("✓ Numărul de mutări este extras corect")
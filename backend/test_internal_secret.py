@@ -0,0 +1,63 @@
+"""Test: rezultatele cu user_id se salvează doar cu secretul intern; altfel răspunsul o spune și log-ul o semnalează"""
+
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+import app.results_store as results_store
+
+client = TestClient(main.app)
+
+SECRET = "test-secret"
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    calls = []
+    monkeypatch.setattr(results_store, "record_result", lambda *args: calls.append(args))
+    monkeypatch.setattr(main, "_UNRECORDED_WARNED", set())
+    return calls
+
+
+def _grade(headers=None, user_id=7) -> dict:
+    payload = client.get("/nash/generate?rows=2&cols=2&seed=5").json()
+    body = {"payload": payload, "answer": "nu există", "user_id": user_id}
+    response = client.post("/nash/grade", json=body, headers=headers or {})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_missing_secret_is_reported_once(recorded, monkeypatch, caplog):
+    monkeypatch.delenv("SMARTEST_INTERNAL_SECRET", raising=False)
+    with caplog.at_level(logging.WARNING, logger="app.main"):
+        assert _grade()["recorded"] is False
+        assert _grade()["recorded"] is False
+    assert recorded == []
+    warnings = [r for r in caplog.records if "SMARTEST_INTERNAL_SECRET is not set" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+def test_wrong_header_is_not_recorded(recorded, monkeypatch, caplog):
+    monkeypatch.setenv("SMARTEST_INTERNAL_SECRET", SECRET)
+    with caplog.at_level(logging.WARNING, logger="app.main"):
+        assert _grade({main.INTERNAL_HEADER: "wrong"})["recorded"] is False
+    assert recorded == []
+    assert any("does not match" in r.getMessage() for r in caplog.records)
+
+
+def test_internal_request_is_recorded(recorded, monkeypatch):
+    monkeypatch.setenv("SMARTEST_INTERNAL_SECRET", SECRET)
+    assert _grade({main.INTERNAL_HEADER: SECRET})["recorded"] is True
+    assert len(recorded) == 1 and recorded[0][0] == 7
+    # fără user_id răspunsul rămâne cel de dinainte
+    assert "recorded" not in _grade(user_id=None)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,118 @@
+"""Test: extractorul MinMax (un singur parcurs) față de corpusul de răspunsuri al parserului vechi (cascada de regex)"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.smartest_minmax import _parse_answer
+
+# (răspuns, valoare, frunze) — rezultatele parserului vechi; unde diferă, comentariul indică
+# rezultatul vechi (greșit: frunzele copiate din valoare sau valoarea ignorată lângă "N3")
+CORPUS = [
+    ('5 4', 5, 4),
+    ('-3 6', -3, 6),
+    ('valoare=5, frunze=4', 5, 4),
+    ('value=-2, leaves=7', -2, 7),
+    ('value: 3; leaves: 5', 3, 5),
+    ('Valoarea este 5 și au fost vizitate 4 frunze', 5, 4),
+    ('Frunzele sunt 4, valoarea este 5', 5, 4),
+    ('valoarea din rădăcină este 7', 7, None),
+    ('rădăcina are valoarea 3 si 6 frunze vizitate', 3, 6),
+    ('Radacina este -1 iar numarul de frunze este 6', -1, 6),
+    ('Numarul de noduri frunze vizitate este 4', None, 4),
+    ('Numărul de frunze vizitate: 5', None, 5),
+    ('frunze vizitate = 8', None, 8),
+    ('root = 3, leaves visited = 5', 3, 5),
+    ('The root value is 4 and 6 leaves were visited', 4, 6),
+    ('minmax returnează 5, alpha-beta vizitează 4', 5, 4),
+    ('algoritmul returnează -2', -2, None),
+    ('rezultatul este 9', 9, None),
+    ('valoare 5', 5, None),
+    ('4 frunze', None, 4),
+    ('7', 7, None),
+    ('-4', -4, None),
+    ('25', None, 25),
+    ('valoarea este 3. Au fost vizitate frunzele N3, N4, N6', 3, None),
+    ('Frunzele vizitate: N3 N4 N5 N6, valoarea 2', 2, None),  # vechiul parser: (None, None)
+    ('valoarea este 4, frunze: 4', 4, 4),
+    ('iar valoarea este -1', -1, None),
+    ('value is 8, visited 5 leaves', 8, 5),
+    ('leaves: 6 value: 2', 2, 6),
+    ('3, 5', 3, 5),
+    ('valoare 3 frunze 5', 3, 5),
+    ('Cred că valoarea e 6 și frunzele 7', 6, 7),  # vechiul parser: (6, 6)
+    ('noduri vizitate 9, valoarea 4', 4, None),  # vechiul parser: (None, None)
+    ('am vizitat 5 frunze iar radacina are 2', 2, 5),
+    ('Răspuns: 5 și 4', 5, 4),
+    ('valoarea rădăcinii: -5; frunze: 3', -5, 3),
+    ('La radacina avem 4, cu 7 frunze vizitate', 4, 7),
+    ('MAX alege 6, vizitate 5 frunze', 6, 5),
+    ('valoarea = 0, frunze = 5', 0, 5),
+    ('0 5', 0, 5),
+    ('nu stiu', None, None),
+    ('', None, None),
+    ('value 12 leaves 9', 12, 9),
+    ('valoarea este 10', 10, None),
+    ('30 frunze', None, 30),
+    ('Answer: root 3 leaves 4', 3, 4),
+    ('prima data 2 apoi 3', 2, 3),
+    ('valoarea nodului N2 este 5', None, None),
+    ('În N0 valoarea 4; 6 frunze', 4, 6),  # vechiul parser: (None, None)
+    ('frunze vizitate sunt 4 si valoarea este -3', -3, 4),
+    ('rădăcina are 1, numărul de frunze vizitate este 10', 1, 10),  # vechiul parser: (1, 1)
+    ('minmax returnează 1 iar alpha-beta vizitează 1', 1, 1),  # vechiul parser: (1, None)
+    ('Valoarea finala este 5, frunze vizitate 4', 5, 4),
+    ('valoarea optima este 5, frunze 4', 5, 4),
+    ('MAX obtine 3, frunze vizitate: 7', 3, 7),
+    ('Valoarea calculata: 2, frunze: 6', 2, 6),
+    ('5 value 4 leaves', 5, 4),
+    ('5 value and 4 leaves', 5, 4),
+    ('3 valoarea si 5 frunze', 3, 5),
+]
+
+
+def test_corpus_parity():
+    for answer, value, leaves in CORPUS:
+        assert _parse_answer(answer) == {"value": value, "leaves": leaves}, answer
+
+
+def _long_answer(k: int) -> str:
+    return "valoarea " + " ".join(f"pasul {i} MAX alege {1000 + i}" for i in range(k))
+
+
+def _seconds(answer: str, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _parse_answer(answer)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_long_answers_scale_linearly():
+    small, large = _long_answer(2000), _long_answer(8000)
+    # 4x mai mult text: liniar ~4x, pătratic ~16x
+    assert _seconds(large) < 8 * _seconds(small) + 0.01
+
+
+def benchmark(repeat: int = 2000) -> None:
+    """Răspunsuri/secundă pe corpus și MB/s pe un răspuns lung"""
+    answers = [answer for answer, _, _ in CORPUS]
+    start = time.perf_counter()
+    for _ in range(repeat // len(answers) + 1):
+        for answer in answers:
+            _parse_answer(answer)
+    elapsed = time.perf_counter() - start
+    count = (repeat // len(answers) + 1) * len(answers)
+    print(f"corpus: {count / elapsed:,.0f} răspunsuri/s")
+    long_answer = _long_answer(20000)
+    print(f"răspuns lung ({len(long_answer) / 1e6:.2f} MB): {len(long_answer) / 1e6 / _seconds(long_answer):.2f} MB/s")
+
+
+if __name__ == "__main__":
+    test_corpus_parity()
+    test_long_answers_scale_linearly()
+    print("✓ Extractorul MinMax respectă corpusul și scalează liniar")
+    benchmark()
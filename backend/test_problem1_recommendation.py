@@ -0,0 +1,41 @@
+"""Test: strategia recomandată la problemele din Problema 1 variază între instanțe, iar limitarea căutării nu o schimbă"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app.problem_solvers as solvers
+import app.smartest_problem1 as problem1
+
+
+def test_recommendation_varies_across_seeds():
+    for problem_type in ("n-queens", "hanoi", "graph_coloring", "knight_tour"):
+        recommended = {problem1.generate_problem_question(problem_type, seed=seed)["correct_strategy"]
+                       for seed in range(40)}
+        assert len(recommended) >= 2, (problem_type, recommended)
+
+
+def test_relative_budget_keeps_the_recommendation(monkeypatch):
+    bounded = [solvers.recommend_strategy(solvers.solve_hanoi(disks, pegs))
+               for disks in (3, 4, 5) for pegs in (3, 4, 5)]
+    bounded += [solvers.recommend_strategy(solvers.solve_n_queens(n)) for n in range(4, 9)]
+    monkeypatch.setattr(solvers, "RELATIVE_BUDGET", solvers.SOLVER_MAX_NODES)
+    # max_nodes explicit: cheie nouă în cache, deci solverele rulează din nou, fără limita relativă
+    full = [solvers.recommend_strategy(solvers.solve_hanoi(disks, pegs, max_nodes=solvers.SOLVER_MAX_NODES - 1))
+            for disks in (3, 4, 5) for pegs in (3, 4, 5)]
+    full += [solvers.recommend_strategy(solvers.solve_n_queens(n, max_nodes=solvers.SOLVER_MAX_NODES - 1))
+             for n in range(4, 9)]
+    assert bounded == full
+
+
+def test_cached_report_is_a_copy():
+    report = solvers.solve_n_queens(6)
+    report["Backtracking"]["nodes"] = -1
+    assert solvers.solve_n_queens(6)["Backtracking"]["nodes"] > 0
+
+
+if __name__ == "__main__":
+    test_recommendation_varies_across_seeds()
+    test_cached_report_is_a_copy()
+    print("✓ Recomandarea din Problema 1 depinde de instanță")
@@ -0,0 +1,45 @@
+"""Test: token-urile de întrebare modificate sau trunchiate sunt respinse, cele valide regenerează întrebarea"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+import app.question_tokens as question_tokens
+
+PARAMS = {"rows": 2, "cols": 3, "ensure": "any"}
+
+
+def _tampered(token):
+    body, _, signature = token.partition(".")
+    claims = question_tokens.decode(token)
+    forged = question_tokens._b64encode(
+        question_tokens.json.dumps({**claims, "s": claims["s"] + 1}, sort_keys=True, separators=(",", ":")).encode())
+    flipped = body[:-1] + ("A" if body[-1] != "A" else "B")
+    return [f"{forged}.{signature}", f"{flipped}.{signature}", f"{body}.{signature[::-1]}"]
+
+
+def test_valid_token_regenerates_the_question():
+    token = question_tokens.issue("nash", 42, PARAMS)
+    assert question_tokens.resolve(token, "nash") == question_tokens.generate("nash", 42, PARAMS)
+
+
+def test_tampered_or_truncated_tokens_are_rejected():
+    token = question_tokens.issue("nash", 42, PARAMS)
+    body, _, signature = token.partition(".")
+    invalid = _tampered(token) + [token[:-1], body, f"{body}.", f"{body[:-4]}.{signature}", "", "."]
+    for bad in invalid:
+        with pytest.raises(ValueError):
+            question_tokens.resolve(bad)
+
+
+def test_token_for_another_kind_is_rejected():
+    token = question_tokens.issue("nash", 42, PARAMS)
+    with pytest.raises(ValueError):
+        question_tokens.resolve(token, "minmax")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,100 @@
+"""Test: scriitorul de rezultate (loturi, agregate, payload-uri deduplicate) pe o bază temporară (SMARTEST_DB)"""
+
+import json
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+import app.payload_store as payload_store
+import app.result_stats as result_stats
+import app.results_store as results_store
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "smartest.db")
+    monkeypatch.setenv("SMARTEST_DB", path)
+    monkeypatch.setattr(results_store, "_WRITER", None)
+    yield path
+    if results_store._WRITER is not None:
+        results_store._WRITER.close()
+
+
+def _count(path, sql):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_batched_results_update_rows_and_aggregates(db_path):
+    questions = [{"id": i, "question_text": f"întrebarea {i}"} for i in range(5)]
+    expected = {}
+    # mai mult de un lot (BATCH_SIZE = 256)
+    for i in range(300):
+        user_id, topic, score = 1 + i % 2, ("MinMax", "Nash")[i % 3 == 0], (i * 7) % 101
+        results_store.record_result(user_id, topic, score, "ok", questions[i % len(questions)])
+        expected.setdefault(user_id, []).append(score)
+    assert results_store.flush(10)
+
+    assert _count(db_path, "SELECT COUNT(*) FROM results") == 300
+    assert _count(db_path, "SELECT COUNT(*) FROM questions") == len(questions)
+    assert _count(db_path, "SELECT COUNT(*) FROM results WHERE payload_hash IS NULL") == 0
+    for user_id, scores in expected.items():
+        stats = results_store.user_stats(user_id)
+        assert stats["count"] == len(scores)
+        assert stats["avg_score"] == round(sum(scores) / len(scores), 2)
+        assert sum(t["count"] for t in stats["topics"]) == len(scores)
+    assert results_store.stats()["errors"] == 0
+
+
+def test_v1_database_is_migrated(db_path):
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    for ddl in results_store._TABLES:
+        conn.execute(ddl)
+    conn.execute("PRAGMA user_version = 1")
+    payload = {"id": 7, "question_text": "Care este echilibrul Nash?"}
+    rows = [(3, "Nash", 80, json.dumps(payload)), (3, "Nash", 40, json.dumps(payload)), (3, "CSP", 100, None)]
+    conn.executemany("INSERT INTO results (user_id, topic, score, payload) VALUES (?, ?, ?, ?)", rows)
+
+    results_store.ensure_schema(conn)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == results_store.SCHEMA_VERSION
+    stats = result_stats.user_stats(conn, 3)
+    assert stats["count"] == 3 and stats["avg_score"] == round(220 / 3, 2)
+
+    assert payload_store.migrate(conn, "results") == (2, 1)
+    stored = conn.execute("SELECT payload, payload_hash FROM results WHERE topic = 'Nash'").fetchall()
+    assert all(inline is None and payload_hash for inline, payload_hash in stored)
+    assert payload_store.load(conn, None, stored[0][1]) == payload
+    conn.close()
+
+
+def test_rolled_back_batch_leaves_no_known_hash(db_path, monkeypatch):
+    writer = results_store.writer()
+    original_apply = result_stats.apply
+
+    def failing_apply(conn, rows):
+        raise ValueError("agregat corupt")
+
+    monkeypatch.setattr(result_stats, "apply", failing_apply)
+    payload = {"id": 1, "question_text": "întrebare"}
+    results_store.record_result(1, "MinMax", 50, None, payload)
+    assert results_store.flush(5)
+    assert writer.stats()["errors"] == 1
+    assert not writer._blobs._known
+    assert _count(db_path, "SELECT COUNT(*) FROM questions") == 0
+
+    # același payload după rollback: blob-ul se scrie din nou, nu e considerat deja stocat
+    monkeypatch.setattr(result_stats, "apply", original_apply)
+    results_store.record_result(1, "MinMax", 50, None, payload)
+    assert results_store.flush(5)
+    assert _count(db_path, "SELECT COUNT(*) FROM results r JOIN questions q ON q.hash = r.payload_hash") == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,72 @@
+"""Test: întrebările generate cu seed sunt identice chiar și sub cereri concurente"""
+
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.question_store as question_store
+from app.main import app
+
+client = TestClient(app)
+
+SEEDED_URLS = [
+    "/nash/generate?rows=3&cols=3&ensure=atleast_one&seed=11",
+    "/nash/generate?rows=2&cols=4&ensure=unique&seed=12",
+    "/minmax/generate?depth=3&branching_factor=3&seed=13",
+    "/problem1/generate?seed=14",
+    "/problem1/generate?problem_type=graph_coloring&seed=15",
+    "/problem1/generate?problem_type=hanoi&question_kind=min_moves&seed=20",
+    "/csp/generate?problem_type=simple&seed=16",
+    "/csp/generate?problem_type=graph_coloring&seed=17",
+    "/theory/generate?seed=18",
+    "/theory/generate?question_type=multiple_choice&seed=19",
+]
+
+
+def _fetch(url: str) -> bytes:
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    return response.content
+
+
+def test_seeded_generators_leave_global_rng_untouched():
+    import app.smartest_nash as nash
+    import app.smartest_minmax as minmax
+    import app.smartest_csp as csp
+    import app.smartest_problem1 as p1
+    import app.theory_questions as theory_q
+
+    state = random.getstate()
+    nash.build_question_payload(rows=3, cols=3, seed=1)
+    minmax.build_question_payload(seed=1)
+    csp.build_question_payload(problem_type="graph_coloring", seed=1)
+    p1.build_question_payload(seed=1)
+    theory_q.build_question_payload(seed=1)
+    assert random.getstate() == state
+
+
+def test_seeded_endpoints_are_byte_identical_under_concurrency(monkeypatch):
+    # fără memoizare: altfel doar prima cerere per URL ar rula generatorul, restul ar servi payload-ul memorat
+    monkeypatch.setattr(question_store, "_STORE", question_store.QuestionStore(max_entries=0))
+    expected = {url: _fetch(url) for url in SEEDED_URLS}
+
+    jobs = SEEDED_URLS * 20
+    random.Random(0).shuffle(jobs)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(_fetch, jobs))
+
+    for url, body in zip(jobs, results):
+        assert body == expected[url], f"payload diferit pentru {url}"
+
+
+if __name__ == "__main__":
+    test_seeded_generators_leave_global_rng_untouched()
+    with pytest.MonkeyPatch.context() as mp:
+        test_seeded_endpoints_are_byte_identical_under_concurrency(mp)
+    print("✓ Generatoarele cu seed sunt reproductibile sub concurență")
@@ -19,7 +19,7 @@ if ($quiz_id <= 0) {
     exit;
 }
 
-$stmt = $pdo->prepare("SELECT id, score, question_count, payload, created_at FROM quizzes WHERE id = ? AND user_id = ?");
+$stmt = $pdo->prepare("SELECT id, score, question_count, payload, payload_hash, created_at FROM quizzes WHERE id = ? AND user_id = ?");
 $stmt->execute([$quiz_id, $user_id]);
 $row = $stmt->fetch();
 
@@ -29,13 +29,7 @@ if (!$row) {
     exit;
 }
 
-$payload = null;
-if (!empty($row['payload'])) {
-    $decoded = json_decode($row['payload'], true);
-    if (json_last_error() === JSON_ERROR_NONE) {
-        $payload = $decoded;
-    }
-}
+$payload = load_payload($pdo, $row['payload'], $row['payload_hash']);
 
 echo json_encode([
     'id' => (int)$row['id'],
@@ -0,0 +1,30 @@
+<?php
+// frontend-php/api/internal_secret.php
+
+// Secretul partajat cu backend-ul (SMARTEST_INTERNAL_SECRET, vezi START_PROJECT.md).
+// Fără el backend-ul nu salvează rezultatele, așa că proxy-urile de evaluare refuză cererea
+// în loc să piardă nota fără nicio eroare.
+function internal_secret_header() {
+    $secret = getenv('SMARTEST_INTERNAL_SECRET');
+    if ($secret === false || $secret === '') {
+        error_log('SmarTest: SMARTEST_INTERNAL_SECRET is not set, graded results cannot be saved');
+        http_response_code(500);
+        echo json_encode([
+            "error" => "SMARTEST_INTERNAL_SECRET nu este setat pe serverul PHP: rezultatele nu pot fi salvate (vezi START_PROJECT.md)."
+        ]);
+        exit;
+    }
+    return 'X-SmarTest-Internal: ' . $secret;
+}
+
+// Backend-ul a evaluat, dar nu a salvat (recorded = false): secretul diferă între PHP și backend
+function check_recorded($response) {
+    if (!is_string($response)) {
+        return;
+    }
+    $data = json_decode($response, true);
+    if (is_array($data) && array_key_exists('recorded', $data) && $data['recorded'] === false) {
+        error_log('SmarTest: the backend did not save the result, SMARTEST_INTERNAL_SECRET differs between PHP and the backend');
+    }
+}
+?>
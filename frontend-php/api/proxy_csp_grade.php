@@ -1,6 +1,5 @@
 <?php
 session_start();
-require_once __DIR__ . '/../db_connection.php';
 
 header('Content-Type: application/json');
 
@@ -10,8 +9,19 @@ if (!isset($_SESSION['user_id'])) {
     exit;
 }
 
+require_once __DIR__ . '/internal_secret.php';
+$internal_header = internal_secret_header();
+
 $json_input = file_get_contents('php://input');
 
+// Rezultatul este salvat de backend (coadă + scriitor SQLite), răspunsul nu așteaptă scrierea pe disc
+$request = json_decode($json_input);
+if (is_object($request)) {
+    $request->user_id = (int)$_SESSION['user_id'];
+    $request->topic = 'CSP';
+    $json_input = json_encode($request);
+}
+
 $url = "http://127.0.0.1:8000/csp/grade";
 
 $ch = curl_init($url);
@@ -20,36 +30,15 @@ curl_setopt($ch, CURLOPT_POST, true);
 curl_setopt($ch, CURLOPT_POSTFIELDS, $json_input);
 curl_setopt($ch, CURLOPT_HTTPHEADER, [
     'Content-Type: application/json',
-    'Content-Length: ' . strlen($json_input)
+    'Content-Length: ' . strlen($json_input),
+    // secretul partajat cu backend-ul: doar cererile trecute prin proxy pot salva rezultate pe user_id
+    $internal_header
 ]);
 
 $response = curl_exec($ch);
 $httpCode = curl_getinfo($ch, CURLINFO_HTTP_CODE);
 curl_close($ch);
-
-if ($httpCode === 200 && $response) {
-    $result = json_decode($response, true);
-
-    $original = json_decode($json_input, true);
-    $payloadJson = null;
-    if (is_array($original) && isset($original['payload'])) {
-        $payloadJson = json_encode($original['payload']);
-    }
-    
-    if (isset($result['score'])) {
-        try {
-            $stmt = $pdo->prepare("INSERT INTO results (user_id, topic, score, feedback, payload) VALUES (?, ?, ?, ?, ?)");
-            $stmt->execute([
-                $_SESSION['user_id'],
-                'CSP',
-                $result['score'],
-                $result['feedback'],
-                $payloadJson
-            ]);
-        } catch (PDOException $e) {
-        }
-    }
-}
+check_recorded($response);
 
 http_response_code($httpCode);
 echo $response;
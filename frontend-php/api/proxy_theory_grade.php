@@ -1,6 +1,5 @@
 <?php
 session_start();
-require_once __DIR__ . '/../db_connection.php';
 
 header('Content-Type: application/json');
 
@@ -10,8 +9,19 @@ if (!isset($_SESSION['user_id'])) {
     exit;
 }
 
+require_once __DIR__ . '/internal_secret.php';
+$internal_header = internal_secret_header();
+
 $json_input = file_get_contents('php://input');
 
+// Rezultatul este salvat de backend (coadă + scriitor SQLite), răspunsul nu așteaptă scrierea pe disc
+$request = json_decode($json_input);
+if (is_object($request)) {
+    $request->user_id = (int)$_SESSION['user_id'];
+    $request->topic = 'Teorie';
+    $json_input = json_encode($request);
+}
+
 $url = "http://127.0.0.1:8000/theory/grade";
 
 // Use cURL for better error handling
@@ -22,7 +32,9 @@ curl_setopt($ch, CURLOPT_POSTFIELDS, $json_input);
 curl_setopt($ch, CURLOPT_RETURNTRANSFER, true);
 curl_setopt($ch, CURLOPT_HTTPHEADER, [
     'Content-Type: application/json',
-    'Content-Length: ' . strlen($json_input)
+    'Content-Length: ' . strlen($json_input),
+    // secretul partajat cu backend-ul: doar cererile trecute prin proxy pot salva rezultate pe user_id
+    $internal_header
 ]);
 curl_setopt($ch, CURLOPT_TIMEOUT, 10);
 curl_setopt($ch, CURLOPT_CONNECTTIMEOUT, 5);
@@ -32,6 +44,7 @@ $response = curl_exec($ch);
 $httpCode = curl_getinfo($ch, CURLINFO_HTTP_CODE);
 $error = curl_error($ch);
 curl_close($ch);
+check_recorded($response);
 
 if ($error) {
     echo json_encode([
@@ -77,28 +90,6 @@ if (json_last_error() !== JSON_ERROR_NONE) {
     exit;
 }
 
-// Save to database if we have a valid result
-if ($httpCode === 200 && $result && isset($result['score'])) {
-    $original = json_decode($json_input, true);
-    $payloadJson = null;
-    if (is_array($original) && isset($original['payload'])) {
-        $payloadJson = json_encode($original['payload']);
-    }
-    
-    try {
-        $stmt = $pdo->prepare("INSERT INTO results (user_id, topic, score, feedback, payload) VALUES (?, ?, ?, ?, ?)");
-        $stmt->execute([
-            $_SESSION['user_id'],
-            'Teorie',
-            $result['score'],
-            $result['feedback'] ?? '',
-            $payloadJson
-        ]);
-    } catch (PDOException $e) {
-        // Silently fail if DB insert fails - don't break the response
-    }
-}
-
 http_response_code($httpCode);
 echo $response;
 ?>
\ No newline at end of file
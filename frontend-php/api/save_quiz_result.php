@@ -36,9 +36,13 @@ $payloadJson = json_encode([
 ]);
 
 try {
-    $stmt = $pdo->prepare("INSERT INTO quizzes (user_id, score, question_count, time_spent, payload) VALUES (?, ?, ?, ?, ?)");
-    $stmt->execute([$user_id, $score, $question_count, $time_spent, $payloadJson]);
+    // payload-ul merge comprimat în questions; coloana inline (NOT NULL) rămâne goală
+    $pdo->beginTransaction();
+    $payloadHash = store_payload($pdo, $payloadJson);
+    $stmt = $pdo->prepare("INSERT INTO quizzes (user_id, score, question_count, time_spent, payload, payload_hash) VALUES (?, ?, ?, ?, '', ?)");
+    $stmt->execute([$user_id, $score, $question_count, $time_spent, $payloadHash]);
     $quizId = $pdo->lastInsertId();
+    $pdo->commit();
 
     // Luăm created_at pentru feedback, dar nu este obligatoriu
     $stmt2 = $pdo->prepare("SELECT created_at FROM quizzes WHERE id = ?");
@@ -52,6 +56,9 @@ try {
         'created_at' => $row['created_at'] ?? null,
     ]);
 } catch (PDOException $e) {
+    if ($pdo->inTransaction()) {
+        $pdo->rollBack();
+    }
     http_response_code(500);
     echo json_encode(["error" => "DB error: " . $e->getMessage()]);
 }
@@ -12,75 +12,131 @@ try {
     // Setăm fetch mode implicit la array asociativ
     $pdo->setAttribute(PDO::ATTR_DEFAULT_FETCH_MODE, PDO::FETCH_ASSOC);
 
-    // --- CREARE TABELE AUTOMATĂ (dacă nu există) ---
+    // Rezultatele sunt scrise de backend (WAL); așteptăm scriitorul în loc de "database is locked"
+    $pdo->exec("PRAGMA busy_timeout = 5000");
 
-    // 1. Tabel UTILIZATORI
-    $pdo->exec("CREATE TABLE IF NOT EXISTS users (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        username TEXT NOT NULL UNIQUE,
-        password TEXT NOT NULL,
-        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-    )");
+    // Schema se creează o singură dată per bază: după creare user_version = 1
+    // (backend-ul, app/results_store.py, o setează la 1 sau mai mult după propriile migrări)
+    if ((int)$pdo->query("PRAGMA user_version")->fetchColumn() < 1) {
+        // --- CREARE TABELE AUTOMATĂ (dacă nu există) ---
 
-    // 2. Tabel REZULTATE
-    $pdo->exec("CREATE TABLE IF NOT EXISTS results (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        user_id INTEGER NOT NULL,
-        topic TEXT NOT NULL,          -- ex: 'nash', 'minmax', 'csp'
-        score INTEGER NOT NULL,       -- ex: 100, 85, 0
-        feedback TEXT,                -- feedback-ul scurt de la AI
-        payload TEXT,                 -- JSON cu payload-ul complet al testului (pentru reluare)
-        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (user_id) REFERENCES users(id)
-    )");
+        // 1. Tabel UTILIZATORI
+        $pdo->exec("CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL UNIQUE,
+            password TEXT NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )");
 
-    // Migrare simplă: adăugăm coloana payload dacă tabela results există deja fără ea
-    try {
-        $cols = $pdo->query("PRAGMA table_info(results)")->fetchAll();
-        $hasPayload = false;
-        foreach ($cols as $col) {
-            if (isset($col['name']) && $col['name'] === 'payload') {
-                $hasPayload = true;
-                break;
+        // 2. Tabel REZULTATE
+        $pdo->exec("CREATE TABLE IF NOT EXISTS results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            topic TEXT NOT NULL,          -- ex: 'nash', 'minmax', 'csp'
+            score INTEGER NOT NULL,       -- ex: 100, 85, 0
+            feedback TEXT,                -- feedback-ul scurt de la AI
+            payload TEXT,                 -- JSON cu payload-ul complet al testului (pentru reluare)
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )");
+
+        // Migrare simplă: adăugăm coloana payload dacă tabela results există deja fără ea
+        try {
+            $cols = $pdo->query("PRAGMA table_info(results)")->fetchAll();
+            $hasPayload = false;
+            foreach ($cols as $col) {
+                if (isset($col['name']) && $col['name'] === 'payload') {
+                    $hasPayload = true;
+                    break;
+                }
             }
+            if (!$hasPayload) {
+                $pdo->exec("ALTER TABLE results ADD COLUMN payload TEXT");
+            }
+        } catch (PDOException $e) {
+            // Ignorăm erorile de migrare, aplicația va continua să funcționeze
         }
-        if (!$hasPayload) {
-            $pdo->exec("ALTER TABLE results ADD COLUMN payload TEXT");
-        }
-    } catch (PDOException $e) {
-        // Ignorăm erorile de migrare, aplicația va continua să funcționeze
-    }
 
-    // 3. Tabel QUIZZES (pentru quiz-uri complete, nu doar întrebări individuale)
-    $pdo->exec("CREATE TABLE IF NOT EXISTS quizzes (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        user_id INTEGER NOT NULL,
-        score REAL NOT NULL,          -- scorul mediu al quiz-ului
-        question_count INTEGER NOT NULL,
-        time_spent INTEGER DEFAULT 0, -- timpul petrecut în secunde
-        payload TEXT NOT NULL,        -- JSON cu întreaga configurație și întrebările quiz-ului
-        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (user_id) REFERENCES users(id)
-    )");
+        // 3. Tabel QUIZZES (pentru quiz-uri complete, nu doar întrebări individuale)
+        $pdo->exec("CREATE TABLE IF NOT EXISTS quizzes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            score REAL NOT NULL,          -- scorul mediu al quiz-ului
+            question_count INTEGER NOT NULL,
+            time_spent INTEGER DEFAULT 0, -- timpul petrecut în secunde
+            payload TEXT NOT NULL,        -- JSON cu întreaga configurație și întrebările quiz-ului
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )");
 
-    // Migrare: adăugăm coloana time_spent dacă nu există
-    try {
-        $cols = $pdo->query("PRAGMA table_info(quizzes)")->fetchAll();
-        $hasTimeSpent = false;
-        foreach ($cols as $col) {
-            if (isset($col['name']) && $col['name'] === 'time_spent') {
-                $hasTimeSpent = true;
-                break;
+        // Migrare: adăugăm coloana time_spent dacă nu există
+        try {
+            $cols = $pdo->query("PRAGMA table_info(quizzes)")->fetchAll();
+            $hasTimeSpent = false;
+            foreach ($cols as $col) {
+                if (isset($col['name']) && $col['name'] === 'time_spent') {
+                    $hasTimeSpent = true;
+                    break;
+                }
             }
+            if (!$hasTimeSpent) {
+                $pdo->exec("ALTER TABLE quizzes ADD COLUMN time_spent INTEGER DEFAULT 0");
+            }
+        } catch (PDOException $e) {
+            // Ignorăm erorile de migrare
         }
-        if (!$hasTimeSpent) {
-            $pdo->exec("ALTER TABLE quizzes ADD COLUMN time_spent INTEGER DEFAULT 0");
+
+        // 4. Payload-uri comprimate (zlib) și deduplicate, adresate după SHA-256 al JSON-ului
+        //    (schema 3 din backend; rândurile noi păstrează doar payload_hash)
+        $pdo->exec("CREATE TABLE IF NOT EXISTS questions (
+            hash TEXT PRIMARY KEY,
+            data BLOB NOT NULL,
+            raw_size INTEGER NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )");
+        foreach (['results', 'quizzes'] as $table) {
+            $names = array_column($pdo->query("PRAGMA table_info($table)")->fetchAll(), 'name');
+            if (!in_array('payload_hash', $names, true)) {
+                $pdo->exec("ALTER TABLE $table ADD COLUMN payload_hash TEXT");
+            }
         }
-    } catch (PDOException $e) {
-        // Ignorăm erorile de migrare
+
+        // 5. Indexuri pentru istoricul per utilizator
+        $pdo->exec("CREATE INDEX IF NOT EXISTS idx_results_user_created ON results(user_id, created_at)");
+        $pdo->exec("CREATE INDEX IF NOT EXISTS idx_quizzes_user_created ON quizzes(user_id, created_at)");
+
+        $pdo->exec("PRAGMA user_version = 1");
     }
 
 } catch (PDOException $e) {
     die("Eroare la conectarea cu baza de date: " . $e->getMessage());
 }
+
+// Salvează JSON-ul în questions (o singură copie per conținut) și returnează hash-ul
+function store_payload($pdo, $json) {
+    $hash = hash('sha256', $json);
+    $stmt = $pdo->prepare("INSERT OR IGNORE INTO questions (hash, data, raw_size) VALUES (?, ?, ?)");
+    $stmt->bindValue(1, $hash);
+    $stmt->bindValue(2, gzcompress($json, 6), PDO::PARAM_LOB);
+    $stmt->bindValue(3, strlen($json), PDO::PARAM_INT);
+    $stmt->execute();
+    return $hash;
+}
+
+// Payload-ul unui rând din results/quizzes: din questions (comprimat) sau din coloana inline (rânduri vechi)
+function load_payload($pdo, $payload, $payload_hash) {
+    if (!empty($payload_hash)) {
+        $stmt = $pdo->prepare("SELECT data FROM questions WHERE hash = ?");
+        $stmt->execute([$payload_hash]);
+        $data = $stmt->fetchColumn();
+        if ($data !== false) {
+            $payload = gzuncompress($data);
+        }
+    }
+    if (empty($payload)) {
+        return null;
+    }
+    $decoded = json_decode($payload, true);
+    return json_last_error() === JSON_ERROR_NONE ? $decoded : null;
+}
 ?>
\ No newline at end of file
@@ -11,17 +11,41 @@ if (!isset($_SESSION['user_id'])) {
 $user_id = $_SESSION['user_id'];
 $username = $_SESSION['username'];
 
-// --- 1. Statistici Generale ---
-$stmt = $pdo->prepare("SELECT COUNT(*) as total_tests, AVG(score) as global_avg FROM results WHERE user_id = ?");
-$stmt->execute([$user_id]);
-$general_stats = $stmt->fetch();
-$total_tests = $general_stats['total_tests'] ?? 0;
-$global_avg = round($general_stats['global_avg'] ?? 0, 1);
+// --- 1-2. Statistici generale și pe categorii ---
+// Backend-ul le citește din agregatele incrementale (O(capitole)); dacă nu răspunde, le calculăm aici
+$total_tests = 0;
+$global_avg = 0;
+$topic_stats = null;
+
+$ch = curl_init("http://127.0.0.1:8000/stats/" . intval($user_id));
+curl_setopt($ch, CURLOPT_RETURNTRANSFER, true);
+curl_setopt($ch, CURLOPT_TIMEOUT, 2);
+// ruta e internă: fără secret backend-ul răspunde 403 și folosim calculul SQL de mai jos
+curl_setopt($ch, CURLOPT_HTTPHEADER, ['X-SmarTest-Internal: ' . (getenv('SMARTEST_INTERNAL_SECRET') ?: '')]);
+$response = curl_exec($ch);
+$httpCode = curl_getinfo($ch, CURLINFO_HTTP_CODE);
+curl_close($ch);
+
+if ($httpCode === 200 && $response) {
+    $stats = json_decode($response, true);
+    if (is_array($stats) && isset($stats['topics'])) {
+        $total_tests = $stats['count'];
+        $global_avg = round($stats['avg_score'] ?? 0, 1);
+        $topic_stats = $stats['topics'];
+    }
+}
 
-// --- 2. Statistici pe Categorii ---
-$stmt = $pdo->prepare("SELECT topic, AVG(score) as avg_score, COUNT(*) as count FROM results WHERE user_id = ? GROUP BY topic");
-$stmt->execute([$user_id]);
-$topic_stats = $stmt->fetchAll();
+if ($topic_stats === null) {
+    $stmt = $pdo->prepare("SELECT COUNT(*) as total_tests, AVG(score) as global_avg FROM results WHERE user_id = ?");
+    $stmt->execute([$user_id]);
+    $general_stats = $stmt->fetch();
+    $total_tests = $general_stats['total_tests'] ?? 0;
+    $global_avg = round($general_stats['global_avg'] ?? 0, 1);
+
+    $stmt = $pdo->prepare("SELECT topic, AVG(score) as avg_score, COUNT(*) as count FROM results WHERE user_id = ? GROUP BY topic");
+    $stmt->execute([$user_id]);
+    $topic_stats = $stmt->fetchAll();
+}
 
 $chart_labels = [];
 $chart_data = [];